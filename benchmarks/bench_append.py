@@ -0,0 +1,70 @@
+"""
+Insert time of timestamp ordered feeds, append path against root descent
+
+Run with: python -m benchmarks.bench_append [--size N] [--jitter P]
+"""
+import argparse
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+
+
+def timestamps(size, jitter, seed):
+    """
+    Increasing timestamps where a fraction jitter of them arrives late.
+    """
+    rng = random.Random(seed)
+    now = 1_700_000_000.0
+    feed = []
+    for _ in range(size):
+        now += rng.expovariate(1000)
+        late = rng.random() < jitter
+        feed.append(now - rng.uniform(0, 1) if late else now)
+    return feed
+
+
+def insert_appending(tree_class, feed):
+    tree = tree_class()
+    for key in feed:
+        tree.insert_element(key)
+    return tree
+
+
+def insert_descending(tree_class, feed):
+    # the insertion every key took before the append path existed
+    tree = tree_class()
+    tree.insert_element(feed[0])
+    for key in feed[1:]:
+        node = tree._root.insert(key)
+        if tree_class is AVL:
+            if node is not None and node._parent is None:
+                tree._root = node
+        else:
+            tree._root = tree._find_new_root()
+    return tree
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def run(size, jitter, seed=0):
+    feed = timestamps(size, jitter, seed)
+    print(f"{'structure':<14}{'descend':>10}{'append':>10}{'speedup':>9}")
+    for tree_class in (AVL, RedBlackTree):
+        slow = measure(insert_descending, tree_class, feed)
+        fast = measure(insert_appending, tree_class, feed)
+        print(f"{tree_class.__name__:<14}{slow:>9.3f}s{fast:>9.3f}s"
+              f"{slow / fast:>8.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200000)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.jitter, arguments.seed)
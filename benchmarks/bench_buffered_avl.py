@@ -0,0 +1,41 @@
+"""
+Burst insert time of AVL against BufferedAVL, with reads between bursts
+
+Run with: python -m benchmarks.bench_buffered_avl [--size N] [--bursts B]
+"""
+import argparse
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.buffered_avl import BufferedAVL
+
+
+def run(size, bursts, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(size * 50), size)
+    probes = [rng.randrange(size * 50) for _ in range(size // 10)]
+    burst = -(-size // bursts)
+    print(f"{'structure':<13}{'inserts':>10}{'finds':>10}")
+    for name, tree, insert in (("AVL", AVL(), AVL.insert_element),
+                               ("BufferedAVL", BufferedAVL(),
+                                BufferedAVL.insert)):
+        insert_time = find_time = 0.0
+        for start in range(0, size, burst):
+            begin = time.perf_counter()
+            for key in keys[start:start + burst]:
+                insert(tree, key)
+            middle = time.perf_counter()
+            for key in probes:
+                tree.find(key)
+            insert_time += middle - begin
+            find_time += time.perf_counter() - middle
+        print(f"{name:<13}{insert_time:>9.3f}s{find_time:>9.3f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200000)
+    parser.add_argument("--bursts", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.bursts, arguments.seed)
@@ -0,0 +1,56 @@
+"""
+Copy time of trees and lists, copy() against copy.deepcopy
+
+Run with: python -m benchmarks.bench_copy [--size N]
+"""
+import argparse
+import copy
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.linked_list import LinkedList
+from datastructures.red_black_tree import RedBlackTree
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def build(size, seed):
+    keys = random.Random(seed).sample(range(size * 10), size)
+    structures = {
+        "AVL": AVL.from_sorted(sorted(keys)),
+        "RedBlackTree": RedBlackTree.from_sorted(sorted(keys)),
+        "BinarySearchTree": BinarySearchTree(),
+        "LinkedList": LinkedList(),
+        "DoublyLinkedList": DoublyLinkedList(),
+    }
+    for key in keys:
+        structures["BinarySearchTree"].insert(key)
+    for key in sorted(keys, reverse=True):
+        structures["LinkedList"].push_front(key)
+        structures["DoublyLinkedList"].push_front(key)
+    return structures
+
+
+def run(size, seed=0):
+    print(f"{'structure':<18}{'copy()':>10}{'deepcopy':>10}")
+    for name, structure in build(size, seed).items():
+        fast = measure(structure.copy)
+        try:
+            slow = f"{measure(copy.deepcopy, structure):>9.3f}s"
+        except RecursionError:  # deepcopy recurses once per node
+            slow = f"{'failed':>10}"
+        print(f"{name:<18}{fast:>9.3f}s{slow}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.seed)
@@ -0,0 +1,122 @@
+"""
+Garbage collector pauses caused by large trees, with and without gc.freeze
+
+Run with: python -m benchmarks.bench_gc [--size N]
+
+The cyclic collector runs when the number of live container objects
+grows, and a full collection visits every tracked object, so a large tree
+makes each one expensive. For every tree class this reports
+- build: collector pauses (total / longest / number of full collections)
+  while inserting size keys one by one,
+- full: one gc.collect() with the tree alive, before and after gc.freeze()
+  moved it to the permanent generation,
+- grow: pauses while inserting size / 2 more keys, with the tree not
+  frozen and frozen,
+- drop: releasing the tree by dropping the last reference and running
+  gc.collect(), against calling clear() first, with the number of
+  unreachable objects the collector had to find.
+"""
+import argparse
+import gc
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.scapegoat_tree import ScapegoatTree
+
+
+class PauseRecorder():
+    """
+    Sums up collector pauses through gc.callbacks.
+    """
+    def __init__(self):
+        self.total = 0.0
+        self.longest = 0.0
+        self.full = 0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            self.full += info["generation"] == 2
+        elif self._start is not None:
+            pause = time.perf_counter() - self._start
+            self.total += pause
+            self.longest = max(self.longest, pause)
+            self._start = None
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self)
+
+    def __str__(self):
+        return f"{self.total:.3f}s/{self.longest:.3f}s/{self.full}"
+
+
+def insert_all(tree, keys):
+    insert = getattr(tree, "insert_element", tree.insert)
+    for key in keys:
+        insert(key)
+
+
+def timed_collect():
+    start = time.perf_counter()
+    gc.collect()
+    return time.perf_counter() - start
+
+
+def measure_drop(tree_class, keys, clear):
+    tree = tree_class()
+    insert_all(tree, keys)
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    if clear:
+        tree.clear()
+    del tree
+    found = gc.collect()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return f"{elapsed:.3f}s/{found}"
+
+
+def run(size, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(size * 10), size * 3 // 2)
+    initial, more = keys[:size], keys[size:]
+    print(f"{'tree':<14}{'build':>22}{'full':>8}{'frozen':>8}"
+          f"{'grow':>22}{'frozen grow':>22}{'drop':>18}{'clear+drop':>18}")
+    for tree_class in (AVL, RedBlackTree, ScapegoatTree):
+        gc.collect()
+        results = []
+        for frozen in (False, True):
+            tree = tree_class()
+            with PauseRecorder() as build:
+                insert_all(tree, initial)
+            full = timed_collect()
+            if frozen:
+                gc.freeze()
+                full = timed_collect()
+            with PauseRecorder() as grow:
+                insert_all(tree, more)
+            results.append((build, full, grow))
+            if frozen:
+                gc.unfreeze()
+            tree.clear()
+        (build, full, grow), (_, frozen_full, frozen_grow) = results
+        drop = measure_drop(tree_class, initial, clear=False)
+        cleared = measure_drop(tree_class, initial, clear=True)
+        print(f"{tree_class.__name__:<14}{str(build):>22}{full:>7.3f}s"
+              f"{frozen_full:>7.3f}s{str(grow):>22}{str(frozen_grow):>22}"
+              f"{drop:>18}{cleared:>18}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=300000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.seed)
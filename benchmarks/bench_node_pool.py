@@ -0,0 +1,45 @@
+"""
+Queue churn of the linked lists with and without a NodePool
+
+Run with: python -m benchmarks.bench_node_pool [--messages N] [--depth D]
+"""
+import argparse
+import time
+from datastructures import doubly_linked_list, linked_list
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.linked_list import LinkedList
+from datastructures.node_pool import NodePool
+
+
+def churn(queue, messages, depth):
+    """
+    Keeps depth messages queued while messages more pass through.
+    """
+    for message in range(depth):
+        queue.push_front(message)
+    for message in range(messages):
+        queue.push_front(message)
+        queue.pop_front()
+
+
+def run(messages, depth):
+    print(f"{'structure':<18}{'pool':>6}{'time':>9}{'nodes':>9}")
+    for list_class, node_class in ((LinkedList, linked_list.Node),
+                                   (DoublyLinkedList, doubly_linked_list.Node)):
+        for pooled in (False, True):
+            pool = NodePool(node_class) if pooled else None
+            queue = list_class(node_pool=pool)
+            start = time.perf_counter()
+            churn(queue, messages, depth)
+            elapsed = time.perf_counter() - start
+            nodes = pool.allocated if pooled else depth + messages
+            print(f"{list_class.__name__:<18}{'yes' if pooled else 'no':>6}"
+                  f"{elapsed:>8.3f}s{nodes:>9}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=1000000)
+    parser.add_argument("--depth", type=int, default=100)
+    arguments = parser.parse_args()
+    run(arguments.messages, arguments.depth)
@@ -0,0 +1,66 @@
+"""
+Throughput comparison of the ordered set implementations
+
+Run with: python -m benchmarks.bench_ordered_sets [--size N]
+"""
+import argparse
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.skip_list import SkipList
+
+STRUCTURES = {
+    "AVL": AVL,
+    "RedBlackTree": RedBlackTree,
+    "SkipList": lambda: SkipList(seed=0),
+}
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def insert_all(structure, keys):
+    for key in keys:
+        structure.insert(key)
+
+
+def find_all(structure, keys):
+    for key in keys:
+        structure.find(key)
+
+
+def delete_all(structure, keys):
+    for key in keys:
+        structure.delete(key)
+
+
+def run(size, seed=0):
+    rng = random.Random(seed)
+    random_keys = rng.sample(range(size * 10), size)
+    sequential_keys = list(range(size))
+    lookups = rng.sample(random_keys, min(size, 10000))
+    print(f"{'structure':<14}{'random ins/s':>16}{'append ins/s':>16}"
+          f"{'find/s':>16}{'delete/s':>16}")
+    for name, factory in STRUCTURES.items():
+        structure = factory()
+        random_time = measure(insert_all, structure, random_keys)
+        find_time = measure(find_all, structure, lookups)
+        delete_time = measure(delete_all, structure, lookups)
+        appended = factory()
+        append_time = measure(insert_all, appended, sequential_keys)
+        print(f"{name:<14}{size / random_time:>16.0f}"
+              f"{size / append_time:>16.0f}"
+              f"{len(lookups) / find_time:>16.0f}"
+              f"{len(lookups) / delete_time:>16.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.seed)
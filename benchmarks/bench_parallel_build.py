@@ -0,0 +1,38 @@
+"""
+Bulk build time of AVL and RedBlackTree, sequential against parallel
+
+Run with: python -m benchmarks.bench_parallel_build [--size N] [--workers W]
+"""
+import argparse
+import os
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.parallel_build import build_parallel
+from datastructures.red_black_tree import RedBlackTree
+
+
+def measure(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(size, workers, seed=0):
+    rng = random.Random(seed)
+    keys = [rng.randrange(size * 10) for _ in range(size)]
+    print(f"{size} keys, {workers} workers")
+    for tree_class in (AVL, RedBlackTree):
+        single = measure(build_parallel, tree_class, keys, workers=1)
+        parallel = measure(build_parallel, tree_class, keys, workers=workers)
+        print(f"{tree_class.__name__:<14}{single:>10.2f}s{parallel:>10.2f}s"
+              f"  speedup {single / parallel:.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.workers, arguments.seed)
@@ -0,0 +1,77 @@
+"""
+Multi-threaded throughput of ShardedOrderedMap against one locked tree
+
+Run with: python -m benchmarks.bench_sharded_map [--operations N]
+
+Threads only run in parallel on an interpreter without the GIL; on a
+regular CPython build the numbers show the locking overhead instead.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.sharded_map import ShardedOrderedMap
+
+
+class LockedMap():
+    """
+    RedBlackTree and value dict behind a single lock, the baseline.
+    """
+    def __init__(self):
+        self._tree = RedBlackTree()
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def put(self, key, value):
+        with self._lock:
+            if key not in self._values:
+                self._tree.insert_element(key)
+            self._values[key] = value
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._values.get(key, default)
+
+
+def worker(ordered_map, operations, seed):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        key = rng.randrange(1 << 20)
+        if rng.random() < 0.5:
+            ordered_map.put(key, seed)
+        else:
+            ordered_map.get(key)
+
+
+def measure(factory, threads, operations):
+    ordered_map = factory()
+    workers = [threading.Thread(target=worker,
+                                args=(ordered_map, operations // threads, i))
+               for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return operations / (time.perf_counter() - start)
+
+
+def run(operations, max_threads):
+    print(f"{os.cpu_count()} CPUs")
+    print(f"{'threads':>7}{'locked ops/s':>14}{'sharded ops/s':>15}")
+    threads = 1
+    while threads <= max_threads:
+        locked = measure(LockedMap, threads, operations)
+        sharded = measure(ShardedOrderedMap, threads, operations)
+        print(f"{threads:>7}{locked:>14.0f}{sharded:>15.0f}")
+        threads *= 2
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    arguments = parser.parse_args()
+    run(arguments.operations, arguments.threads)
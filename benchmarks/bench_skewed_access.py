@@ -0,0 +1,53 @@
+"""
+Lookup throughput on Zipf distributed (skewed) access patterns
+
+Run with: python -m benchmarks.bench_skewed_access [--size N] [--skew S]
+"""
+import argparse
+import random
+import time
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.splay_tree import SplayTree
+
+
+def zipf_lookups(keys, skew, count, rng):
+    """
+    Draws count keys where the i-th most popular key has weight 1 / i^skew.
+    """
+    popularity = list(keys)
+    rng.shuffle(popularity)
+    weights = [1 / rank ** skew for rank in range(1, len(popularity) + 1)]
+    return rng.choices(popularity, weights=weights, k=count)
+
+
+def build(factory, keys):
+    structure = factory()
+    for key in keys:
+        structure.insert(key)
+    return structure
+
+
+def run(size, skew, lookups, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(size * 10), size)
+    queries = zipf_lookups(keys, skew, lookups, rng)
+    print(f"{size} keys, {lookups} lookups, zipf skew {skew}")
+    for name, factory in (("AVL", AVL), ("RedBlackTree", RedBlackTree),
+                          ("SplayTree", SplayTree)):
+        structure = build(factory, keys)
+        start = time.perf_counter()
+        for key in queries:
+            structure.find(key)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<14}{lookups / elapsed:>14.0f} finds/s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--skew", type=float, default=1.2)
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.skew, arguments.lookups, arguments.seed)
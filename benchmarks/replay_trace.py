@@ -0,0 +1,44 @@
+"""
+Replay of a recorded workload trace against every structure
+
+Traces are written by datastructures.workload_trace.TraceRecorder.
+
+Run with: python -m benchmarks.replay_trace TRACE [--structures NAME ...]
+"""
+import argparse
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.linked_list import LinkedList
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.workload_trace import read_trace, replay
+
+STRUCTURES = {
+    "AVL": AVL,
+    "RedBlackTree": RedBlackTree,
+    "BinarySearchTree": BinarySearchTree,
+    "LinkedList": LinkedList,
+    "DoublyLinkedList": DoublyLinkedList,
+}
+
+
+def run(path, names):
+    records = read_trace(path)
+    print(f"{len(records)} operations from {path}")
+    print(f"{'structure':<18}{'ops/s':>12}{'p50 us':>9}{'p99 us':>9}"
+          f"{'p99.9 us':>10}{'max us':>9}{'peak KiB':>10}")
+    for name in names:
+        report = replay(records, STRUCTURES[name])
+        print(f"{name:<18}{report['throughput']:>12.0f}"
+              f"{report['p50'] * 1e6:>9.1f}{report['p99'] * 1e6:>9.1f}"
+              f"{report['p999'] * 1e6:>10.1f}{report['max'] * 1e6:>9.1f}"
+              f"{report['peak_memory'] / 1024:>10.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("trace")
+    parser.add_argument("--structures", nargs="+", choices=list(STRUCTURES),
+                        default=list(STRUCTURES))
+    arguments = parser.parse_args()
+    run(arguments.trace, arguments.structures)
@@ -0,0 +1,116 @@
+"""
+Implementation of ordered set which adapts its representation to the workload
+"""
+from __future__ import annotations
+from datastructures.avl_tree import AVL
+from datastructures.frozen_index import FrozenIndex
+from datastructures.red_black_tree import RedBlackTree
+
+WRITE_HEAVY, READ_HEAVY, READ_ONLY = "red_black", "avl", "frozen"
+
+
+class AdaptiveOrderedSet():
+    """
+    Ordered set which counts its reads and writes and moves its keys between
+    three representations:
+
+    - RedBlackTree while writes are frequent (fewer rotations per update),
+    - AVL when at most read_heavy_ratio of the operations are writes
+      (shallower tree, shorter searches),
+    - FrozenIndex when a whole sample passes without a write.
+
+    The decision is taken at the end of every sample, which is at least
+    sample_size operations and at least as long as the set, so the O(n)
+    cost of a migration is spread over n operations. A write to a frozen
+    set thaws it into a RedBlackTree right away.
+    """
+    def __init__(self, keys=(), sample_size=1024, read_heavy_ratio=0.1):
+        if sample_size < 1:
+            raise ValueError("sample_size must be positive")
+        if not 0 <= read_heavy_ratio <= 1:
+            raise ValueError("read_heavy_ratio must be between 0 and 1")
+        self._sample_size = sample_size
+        self._read_heavy_ratio = read_heavy_ratio
+        keys = sorted(set(keys))
+        self._store = RedBlackTree.from_sorted(keys)
+        self._mode = WRITE_HEAVY
+        self._size = len(keys)
+        self._reads = 0
+        self._writes = 0
+        self.migrations = {WRITE_HEAVY: 0, READ_HEAVY: 0, READ_ONLY: 0}
+
+    @property
+    def mode(self):
+        return self._mode
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def __iter__(self):
+        return self.keys()
+
+    def empty(self):
+        return self._size == 0
+
+    def keys(self, reverse=False):
+        if self._mode == READ_ONLY:
+            keys = list(self._store)
+            return reversed(keys) if reverse else iter(keys)
+        return self._store.keys(reverse)
+
+    def min(self):
+        return self._store.min()
+
+    def max(self):
+        return self._store.max()
+
+    def find(self, key) -> bool:
+        self._reads += 1
+        self._sample()
+        return self._store.find(key)
+
+    def insert(self, key) -> bool:
+        self._writes += 1
+        if self._mode == READ_ONLY:
+            self._migrate(WRITE_HEAVY)
+        inserted = self._store.insert_element(key)
+        self._size += inserted
+        self._sample()
+        return inserted
+
+    def delete(self, key) -> bool:
+        self._writes += 1
+        if self._mode == READ_ONLY:
+            self._migrate(WRITE_HEAVY)
+        deleted = self._store.delete(key)
+        self._size -= deleted
+        self._sample()
+        return deleted
+
+    def _sample(self):
+        operations = self._reads + self._writes
+        if operations < max(self._sample_size, self._size):
+            return
+        if self._writes == 0:
+            mode = READ_ONLY
+        elif self._writes <= self._read_heavy_ratio * operations:
+            mode = READ_HEAVY
+        else:
+            mode = WRITE_HEAVY
+        self._reads = self._writes = 0
+        if mode != self._mode:
+            self._migrate(mode)
+
+    def _migrate(self, mode):
+        keys = self.keys()
+        if mode == READ_ONLY:
+            self._store = FrozenIndex.from_sorted(keys)
+        elif mode == READ_HEAVY:
+            self._store = AVL.from_sorted(keys)
+        else:
+            self._store = RedBlackTree.from_sorted(keys)
+        self._mode = mode
+        self.migrations[mode] += 1
@@ -0,0 +1,154 @@
+"""
+Implementation of red black tree augmented with a monoid aggregate
+"""
+from __future__ import annotations
+from datastructures.red_black_tree import Node, RedBlackTree
+
+
+class Monoid():
+    """
+    Associative combine(a, b) with an identity element. measure maps a key
+    to the value which is aggregated, e.g. lambda key: key[1] for
+    (key, value) pairs; by default the key itself. combine does not need
+    to be commutative, values are always combined in key order.
+    """
+    def __init__(self, combine, identity, measure=None):
+        self.combine = combine
+        self.identity = identity
+        self.measure = measure if measure is not None else (lambda key: key)
+
+
+class AggregateNode(Node):
+    """
+    Red black tree node which also keeps the aggregate of all values in
+    its subtree.
+    """
+    _augmented = True
+    _monoid = None
+
+    def __init__(self, key):
+        super().__init__(key)
+        self._aggregate = self._monoid.measure(key)
+
+    def _update_augmentation(self):
+        monoid = self._monoid
+        aggregate = monoid.measure(self._key)
+        if self._left:
+            aggregate = monoid.combine(self._left._aggregate, aggregate)
+        if self._right:
+            aggregate = monoid.combine(aggregate, self._right._aggregate)
+        self._aggregate = aggregate
+
+
+class AggregateTree(RedBlackTree):
+    """
+    Red black tree whose nodes keep a monoid aggregate of their subtree,
+    maintained through rotations and deletions by the augmentation hook of
+    the nodes. aggregate(low, high) combines the values of a key range in
+    O(log n) by reusing the aggregates of the subtrees which lie entirely
+    inside the range.
+
+    The monoid is bound to a subclass, so from_sorted, copy and the async
+    loaders build trees of the same kind:
+
+        SumTree = AggregateTree.with_monoid(Monoid(operator.add, 0))
+        tree = SumTree()
+    """
+    _node_class = AggregateNode
+    _classes = {}
+
+    @classmethod
+    def with_monoid(cls, monoid):
+        """
+        Returns the subclass of this tree class aggregating with monoid.
+        """
+        key = (cls, monoid)
+        if key not in AggregateTree._classes:
+            node_class = type(cls._node_class.__name__, (cls._node_class,),
+                              {"_monoid": monoid})
+            AggregateTree._classes[key] = type(
+                cls.__name__, (cls,), {"_node_class": node_class})
+        return AggregateTree._classes[key]
+
+    def __init__(self, membership_filter=None):
+        if self._node_class._monoid is None:
+            raise TypeError("create the tree class with "
+                            "AggregateTree.with_monoid(monoid)")
+        super().__init__(membership_filter)
+
+    @property
+    def monoid(self):
+        return self._node_class._monoid
+
+    def total(self):
+        """
+        Returns the aggregate of all keys.
+        """
+        return self._root._aggregate if self._root else self.monoid.identity
+
+    def aggregate(self, low=None, high=None):
+        """
+        Returns the aggregate of the keys k with low <= k <= high. Either
+        bound may be None to leave that side open.
+        """
+        return self._fold(self._root, low, high)
+
+    def _fold(self, node, low, high):
+        monoid = self.monoid
+        # descend until the first node inside the range
+        while node:
+            if low is not None and node._key < low:
+                node = node._right
+            elif high is not None and node._key > high:
+                node = node._left
+            else:
+                break
+        if node is None:
+            return monoid.identity
+        # node is inside the range, the rest splits into two one-sided folds
+        aggregate = monoid.measure(node._key)
+        if node._left:
+            aggregate = monoid.combine(self._fold_from(node._left, low),
+                                       aggregate)
+        if node._right:
+            aggregate = monoid.combine(aggregate,
+                                       self._fold_to(node._right, high))
+        return aggregate
+
+    def _fold_from(self, node, low):
+        """
+        Aggregate of the keys >= low in the subtree of node.
+        """
+        monoid = self.monoid
+        if low is None:
+            return node._aggregate
+        suffix = monoid.identity
+        while node:
+            if node._key < low:
+                node = node._right
+                continue
+            value = monoid.measure(node._key)
+            if node._right:
+                value = monoid.combine(value, node._right._aggregate)
+            suffix = monoid.combine(value, suffix)
+            node = node._left
+        return suffix
+
+    def _fold_to(self, node, high):
+        """
+        Aggregate of the keys <= high in the subtree of node.
+        """
+        monoid = self.monoid
+        if high is None:
+            return node._aggregate
+        prefix = monoid.identity
+        while node:
+            if node._key > high:
+                node = node._left
+                continue
+            value = monoid.measure(node._key)
+            if node._left:
+                value = monoid.combine(node._left._aggregate, value)
+            prefix = monoid.combine(prefix, value)
+            node = node._right
+        return prefix
@@ -0,0 +1,68 @@
+"""
+Cooperative asyncio ingestion of large key sets into AVL and RedBlackTree
+"""
+import asyncio
+import time
+from datastructures.parallel_build import _sorted_run
+
+
+async def _aiter(items):
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def insert_async(tree, items, batch_size=1024, time_slice=0.005):
+    """
+    Inserts every key of the iterable or async iterable items into tree and
+    returns the number of keys which were not in it yet. Control goes back
+    to the event loop after batch_size keys or time_slice seconds,
+    whichever comes first, so other tasks keep running during the load.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    clock = time.perf_counter
+    inserted = batch = 0
+    deadline = clock() + time_slice
+    async for item in _aiter(items):
+        inserted += tree.insert_element(item)
+        batch += 1
+        if batch >= batch_size or clock() >= deadline:
+            await asyncio.sleep(0)
+            batch = 0
+            deadline = clock() + time_slice
+    return inserted
+
+
+def _build(tree, keys):
+    new_tree = tree.__class__.from_sorted(keys)
+    if tree._filter is not None:
+        new_tree._filter = tree._filter.copy()
+        for key in keys:
+            new_tree._filter.add(key)
+    return new_tree
+
+
+async def load_async(tree, keys, executor=None):
+    """
+    Bulk loads keys into the empty tree without blocking the event loop.
+    Keys are sorted and deduplicated in executor (a thread or process pool,
+    the loop's default thread pool if None) and the balanced tree is built
+    with from_sorted in the default thread pool. The finished tree then
+    replaces the contents of tree in one step, so concurrent readers see
+    either the empty tree or the loaded one.
+
+    Keys inserted into tree while the build runs are carried over; deletes
+    made meanwhile only affect those keys.
+    """
+    if not tree.empty():
+        raise ValueError("load_async requires an empty tree")
+    loop = asyncio.get_running_loop()
+    keys = await loop.run_in_executor(executor, _sorted_run, list(keys))
+    new_tree = await loop.run_in_executor(None, _build, tree, keys)
+    for key in tree.keys():
+        new_tree.insert_element(key)
+    tree.__dict__.update(new_tree.__dict__)
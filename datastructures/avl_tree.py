@@ -1,10 +1,21 @@
 """
 Implementation of AVL tree
 """
+from __future__ import annotations
+import copy
 from collections.abc import Iterable
+from datastructures import async_ingest
+from datastructures.frozen_index import FrozenIndex
+from datastructures.tree_traversal import (before, clone_subtree,
+                                           inorder_nodes, lower_bound,
+                                           nearest_nodes, range_nodes,
+                                           unlink_subtree, upper_bound)
 
 
 class Node:
+    # augmented node classes set this and override _update_augmentation
+    _augmented = False
+
     def __init__(self, key):
         self._key = key
         self._left = None
@@ -15,13 +26,13 @@ class Node:
     def __str__(self):
         return f"{self._key} [{self._height}]"
 
-    def left_rotation(self):
+    def left_rotation(self, retrace=True):
         new_root = self._right
         new_root._parent = self._parent
         self._parent = new_root
         if new_root._left:
             self._right = new_root._left
-            new_root._left._parent = self._right
+            new_root._left._parent = self
         else:
             self._right = None
         new_root._left = self
@@ -30,7 +41,11 @@ class Node:
                 new_root._parent._left = new_root
             if new_root._parent._right is self:
                 new_root._parent._right = new_root
-        self.recalculate_height_up()
+        if retrace:
+            self.recalculate_height_up()
+        else:  # caller takes care of the nodes above
+            self._update_height()
+            new_root._update_height()
         return new_root
 
     def right_rotation(self):
@@ -38,7 +53,7 @@ class Node:
         new_root._parent, self._parent = self._parent, new_root
         if new_root._right:
             self._left = new_root._right
-            new_root._right._parent = self._left
+            new_root._right._parent = self
         else:
             self._left = None
         new_root._right = self
@@ -60,11 +75,34 @@ class Node:
         self._right = new_root
         return self.left_rotation()
 
+    def _update_augmentation(self):
+        """
+        Recomputes data kept about the subtree from the node's own key and
+        its children. Plain nodes keep no such data.
+        """
+        pass
+
+    def _update_height(self):
+        self._height = max(child._height if child else -1
+                           for child in (self._left, self._right)) + 1
+        if self._augmented:
+            self._update_augmentation()
+
+    def _update_path(self):
+        """
+        Recomputes the augmentation of the node and all of its ancestors.
+        """
+        if not self._augmented:
+            return
+        node = self
+        while node:
+            node._update_augmentation()
+            node = node._parent
+
     def recalculate_height_up(self):
         node = self
         while node:
-            node._height = max([child._height if child else -1 for child in
-                               [node._left, node._right]]) + 1
+            node._update_height()
             node = node._parent
 
     def get_balance(self):
@@ -100,7 +138,7 @@ class Node:
             return None
         elif key < self._key:
             if not self._left:
-                new_node = Node(key)
+                new_node = self.__class__(key)
                 new_node._parent = self
                 self._left = new_node
                 new_node.recalculate_height_up()
@@ -109,7 +147,7 @@ class Node:
                 return self._left.insert(key)
         else:  # key > self.key
             if not self._right:
-                new_node = Node(key)
+                new_node = self.__class__(key)
                 new_node._parent = self
                 self._right = new_node
                 new_node.recalculate_height_up()
@@ -118,6 +156,29 @@ class Node:
                 return self._right.insert(key)
         return None
 
+    def append(self, key):
+        """
+        Adds key, which is larger than every key in the tree, as the right
+        child of this node, which has to be the rightmost one. Heights are
+        retraced only while they change and at most one left rotation is
+        needed, so appending a run of increasing keys takes amortized O(1)
+        rebalancing work per key. Returns (new node, highest node touched).
+        Augmentations above that node are left to the caller.
+        """
+        new_node = self.__class__(key)
+        new_node._parent = self
+        self._right = new_node
+        node = self
+        while True:
+            height = node._height
+            node._update_height()
+            if node.get_balance() < -1:
+                # right-right case, the rotation restores the old height
+                return new_node, node.left_rotation(retrace=False)
+            if node._height == height or node._parent is None:
+                return new_node, node
+            node = node._parent
+
     def get_inorder(self):
         output = []
         if self._left:
@@ -231,25 +292,143 @@ class Node:
 
 
 class AVL():
-    def __init__(self):
+    """
+    AVL tree. An optional membership_filter (CountingBloomFilter) is kept in
+    sync with the keys and lets find and `in` return early for keys which
+    are definitely not in the tree.
+    """
+    _node_class = Node
+
+    def __init__(self, membership_filter=None):
         self._root = None
+        # rightmost node, None if unknown
+        self._max_node = None
+        self._filter = membership_filter
+
+    @classmethod
+    def from_sorted(cls, keys) -> AVL:
+        """
+        Builds a perfectly balanced tree in O(n) from keys which are
+        already sorted and unique.
+        """
+        keys = list(keys)
+
+        def build(low, high, parent):
+            if low > high:
+                return None
+            middle = (low + high) // 2
+            node = cls._node_class(keys[middle])
+            node._parent = parent
+            node._left = build(low, middle - 1, node)
+            node._right = build(middle + 1, high, node)
+            node._update_height()
+            return node
+
+        tree = cls()
+        tree._root = build(0, len(keys) - 1, None)
+        return tree
 
     def __contains__(self, data):
         return self.find(data)
 
-    def __iter__(self):
-        if self._root:
-            return iter(self._root.get_key_height_inorder())
-        else:
-            return iter([])
+    def empty(self):
+        return self._root is None
 
-    def insert_element(self, key):
+    def __iter__(self):
+        for node in inorder_nodes(self._root):
+            yield node._key, node._height
+
+    def __reversed__(self):
+        for node in inorder_nodes(self._root, reverse=True):
+            yield node._key, node._height
+
+    def copy(self, deep=False) -> AVL:
+        """
+        Returns a structural copy of the tree built in a single iterative
+        pass. Keys are shared with this tree unless deep is set.
+        """
+        tree = self.__class__()
+        tree._root = clone_subtree(
+            self._root, copy.deepcopy if deep else None)
+        if self._filter is not None:
+            tree._filter = self._filter.copy()
+        return tree
+
+    def keys(self, reverse=False):
+        """
+        Yields the keys in ascending (or descending) order using O(1)
+        auxiliary memory.
+        """
+        for node in inorder_nodes(self._root, reverse):
+            yield node._key
+
+    def range(self, low=None, high=None):
+        """
+        Yields keys k with low <= k <= high in ascending order. Either bound
+        may be None to leave that side open.
+        """
+        for node in range_nodes(self._root, low, high):
+            yield node._key
+
+    def floor(self, key):
+        """
+        Returns the largest key <= key or None.
+        """
+        node = before(self._root, upper_bound(self._root, key))
+        return node._key if node else None
+
+    def ceiling(self, key):
+        """
+        Returns the smallest key >= key or None.
+        """
+        node = lower_bound(self._root, key)
+        return node._key if node else None
+
+    def predecessor(self, key):
+        """
+        Returns the largest key < key or None.
+        """
+        node = before(self._root, lower_bound(self._root, key))
+        return node._key if node else None
+
+    def successor(self, key):
+        """
+        Returns the smallest key > key or None.
+        """
+        node = upper_bound(self._root, key)
+        return node._key if node else None
+
+    def nearest(self, key, count=1):
+        """
+        Returns the count keys closest to key, closest first, in
+        O(log n + count). Keys have to support subtraction.
+        """
+        return [node._key for node in
+                nearest_nodes(self._root, key, count)]
+
+    def insert_element(self, key) -> bool:
+        """
+        Inserts key and returns whether it was new. Keys larger than the
+        current maximum, such as timestamps arriving in order, are appended
+        at the rightmost node without descending from the root.
+        """
         if not self._root:
-            self._root = Node(key)
+            self._root = self._max_node = self._node_class(key)
         else:
-            node = self._root.insert(key)
-            if node and node._parent is None:
+            if self._max_node is None:
+                self._max_node = self._root.max()
+            if key > self._max_node._key:
+                self._max_node, node = self._max_node.append(key)
+                node._update_path()
+            else:
+                node = self._root.insert(key)
+                if node is None:  # key already in the tree
+                    return False
+            if node._parent is None:
                 self._root = node
+        if self._filter is not None:
+            self._filter.add(key)
+        return True
 
     def insert(self, items):
         if isinstance(items, Iterable):
@@ -258,6 +437,21 @@ class AVL():
         else:
             self.insert_element(items)
 
+    async def insert_async(self, items, batch_size=1024, time_slice=0.005):
+        """
+        Inserts the keys of an iterable or async iterable, yielding to the
+        event loop between batches. See async_ingest.insert_async.
+        """
+        return await async_ingest.insert_async(
+            self, items, batch_size, time_slice)
+
+    async def load_async(self, keys, executor=None):
+        """
+        Bulk loads keys into the empty tree off the event loop. See
+        async_ingest.load_async.
+        """
+        await async_ingest.load_async(self, keys, executor)
+
     def print_inorder(self):
         if self._root:
             output = self._root.get_inorder()
@@ -274,8 +468,12 @@ class AVL():
     def find(self, key) -> bool:
         if not self._root:
             return False
-        else:
-            return bool(self._root.find(key))
+        if self._filter is not None and not self._filter.might_contain(key):
+            return False
+        found = bool(self._root.find(key))
+        if not found and self._filter is not None:
+            self._filter.false_positives += 1
+        return found
 
     def max(self):
         if self._root:
@@ -289,14 +487,35 @@ class AVL():
         else:
             return None
 
+    def clear(self):
+        """
+        Removes all keys, freeing the nodes without the garbage collector.
+        See unlink_subtree.
+        """
+        unlink_subtree(self._root)
+        self._root = None
+        self._max_node = None
+        if self._filter is not None:
+            self._filter.clear()
+
+    def freeze(self) -> FrozenIndex:
+        return FrozenIndex.from_sorted(
+            node._key for node in inorder_nodes(self._root))
+
     def delete(self, key):
+        # deleting may move keys between nodes, find the maximum again later
+        self._max_node = None
         if self._root:
             if self._root._key == key and self._root.get_child_no() == 0:
                 self._root = None
-                return True
-            new_node = self._root.delete(key)
-            if new_node and new_node.is_root():
-                self._root = new_node
+            else:
+                new_node = self._root.delete(key)
+                if new_node is None:  # key not in the tree
+                    return False
+                if new_node.is_root():
+                    self._root = new_node
+            if self._filter is not None:
+                self._filter.remove(key)
             return True
         else:
             return False
@@ -0,0 +1,525 @@
+"""
+Implementation of disk-resident B+ tree stored in a memory-mapped file
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+
+PAGE_SIZE = 4096
+MIN_CACHE_SIZE = 32
+NO_PAGE = -1
+
+_MAGIC = b"BPTREE01"
+# magic, page size, root page, page count, key count, free list head,
+# key format
+_FILE_HEADER = struct.Struct("<8sIqqqq8s")
+# is leaf, number of keys, next page, previous page
+_PAGE_HEADER = struct.Struct("<BHqq")
+_CHILD = struct.Struct("<q")
+_INITIAL_PAGES = 16
+
+
+class Page():
+    """
+    In-memory image of a single tree page. Leaves keep their keys and the
+    links to neighbouring leaves, internal pages keep separator keys and
+    child page numbers.
+    """
+    def __init__(self, page_no, is_leaf):
+        self._page_no = page_no
+        self._is_leaf = is_leaf
+        self._keys = []
+        self._children = []
+        self._next = NO_PAGE
+        self._prev = NO_PAGE
+        self._dirty = False
+
+    def __str__(self):
+        kind = "leaf" if self._is_leaf else "internal"
+        return f"{self._page_no} [{kind}] {self._keys}"
+
+
+class Pager():
+    """
+    Fixed-size page storage backed by a memory-mapped file with an LRU cache
+    of decoded pages. Dirty pages are written back on eviction and flush.
+    """
+    def __init__(self, path, key_format, page_size, cache_size):
+        if cache_size < MIN_CACHE_SIZE:
+            raise ValueError(f"cache_size must be at least {MIN_CACHE_SIZE}")
+        self._key_struct = struct.Struct("<" + key_format)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+            (magic, self._page_size, self.root, self.page_count, self.size,
+             self._free_head, stored_format) = \
+                _FILE_HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                self._mmap.close()
+                self._file.close()
+                raise ValueError(f"{path} is not a B+ tree file")
+            stored_format = stored_format.rstrip(b"\0").decode()
+            if stored_format != key_format:
+                self._mmap.close()
+                self._file.close()
+                raise ValueError(f"{path} stores keys as '{stored_format}', "
+                                 f"not '{key_format}'")
+        else:
+            self._page_size = page_size
+            self._file.truncate(page_size * _INITIAL_PAGES)
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+            self.root = NO_PAGE
+            self.page_count = 1  # page 0 holds the file header
+            self.size = 0
+            self._free_head = NO_PAGE
+        self._key_format = key_format
+        key_size = self._key_struct.size
+        payload = self._page_size - _PAGE_HEADER.size
+        self.max_leaf_keys = payload // key_size
+        self.max_internal_keys = (payload - _CHILD.size) // \
+            (key_size + _CHILD.size)
+        if self.max_internal_keys < 3:
+            self._mmap.close()
+            self._file.close()
+            raise ValueError("page_size is too small for the key format")
+
+    def check_key(self, key):
+        try:
+            self._key_struct.pack(key)
+        except struct.error as error:
+            raise TypeError(f"key {key!r} does not match key format "
+                            f"'{self._key_format}'") from error
+
+    def get(self, page_no) -> Page:
+        page = self._cache.get(page_no)
+        if page is not None:
+            self.cache_hits += 1
+            self._cache.move_to_end(page_no)
+            return page
+        self.cache_misses += 1
+        page = self._read(page_no)
+        self._cache_put(page)
+        return page
+
+    def allocate(self, is_leaf) -> Page:
+        if self._free_head != NO_PAGE:
+            page_no = self._free_head
+            self._free_head = self.get(page_no)._next
+            self._cache.pop(page_no, None)
+        else:
+            page_no = self.page_count
+            self.page_count += 1
+            self._ensure_capacity(self.page_count)
+        page = Page(page_no, is_leaf)
+        page._dirty = True
+        self._cache_put(page)
+        return page
+
+    def free(self, page):
+        page._keys = []
+        page._children = []
+        page._is_leaf = True
+        page._next = self._free_head
+        page._prev = NO_PAGE
+        self._free_head = page._page_no
+        self.mark_dirty(page)
+
+    def mark_dirty(self, page):
+        page._dirty = True
+        if page._page_no not in self._cache:
+            self._cache_put(page)
+
+    def flush(self):
+        for page in self._cache.values():
+            if page._dirty:
+                self._write(page)
+        _FILE_HEADER.pack_into(self._mmap, 0, _MAGIC, self._page_size,
+                               self.root, self.page_count, self.size,
+                               self._free_head, self._key_format.encode())
+        self._mmap.flush()
+
+    def close(self):
+        self.flush()
+        self._cache.clear()
+        self._mmap.close()
+        self._file.close()
+
+    def _cache_put(self, page):
+        self._cache[page._page_no] = page
+        self._cache.move_to_end(page._page_no)
+        while len(self._cache) > self._cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            if evicted._dirty:
+                self._write(evicted)
+
+    def _ensure_capacity(self, page_count):
+        needed = page_count * self._page_size
+        if needed <= len(self._mmap):
+            return
+        new_size = len(self._mmap)
+        while new_size < needed:
+            new_size *= 2
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(new_size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+    def _read(self, page_no) -> Page:
+        offset = page_no * self._page_size
+        is_leaf, count, next_page, prev_page = \
+            _PAGE_HEADER.unpack_from(self._mmap, offset)
+        page = Page(page_no, bool(is_leaf))
+        page._next, page._prev = next_page, prev_page
+        offset += _PAGE_HEADER.size
+        key_size = self._key_struct.size
+        page._keys = [item[0] for item in self._key_struct.iter_unpack(
+            self._mmap[offset:offset + count * key_size])]
+        if not page._is_leaf:
+            offset += count * key_size
+            page._children = [item[0] for item in _CHILD.iter_unpack(
+                self._mmap[offset:offset + (count + 1) * _CHILD.size])]
+        return page
+
+    def _write(self, page):
+        offset = page._page_no * self._page_size
+        _PAGE_HEADER.pack_into(self._mmap, offset, page._is_leaf,
+                               len(page._keys), page._next, page._prev)
+        offset += _PAGE_HEADER.size
+        data = b"".join(self._key_struct.pack(key) for key in page._keys)
+        if not page._is_leaf:
+            data += b"".join(_CHILD.pack(child) for child in page._children)
+        self._mmap[offset:offset + len(data)] = data
+        page._dirty = False
+
+
+class BPlusTree():
+    """
+    Ordered set of fixed-size keys kept in a B+ tree whose pages live in a
+    memory-mapped file. Only the pages touched by an operation are decoded,
+    and the most recently used ones are kept in an LRU cache, so trees
+    larger than memory need O(log_b n) page reads per lookup. Leaves are
+    linked in both directions which makes iteration and range scans
+    sequential.
+
+    Keys are encoded with a struct format character ('q' for 64-bit signed
+    integers by default, 'd' for floats, '16s' for fixed-size byte strings).
+    """
+    def __init__(self, path, key_format="q", page_size=PAGE_SIZE,
+                 cache_size=256):
+        self._pager = Pager(path, key_format, page_size, cache_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._pager.size
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def __iter__(self):
+        return self.range()
+
+    def empty(self):
+        return self._pager.size == 0
+
+    @property
+    def cache_hits(self):
+        return self._pager.cache_hits
+
+    @property
+    def cache_misses(self):
+        return self._pager.cache_misses
+
+    def flush(self):
+        self._pager.flush()
+
+    def close(self):
+        self._pager.close()
+
+    def _find_leaf(self, key):
+        """
+        Descends to the leaf which may hold the key and returns it together
+        with the list of (internal page, child index) pairs along the path.
+        """
+        path = []
+        page = self._pager.get(self._pager.root)
+        while not page._is_leaf:
+            index = bisect_right(page._keys, key)
+            path.append((page, index))
+            page = self._pager.get(page._children[index])
+        return page, path
+
+    def _edge_leaf(self, rightmost):
+        page = self._pager.get(self._pager.root)
+        while not page._is_leaf:
+            child = page._children[-1] if rightmost else page._children[0]
+            page = self._pager.get(child)
+        return page
+
+    def find(self, key) -> bool:
+        if self.empty():
+            return False
+        leaf, _ = self._find_leaf(key)
+        index = bisect_left(leaf._keys, key)
+        return index < len(leaf._keys) and leaf._keys[index] == key
+
+    def min(self):
+        if self.empty():
+            return None
+        return self._edge_leaf(rightmost=False)._keys[0]
+
+    def max(self):
+        if self.empty():
+            return None
+        return self._edge_leaf(rightmost=True)._keys[-1]
+
+    def range(self, low=None, high=None):
+        """
+        Yields keys k with low <= k <= high in ascending order, following the
+        leaf chain. Either bound may be None to leave that side open.
+        """
+        if self.empty():
+            return
+        if low is None:
+            leaf, index = self._edge_leaf(rightmost=False), 0
+        else:
+            leaf, _ = self._find_leaf(low)
+            index = bisect_left(leaf._keys, low)
+        while True:
+            keys = leaf._keys
+            while index < len(keys):
+                if high is not None and keys[index] > high:
+                    return
+                yield keys[index]
+                index += 1
+            if leaf._next == NO_PAGE:
+                return
+            leaf, index = self._pager.get(leaf._next), 0
+
+    def insert(self, items):
+        if isinstance(items, Iterable) and not isinstance(items, (str, bytes)):
+            for item in items:
+                self.insert_element(item)
+        else:
+            self.insert_element(items)
+
+    def insert_element(self, key) -> bool:
+        pager = self._pager
+        pager.check_key(key)
+        if pager.root == NO_PAGE:
+            leaf = pager.allocate(is_leaf=True)
+            pager.root = leaf._page_no
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf._keys, key)
+        if index < len(leaf._keys) and leaf._keys[index] == key:
+            return False
+        leaf._keys.insert(index, key)
+        pager.mark_dirty(leaf)
+        pager.size += 1
+        if len(leaf._keys) > pager.max_leaf_keys:
+            self._split(leaf, path)
+        return True
+
+    def _split(self, page, path):
+        pager = self._pager
+        while True:
+            sibling = pager.allocate(page._is_leaf)
+            middle = len(page._keys) // 2
+            if page._is_leaf:
+                sibling._keys = page._keys[middle:]
+                page._keys = page._keys[:middle]
+                separator = sibling._keys[0]
+                sibling._next, sibling._prev = page._next, page._page_no
+                if page._next != NO_PAGE:
+                    following = pager.get(page._next)
+                    following._prev = sibling._page_no
+                    pager.mark_dirty(following)
+                page._next = sibling._page_no
+            else:
+                separator = page._keys[middle]
+                sibling._keys = page._keys[middle + 1:]
+                sibling._children = page._children[middle + 1:]
+                page._keys = page._keys[:middle]
+                page._children = page._children[:middle + 1]
+            pager.mark_dirty(page)
+            pager.mark_dirty(sibling)
+            if not path:
+                root = pager.allocate(is_leaf=False)
+                root._keys = [separator]
+                root._children = [page._page_no, sibling._page_no]
+                pager.root = root._page_no
+                return
+            parent, index = path.pop()
+            parent._keys.insert(index, separator)
+            parent._children.insert(index + 1, sibling._page_no)
+            pager.mark_dirty(parent)
+            if len(parent._keys) <= pager.max_internal_keys:
+                return
+            page = parent
+
+    def delete(self, key) -> bool:
+        if self.empty():
+            return False
+        pager = self._pager
+        leaf, path = self._find_leaf(key)
+        index = bisect_left(leaf._keys, key)
+        if index == len(leaf._keys) or leaf._keys[index] != key:
+            return False
+        del leaf._keys[index]
+        pager.mark_dirty(leaf)
+        pager.size -= 1
+        self._rebalance(leaf, path)
+        return True
+
+    def _min_keys(self, page):
+        if page._is_leaf:
+            return self._pager.max_leaf_keys // 2
+        return self._pager.max_internal_keys // 2
+
+    def _rebalance(self, page, path):
+        pager = self._pager
+        while path and len(page._keys) < self._min_keys(page):
+            parent, index = path.pop()
+            left = right = None
+            if index > 0:
+                left = pager.get(parent._children[index - 1])
+                if len(left._keys) > self._min_keys(left):
+                    self._borrow_from_left(page, left, parent, index)
+                    return
+            if index < len(parent._children) - 1:
+                right = pager.get(parent._children[index + 1])
+                if len(right._keys) > self._min_keys(right):
+                    self._borrow_from_right(page, right, parent, index)
+                    return
+            if left is not None:
+                self._merge(left, page, parent, index - 1)
+            else:
+                self._merge(page, right, parent, index)
+            page = parent
+        if not path and not page._is_leaf and not page._keys:
+            pager.root = page._children[0]
+            pager.free(page)
+
+    def _borrow_from_left(self, page, left, parent, index):
+        if page._is_leaf:
+            page._keys.insert(0, left._keys.pop())
+            parent._keys[index - 1] = page._keys[0]
+        else:
+            page._keys.insert(0, parent._keys[index - 1])
+            page._children.insert(0, left._children.pop())
+            parent._keys[index - 1] = left._keys.pop()
+        for changed in (page, left, parent):
+            self._pager.mark_dirty(changed)
+
+    def _borrow_from_right(self, page, right, parent, index):
+        if page._is_leaf:
+            page._keys.append(right._keys.pop(0))
+            parent._keys[index] = right._keys[0]
+        else:
+            page._keys.append(parent._keys[index])
+            page._children.append(right._children.pop(0))
+            parent._keys[index] = right._keys.pop(0)
+        for changed in (page, right, parent):
+            self._pager.mark_dirty(changed)
+
+    def _merge(self, left, right, parent, index):
+        """
+        Moves everything from right into left, where right is the child of
+        parent directly after separator parent._keys[index].
+        """
+        pager = self._pager
+        separator = parent._keys.pop(index)
+        parent._children.pop(index + 1)
+        if left._is_leaf:
+            left._keys.extend(right._keys)
+            left._next = right._next
+            if right._next != NO_PAGE:
+                following = pager.get(right._next)
+                following._prev = left._page_no
+                pager.mark_dirty(following)
+        else:
+            left._keys.append(separator)
+            left._keys.extend(right._keys)
+            left._children.extend(right._children)
+        pager.mark_dirty(left)
+        pager.mark_dirty(parent)
+        pager.free(right)
+
+    def bulk_load(self, keys, fill_factor=1.0):
+        """
+        Builds the tree bottom-up from keys in a single pass instead of
+        inserting them one by one. The tree has to be empty and keys are
+        sorted and deduplicated first.
+        """
+        if not self.empty():
+            raise ValueError("bulk_load requires an empty tree")
+        if not 0.5 <= fill_factor <= 1.0:
+            raise ValueError("fill_factor must be between 0.5 and 1.0")
+        pager = self._pager
+        keys = sorted(set(keys))
+        for key in keys:
+            pager.check_key(key)
+        if pager.root != NO_PAGE:  # empty root leaf left behind by deletes
+            pager.free(pager.get(pager.root))
+            pager.root = NO_PAGE
+        min_leaf = pager.max_leaf_keys // 2
+        leaf_fill = max(min_leaf, int(pager.max_leaf_keys * fill_factor), 1)
+        max_children = pager.max_internal_keys + 1
+        min_children = pager.max_internal_keys // 2 + 1
+        children_fill = max(min_children, int(max_children * fill_factor))
+        level = []
+        previous = None
+        for chunk in self._chunk(keys, leaf_fill, min_leaf,
+                                 pager.max_leaf_keys):
+            leaf = pager.allocate(is_leaf=True)
+            leaf._keys = chunk
+            if previous is not None:
+                previous._next = leaf._page_no
+                leaf._prev = previous._page_no
+                pager.mark_dirty(previous)
+            pager.mark_dirty(leaf)
+            level.append((chunk[0] if chunk else None, leaf._page_no))
+            previous = leaf
+        while len(level) > 1:
+            next_level = []
+            for group in self._chunk(level, children_fill, min_children,
+                                     max_children):
+                page = pager.allocate(is_leaf=False)
+                page._keys = [first_key for first_key, _ in group[1:]]
+                page._children = [page_no for _, page_no in group]
+                pager.mark_dirty(page)
+                next_level.append((group[0][0], page._page_no))
+            level = next_level
+        pager.root = level[0][1]
+        pager.size = len(keys)
+
+    @staticmethod
+    def _chunk(items, size, minimum, maximum):
+        """
+        Splits items into runs of size. A short last run is merged into the
+        previous one, or both are evened out if they do not fit in a page.
+        """
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        if not chunks:
+            return [[]]
+        if len(chunks) > 1 and len(chunks[-1]) < minimum:
+            merged = chunks[-2] + chunks[-1]
+            if len(merged) <= maximum:
+                chunks[-2:] = [merged]
+            else:
+                half = len(merged) // 2
+                chunks[-2:] = [merged[:half], merged[half:]]
+        return chunks
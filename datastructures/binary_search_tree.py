@@ -2,7 +2,11 @@
 Implementation of binary search tree
 """
 from __future__ import annotations
+import copy
 from typing import Tuple
+from datastructures.frozen_index import FrozenIndex
+from datastructures.tree_traversal import (clone_subtree, inorder_nodes,
+                                           unlink_subtree)
 
 
 class Node():
@@ -110,18 +114,7 @@ class Node():
         return result
 
     def inorder_traversal_non_recursive(self, root):
-        node_stack = []
-        result = []
-        current_node = root
-        while current_node or len(node_stack) != 0:
-            while current_node:
-                node_stack.append(current_node)
-                current_node = current_node.left
-
-            current_node = node_stack.pop()
-            result.append(str(current_node))
-            current_node = current_node.right
-        return result
+        return [str(node) for node in inorder_nodes(root)]
 
     @property
     def data(self):
@@ -197,10 +190,58 @@ class BinarySearchTree():
             return self._root.max()
 
     def delete(self, key) -> bool:
-        if self.empty():
+        node = self._root
+        while node and node._data != key:
+            node = node._left if key < node._data else node._right
+        if node is None:
             return False
+        if node._left and node._right:
+            successor = node._right.min()
+            node._data = successor._data
+            node = successor
+        # node has at most one child now, which takes its place
+        child = node._left or node._right
+        parent = node._parent
+        if child:
+            child._parent = parent
+        if parent is None:
+            self._root = child
+        elif parent._left is node:
+            parent._left = child
         else:
-            return self._root.delete(key)
+            parent._right = child
+        node._parent = node._left = node._right = None
+        return True
+
+    def clear(self):
+        """
+        Removes all keys, freeing the nodes without the garbage collector.
+        See unlink_subtree.
+        """
+        unlink_subtree(self._root)
+        self._root = None
+
+    def freeze(self) -> FrozenIndex:
+        return FrozenIndex.from_sorted(
+            node._data for node in inorder_nodes(self._root))
+
+    def copy(self, deep=False) -> BinarySearchTree:
+        """
+        Returns a structural copy of the tree built in a single iterative
+        pass. Keys are shared with this tree unless deep is set.
+        """
+        tree = self.__class__()
+        tree._root = clone_subtree(
+            self._root, copy.deepcopy if deep else None)
+        return tree
+
+    def keys(self, reverse=False):
+        """
+        Yields the keys in ascending (or descending) order using O(1)
+        auxiliary memory.
+        """
+        for node in inorder_nodes(self._root, reverse):
+            yield node._data
 
     def print_inorder(self):
         if not self.empty():
@@ -0,0 +1,91 @@
+"""
+Implementation of counting Bloom filter
+"""
+from __future__ import annotations
+import math
+
+_MASK = (1 << 64) - 1
+_MAX_COUNT = 255
+
+
+class CountingBloomFilter():
+    """
+    Probabilistic set membership test which supports removal. Every key
+    increments k of the m one-byte counters, so a key whose counters are not
+    all positive was definitely never added, while a positive answer is
+    wrong with probability close to error_rate as long as no more than
+    capacity keys are stored.
+
+    memory_budget (in bytes, one byte per counter) caps m; the error rate
+    grows accordingly. Counters saturate at 255 and are never decremented
+    from there, which can only cause extra false positives.
+    """
+    def __init__(self, capacity, error_rate=0.01, memory_budget=None):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        if memory_budget is not None:
+            if memory_budget < 1:
+                raise ValueError("memory_budget must be positive")
+            size = min(size, memory_budget)
+        self._size = size
+        self._hash_count = max(1, round(size / capacity * math.log(2)))
+        self._counters = bytearray(size)
+        self.queries = 0
+        self.skipped = 0
+        self.false_positives = 0
+
+    def __contains__(self, key) -> bool:
+        return self.might_contain(key)
+
+    @property
+    def memory(self):
+        return len(self._counters)
+
+    @property
+    def hash_count(self):
+        return self._hash_count
+
+    def copy(self) -> CountingBloomFilter:
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._counters = bytearray(self._counters)
+        return clone
+
+    def clear(self):
+        self._counters = bytearray(self._size)
+
+    def _positions(self, key):
+        # double hashing: position i is h1 + i * h2
+        first = (hash(key) * 0x9E3779B97F4A7C15) & _MASK
+        second = hash((key, first)) | 1
+        size = self._size
+        return [(first + i * second) % size
+                for i in range(self._hash_count)]
+
+    def add(self, key):
+        counters = self._counters
+        for position in self._positions(key):
+            if counters[position] < _MAX_COUNT:
+                counters[position] += 1
+
+    def remove(self, key):
+        """
+        Removes a key which was added before. Removing a key which was never
+        added corrupts the filter.
+        """
+        counters = self._counters
+        for position in self._positions(key):
+            if 0 < counters[position] < _MAX_COUNT:
+                counters[position] -= 1
+
+    def might_contain(self, key) -> bool:
+        self.queries += 1
+        counters = self._counters
+        for position in self._positions(key):
+            if not counters[position]:
+                self.skipped += 1
+                return False
+        return True
@@ -0,0 +1,131 @@
+"""
+Implementation of write buffered AVL tree for insert heavy bursts
+"""
+from __future__ import annotations
+import heapq
+import time
+from datastructures.avl_tree import AVL
+
+_INSERTED, _DELETED = True, False
+
+
+class BufferedAVL():
+    """
+    AVL tree fronted by an unsorted write buffer, in the spirit of an LSM
+    tree. insert and delete only record the latest operation per key in a
+    dict; find consults that buffer before the tree. Once the buffer holds
+    max_buffer keys and at least buffer_ratio times as many keys as the
+    tree, or its oldest entry is older than max_age seconds, it is merged
+    into the tree in sorted order:
+
+    - a buffer which is large compared to the tree is merged with the
+      tree's keys in one pass and the tree is rebuilt with from_sorted,
+    - a small one is applied key by key, ascending, so keys beyond the
+      current maximum take the append path of AVL.insert_element.
+
+    Letting the buffer grow with the tree makes every rebuild cover a
+    proportional number of writes, so a burst costs amortized O(1) tree
+    work per key instead of a descent and retracing for each one.
+
+    Ordered reads (min, max, keys, range, len) merge the buffer first.
+    """
+    def __init__(self, max_buffer=1024, buffer_ratio=0.5, max_age=None):
+        if max_buffer < 1:
+            raise ValueError("max_buffer must be positive")
+        if buffer_ratio < 0:
+            raise ValueError("buffer_ratio must not be negative")
+        self._tree = AVL()
+        self._size = 0
+        self._buffer = {}
+        self._buffered_since = None
+        self._max_buffer = max_buffer
+        self._buffer_ratio = buffer_ratio
+        self._max_age = max_age
+        self.merges = 0
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def __len__(self):
+        self.flush()
+        return self._size
+
+    def __iter__(self):
+        return self.keys()
+
+    @property
+    def buffered(self):
+        return len(self._buffer)
+
+    def _write(self, key, operation):
+        if not self._buffer:
+            self._buffered_since = time.monotonic()
+        self._buffer[key] = operation
+        size = len(self._buffer)
+        if (size >= self._max_buffer and
+                size >= self._buffer_ratio * self._size or
+                self._max_age is not None and
+                time.monotonic() - self._buffered_since >= self._max_age):
+            self.flush()
+
+    def insert(self, key):
+        self._write(key, _INSERTED)
+
+    def delete(self, key):
+        self._write(key, _DELETED)
+
+    def find(self, key) -> bool:
+        operation = self._buffer.get(key)
+        if operation is not None:
+            return operation
+        return self._tree.find(key)
+
+    def flush(self):
+        """
+        Merges the write buffer into the tree.
+        """
+        if not self._buffer:
+            return
+        changes = sorted(self._buffer.items())
+        self._buffer = {}
+        self.merges += 1
+        # applying m changes one by one costs about m log n
+        if len(changes) * self._size.bit_length() > self._size:
+            self._rebuild(changes)
+            return
+        tree = self._tree
+        for key, operation in changes:
+            if operation:
+                self._size += tree.insert_element(key)
+            else:
+                self._size -= bool(tree.delete(key))
+
+    def _rebuild(self, changes):
+        keys = []
+        # keys of the tree come first among equal keys, as (key, None)
+        merged = heapq.merge(((key, None) for key in self._tree.keys()),
+                             changes, key=lambda change: change[0])
+        for key, operation in merged:
+            if keys and keys[-1] == key:  # change of a key in the tree
+                if operation is _DELETED:
+                    keys.pop()
+            elif operation is not _DELETED:
+                keys.append(key)
+        self._tree = AVL.from_sorted(keys)
+        self._size = len(keys)
+
+    def min(self):
+        self.flush()
+        return self._tree.min()
+
+    def max(self):
+        self.flush()
+        return self._tree.max()
+
+    def keys(self, reverse=False):
+        self.flush()
+        return self._tree.keys(reverse)
+
+    def range(self, low=None, high=None):
+        self.flush()
+        return self._tree.range(low, high)
@@ -0,0 +1,90 @@
+"""
+Implementation of asyncio deadline scheduler on top of RedBlackTree
+"""
+import asyncio
+import itertools
+from datastructures.red_black_tree import RedBlackTree
+
+
+class DeadlineScheduler():
+    """
+    Queue of items which become due at a deadline measured with the event
+    loop clock (loop.time()). Entries are kept in a RedBlackTree ordered by
+    (deadline, sequence number), so the earliest one is available in O(1)
+    and scheduling or cancelling takes O(log n).
+
+    next() sleeps until the earliest deadline passes instead of polling. It
+    is woken up early when an entry with an earlier deadline is scheduled.
+    """
+    def __init__(self):
+        self._tree = RedBlackTree()
+        self._items = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self):
+        return len(self._items)
+
+    def empty(self):
+        return self._tree.empty()
+
+    @staticmethod
+    def _now():
+        return asyncio.get_running_loop().time()
+
+    def schedule(self, deadline, item):
+        """
+        Schedules item for deadline and returns a handle for cancel().
+        """
+        handle = (deadline, next(self._sequence))
+        self._tree.insert_element(handle)
+        self._items[handle] = item
+        if self._tree.peek_min() == handle:
+            self._wakeup.set()
+        return handle
+
+    def schedule_in(self, delay, item):
+        return self.schedule(self._now() + delay, item)
+
+    def cancel(self, handle) -> bool:
+        if handle not in self._items:
+            return False
+        del self._items[handle]
+        return self._tree.delete(handle)
+
+    def peek(self):
+        """
+        Returns (deadline, item) of the earliest entry or None.
+        """
+        handle = self._tree.peek_min()
+        if handle is None:
+            return None
+        return handle[0], self._items[handle]
+
+    def pop_due(self):
+        """
+        Removes and returns every item whose deadline has passed.
+        """
+        now = self._now()
+        due = []
+        while not self._tree.empty() and self._tree.peek_min()[0] <= now:
+            due.append(self._items.pop(self._tree.pop_min()))
+        return due
+
+    async def next(self):
+        """
+        Waits until the earliest entry is due, removes it and returns it.
+        """
+        while True:
+            handle = self._tree.peek_min()
+            timeout = None
+            if handle is not None:
+                timeout = handle[0] - self._now()
+                if timeout <= 0:
+                    self._tree.pop_min()
+                    return self._items.pop(handle)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
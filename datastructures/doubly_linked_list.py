@@ -1,6 +1,7 @@
 """
 Implementation of doubly linked list
 """
+import copy
 
 
 class Node():
@@ -38,8 +39,22 @@ class Node():
 
 
 class DoublyLinkedList():
-    def __init__(self):
+    """
+    Doubly linked list. An optional node_pool (NodePool of Node) supplies
+    the nodes of new elements and takes back the nodes of removed ones.
+
+    The list keeps its tail, so both ends take O(1). Nodes double as handles
+    for splice and split_after, which relink whole runs of nodes in O(1);
+    push_back and push_front return the handle of the new node and
+    iteration yields the nodes. When such a run was moved without telling
+    its length, the length of both lists is counted again on the next
+    len() and cached.
+    """
+    def __init__(self, node_pool=None):
         self._head = None
+        self._tail = None
+        self._size = 0  # None while unknown
+        self._pool = node_pool
 
     def __str__(self):
         current_node = self._head
@@ -50,126 +65,198 @@ class DoublyLinkedList():
         return " <-> ".join(output)
 
     def __len__(self):
-        current_node = self._head
-        size = 0
-        while current_node:
-            size += 1
-            current_node = current_node.next
-        return size
+        if self._size is None:
+            current_node = self._head
+            size = 0
+            while current_node:
+                size += 1
+                current_node = current_node.next
+            self._size = size
+        return self._size
+
+    @property
+    def head(self):
+        return self._head
+
+    @property
+    def tail(self):
+        return self._tail
 
     def empty(self):
         return self._head is None
 
-    def push_back(self, node):
-        if self.empty():
-            self._head = Node(node)
+    def copy(self, deep=False):
+        """
+        Returns a copy of the list built in a single pass. Elements are
+        shared with this list unless deep is set.
+        """
+        new_list = self.__class__()
+        tail = None
+        size = 0
+        node = self._head
+        while node:
+            new_node = Node(copy.deepcopy(node.data) if deep else node.data)
+            if tail:
+                tail.next = new_node
+                new_node.prev = tail
+            else:
+                new_list._head = new_node
+            tail = new_node
+            size += 1
+            node = node.next
+        new_list._tail = tail
+        new_list._size = size
+        return new_list
+
+    def _new_node(self, data):
+        if self._pool is None:
+            return Node(data)
+        return self._pool.acquire(data)
+
+    def _free_node(self, node):
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _resize(self, delta):
+        if self._size is not None:
+            self._size += delta
+
+    def _link(self, first, last, after):
+        """
+        Links the run first..last in after the node after, or at the front
+        if after is None.
+        """
+        following = after.next if after else self._head
+        first.prev = after
+        last.next = following
+        if after:
+            after.next = first
         else:
-            current_node = self._head
-            while current_node.next:
-                current_node = current_node.next
-            new_node = Node(node)
-            current_node.next = new_node
-            new_node.prev = current_node
+            self._head = first
+        if following:
+            following.prev = last
+        else:
+            self._tail = last
 
-    def push_front(self, node):
-        if self.empty():
-            self._head = Node(node)
+    def _unlink(self, first, last):
+        """
+        Takes the run first..last out of the list and returns it detached.
+        """
+        if first.prev:
+            first.prev.next = last.next
         else:
-            current_node = self._head
-            new_node = Node(node)
-            new_node.next = current_node
-            current_node.prev = new_node
-            self._head = new_node
+            self._head = last.next
+        if last.next:
+            last.next.prev = first.prev
+        else:
+            self._tail = first.prev
+        first.prev = None
+        last.next = None
+
+    def _remove_node(self, node):
+        ret_val = node.data
+        self._unlink(node, node)
+        self._resize(-1)
+        self._free_node(node)
+        return ret_val
+
+    def push_back(self, node):
+        new_node = self._new_node(node)
+        self._link(new_node, new_node, self._tail)
+        self._resize(1)
+        return new_node
+
+    def push_front(self, node):
+        new_node = self._new_node(node)
+        self._link(new_node, new_node, None)
+        self._resize(1)
+        return new_node
 
     def pop_back(self):
         if self.empty():
             return None
-        else:
-            current_node = self._head
-            while current_node.next:
-                current_node = current_node.next
-            ret_val = current_node.data
-            current_node.prev.next = None
-            return ret_val
+        return self._remove_node(self._tail)
 
     def pop_front(self):
         if self.empty():
             return None
-        else:
-            current_node = self._head
-            ret_val = current_node.data
-            if not current_node.next:
-                self._head = None
-            else:
-                self._head = current_node.next
-                current_node.next.prev = None
-            return ret_val
+        return self._remove_node(self._head)
 
     def insert(self, pos, node) -> bool:
-        if self.empty():
+        current_node = self._head
+        while current_node and current_node.data != pos:
+            current_node = current_node.next
+        if not current_node:  # there is no element 'pos'
             return False
-        else:
-            current_node = self._head
-            while current_node.next and current_node.data != pos:
-                current_node = current_node.next
-            if current_node.next and current_node.data == pos:
-                new_node = Node(node)
-                current_node.next = new_node
-                new_node.prev = current_node
-                return True
-            elif current_node.next:
-                new_node = Node(node)
-                current_node.next.prev = new_node
-                new_node.next = current_node.next
-                new_node.prev = current_node
-                current_node.next = new_node
-                return True
-            else:
-                return False
+        new_node = self._new_node(node)
+        self._link(new_node, new_node, current_node)
+        self._resize(1)
+        return True
 
     def remove(self, node) -> bool:
-        if self.empty():
+        current_node = self._head
+        while current_node and current_node.data != node:
+            current_node = current_node.next
+        if not current_node:
             return False
-        else:
-            current_node = self._head
-            while current_node.next and current_node.data != node:
-                current_node = current_node.next
-            if not current_node.next and current_node.data == node:
-                current_node.prev.next = None
-                return True
-            elif current_node.next:
-                if not current_node.prev:
-                    self._head = current_node.next
-                    current_node.next.prev = None
-                    return True
-                else:
-                    current_node.prev.next = current_node.next
-                    current_node.next.prev = current_node.prev
-                    return True
-            else:
-                return False
+        self._remove_node(current_node)
+        return True
 
     def remove_if(self, functor):
-        if self.empty():
+        current_node = self._head
+        while current_node:
+            next_node = current_node.next
+            if functor(current_node.data):
+                self._remove_node(current_node)
+            current_node = next_node
+
+    def splice(self, pos_handle, other, first, last, count=None):
+        """
+        Moves the nodes first..last (inclusive, in list order) of other
+        behind the node pos_handle of this list, or to its front if
+        pos_handle is None, in O(1). other may be this list as long as
+        pos_handle is not inside the run. count, the number of moved nodes,
+        keeps both lengths exact; without it they are recounted lazily.
+        """
+        other._unlink(first, last)
+        self._link(first, last, pos_handle)
+        if other is self:
             return
+        if count is None:
+            self._size = other._size = None
         else:
-            current_node = self._head
-            while current_node:
-                if functor(current_node.data):
-                    new_current = current_node.next
-                    if not current_node.prev:
-                        self._head = new_current
-                        new_current.prev = None
-                    elif not current_node.next:
-                        current_node.prev.next = new_current
-                    else:
-                        current_node.prev.next = current_node.next
-                        current_node.next.prev = current_node.prev
-                    current_node.next = None
-                    current_node.prev = None
-                    current_node = new_current
-                else:
-                    current_node = current_node.next
+            self._resize(count)
+            other._resize(-count)
+
+    def split_after(self, handle):
+        """
+        Cuts the list behind the node handle and returns the nodes after it
+        as a new list, in O(1).
+        """
+        new_list = self.__class__(self._pool)
+        first = handle.next
+        if first:
+            last = self._tail
+            self._unlink(first, last)
+            new_list._head, new_list._tail = first, last
+            new_list._size = None
+            self._size = None
+        return new_list
+
+    def concat(self, other):
+        """
+        Moves all nodes of other to the end of this list in O(1), leaving
+        other empty.
+        """
+        if other is self or other.empty():
+            return
+        if self._size is None or other._size is None:
+            self._size = None
+        else:
+            self._size += other._size
+        self._link(other._head, other._tail, self._tail)
+        other._head = other._tail = None
+        other._size = 0
 
     def __iter__(self):
         return DoublyLinkedListIterator(self._head)
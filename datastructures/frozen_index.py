@@ -0,0 +1,150 @@
+"""
+Implementation of immutable sorted index in Eytzinger (BFS) layout
+"""
+from __future__ import annotations
+
+
+class FrozenIndex():
+    """
+    Read-only ordered set stored in a single list in Eytzinger order: the
+    root of the implicit balanced search tree sits at index 1 and the
+    children of index k at 2k and 2k + 1. A search only computes the next
+    index from one comparison, instead of chasing node objects, and the
+    first levels visited by every search sit next to each other at the
+    front of the list.
+
+    Instances are usually produced by freeze() of the tree classes.
+    """
+    def __init__(self, keys=()):
+        self._build(sorted(set(keys)))
+
+    @classmethod
+    def from_sorted(cls, keys) -> FrozenIndex:
+        """
+        Builds the index from keys which are already sorted and unique,
+        skipping the sort.
+        """
+        index = cls.__new__(cls)
+        index._build(list(keys))
+        return index
+
+    def _build(self, keys):
+        self._size = len(keys)
+        self._layout = [None] * (self._size + 1)
+        # inorder walk of the implicit tree assigns the sorted keys
+        key_iter = iter(keys)
+        index_stack = []
+        index = 1
+        while index_stack or index <= self._size:
+            while index <= self._size:
+                index_stack.append(index)
+                index *= 2
+            index = index_stack.pop()
+            self._layout[index] = next(key_iter)
+            index = 2 * index + 1
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def __iter__(self):
+        return self.range()
+
+    def empty(self):
+        return self._size == 0
+
+    def _lower_bound(self, key):
+        """
+        Returns the index of the smallest key >= key, 0 if there is none.
+        """
+        layout, size = self._layout, self._size
+        index = 1
+        while index <= size:
+            index = 2 * index + (layout[index] < key)
+        # drop the trailing right turns and the final left turn
+        return index >> (~index & (index + 1)).bit_length()
+
+    def _upper_bound(self, key):
+        """
+        Returns the index of the smallest key > key, 0 if there is none.
+        """
+        layout, size = self._layout, self._size
+        index = 1
+        while index <= size:
+            index = 2 * index + (layout[index] <= key)
+        return index >> (~index & (index + 1)).bit_length()
+
+    def _first(self):
+        if self._size == 0:
+            return 0
+        index = 1
+        while 2 * index <= self._size:
+            index *= 2
+        return index
+
+    def _last(self):
+        if self._size == 0:
+            return 0
+        index = 1
+        while 2 * index + 1 <= self._size:
+            index = 2 * index + 1
+        return index
+
+    def _successor(self, index):
+        if 2 * index + 1 <= self._size:
+            index = 2 * index + 1
+            while 2 * index <= self._size:
+                index *= 2
+            return index
+        while index & 1:
+            index >>= 1
+        return index >> 1
+
+    def _predecessor(self, index):
+        if 2 * index <= self._size:
+            index *= 2
+            while 2 * index + 1 <= self._size:
+                index = 2 * index + 1
+            return index
+        while not index & 1:
+            index >>= 1
+        return index >> 1
+
+    def find(self, key) -> bool:
+        index = self._lower_bound(key)
+        return index != 0 and self._layout[index] == key
+
+    def min(self):
+        return self._layout[self._first()] if self._size else None
+
+    def max(self):
+        return self._layout[self._last()] if self._size else None
+
+    def ceiling(self, key):
+        """
+        Returns the smallest key >= key or None.
+        """
+        return self._layout[self._lower_bound(key)]
+
+    def floor(self, key):
+        """
+        Returns the largest key <= key or None.
+        """
+        if not self._size:
+            return None
+        index = self._upper_bound(key)
+        index = self._predecessor(index) if index else self._last()
+        return self._layout[index]
+
+    def range(self, low=None, high=None):
+        """
+        Yields keys k with low <= k <= high in ascending order. Either bound
+        may be None to leave that side open.
+        """
+        index = self._first() if low is None else self._lower_bound(low)
+        layout = self._layout
+        while index and (high is None or layout[index] <= high):
+            yield layout[index]
+            index = self._successor(index)
@@ -0,0 +1,84 @@
+"""
+Implementation of interval tree as augmented red black tree
+"""
+from __future__ import annotations
+from datastructures.red_black_tree import Node, RedBlackTree
+
+
+class IntervalNode(Node):
+    """
+    Red black tree node keyed by a closed interval (low, high) which also
+    keeps the largest high endpoint found in its subtree.
+    """
+    _augmented = True
+
+    def __init__(self, key):
+        super().__init__(key)
+        self._max_high = key[1]
+
+    def _update_augmentation(self):
+        max_high = self._key[1]
+        for child in (self._left, self._right):
+            if child and child._max_high > max_high:
+                max_high = child._max_high
+        self._max_high = max_high
+
+
+class IntervalTree(RedBlackTree):
+    """
+    Set of closed intervals ordered by (low, high). Every node knows the
+    maximum high endpoint of its subtree, kept up to date through rotations
+    and deletions, so subtrees which end before the query starts are
+    skipped and overlap queries take O(log n + k) for k results.
+    """
+    _node_class = IntervalNode
+
+    def insert(self, intervals):
+        """
+        Inserts every (low, high) pair from intervals.
+        """
+        ret_val = True
+        for low, high in intervals:
+            inserted = self.add(low, high)
+            ret_val = ret_val and inserted
+        return ret_val
+
+    def add(self, low, high) -> bool:
+        if high < low:
+            raise ValueError(f"interval ({low}, {high}) ends before it starts")
+        return self.insert_element((low, high))
+
+    def remove(self, low, high) -> bool:
+        return self.delete((low, high))
+
+    def overlapping(self, low, high):
+        """
+        Returns the sorted list of intervals which share at least one point
+        with [low, high].
+        """
+        result = []
+        node_stack = [self._root]
+        while node_stack:
+            node = node_stack.pop()
+            if node is None or node._max_high < low:
+                continue
+            node_stack.append(node._left)
+            # intervals to the right start at or after this one
+            if node._key[0] <= high:
+                if node._key[1] >= low:
+                    result.append(node._key)
+                node_stack.append(node._right)
+        result.sort()
+        return result
+
+    def overlaps(self, point):
+        """
+        Returns the sorted list of intervals containing point.
+        """
+        return self.overlapping(point, point)
+
+    def stabbing_count(self, point):
+        """
+        Returns the number of intervals containing point.
+        """
+        return len(self.overlaps(point))
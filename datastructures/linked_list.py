@@ -1,6 +1,7 @@
 """
 Definition of LinkedList class
 """
+import copy
 
 
 class Node():
@@ -33,10 +34,12 @@ class Node():
 
 class LinkedList():
     """
-    Single linked list
+    Single linked list. An optional node_pool (NodePool of Node) supplies
+    the nodes of new elements and takes back the nodes of removed ones.
     """
-    def __init__(self):
+    def __init__(self, node_pool=None):
         self._head = None
+        self._pool = node_pool
 
     def __str__(self):
         node = self._head
@@ -46,17 +49,44 @@ class LinkedList():
             node = node.next
         return " -> ".join(output)
 
+    def copy(self, deep=False):
+        """
+        Returns a copy of the list built in a single pass. Elements are
+        shared with this list unless deep is set.
+        """
+        new_list = self.__class__()
+        tail = None
+        node = self._head
+        while node:
+            new_node = Node(copy.deepcopy(node.data) if deep else node.data)
+            if tail:
+                tail.next = new_node
+            else:
+                new_list._head = new_node
+            tail = new_node
+            node = node.next
+        return new_list
+
+    def _new_node(self, data):
+        if self._pool is None:
+            return Node(data)
+        return self._pool.acquire(data)
+
+    def _free_node(self, node):
+        if self._pool is not None:
+            self._pool.release(node)
+
     def push_back(self, data):
         node = self._head
         if not node:
-            self._head = Node(data)
+            self._head = self._new_node(data)
         else:
             while node.next:
                 node = node.next
-            node.next = Node(data)
+            node.next = self._new_node(data)
 
     def push_front(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data)
         new_node.next = self._head
         self._head = new_node
 
@@ -66,6 +96,7 @@ class LinkedList():
         current_node = self._head
         ret_val = current_node.data
         self._head = current_node.next
+        self._free_node(current_node)
         return ret_val
 
     def pop_back(self):
@@ -74,11 +105,13 @@ class LinkedList():
         current_node = self._head
         if not current_node.next:
             ret_val = current_node.data
-            current_node = None
+            self._head = None
+            self._free_node(current_node)
         else:
             while current_node.next.next:
                 current_node = current_node.next
             ret_val = current_node.next.data
+            self._free_node(current_node.next)
             current_node.next = None
         return ret_val
 
@@ -90,7 +123,7 @@ class LinkedList():
             while (current_node.next and current_node.data != pos):
                 current_node = current_node.next
             if current_node.data == pos:
-                new_node = Node(data)
+                new_node = self._new_node(data)
                 new_node.next = current_node.next
                 current_node.next = new_node
                 return True
@@ -119,20 +152,27 @@ class LinkedList():
                        current_node.next.data != pos):
                     current_node = current_node.next
                 if current_node.next.data == pos:
-                    new_end = current_node.next.next
-                    current_node.next = new_end
+                    removed = current_node.next
+                    current_node.next = removed.next
+                    self._free_node(removed)
                     return True
                 else:
                     return evaluate_last_element(current_node.next)
 
     def remove_if(self, functor):
-        new_list = LinkedList()
+        previous = None
         current_node = self._head
         while current_node:
-            if not functor(current_node.data):
-                new_list.push_back(Node(current_node.data))
-            current_node = current_node.next
-        self._head = new_list._head
+            next_node = current_node.next
+            if functor(current_node.data):
+                if previous:
+                    previous.next = next_node
+                else:
+                    self._head = next_node
+                self._free_node(current_node)
+            else:
+                previous = current_node
+            current_node = next_node
 
     def empty(self):
         return self._head is None
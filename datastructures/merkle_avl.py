@@ -0,0 +1,206 @@
+"""
+Implementation of AVL tree with subtree set hashes for replica diffing
+"""
+from __future__ import annotations
+import hashlib
+from datastructures.avl_tree import AVL, Node
+from datastructures.tree_traversal import range_nodes
+
+_MASK = (1 << 128) - 1
+
+
+def key_hash(key):
+    """
+    128 bit hash of key which is stable across processes and machines, as
+    long as repr(key) is.
+    """
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+    return int.from_bytes(digest, "big")
+
+
+class MerkleNode(Node):
+    """
+    AVL node which also keeps the number of keys in its subtree and their
+    set hash: the sum of key_hash over the subtree modulo 2**128. The sum
+    does not depend on the shape of the tree, so subtrees of two replicas
+    holding the same keys hash the same however their keys were inserted.
+    """
+    _augmented = True
+
+    def __init__(self, key):
+        super().__init__(key)
+        self._hashed = (key, key_hash(key))
+        self._digest = self._hashed[1]
+        self._count = 1
+
+    def _update_augmentation(self):
+        if self._hashed[0] is not self._key:  # deletion moved a key here
+            self._hashed = (self._key, key_hash(self._key))
+        digest, count = self._hashed[1], 1
+        for child in (self._left, self._right):
+            if child:
+                digest += child._digest
+                count += child._count
+        self._digest = digest & _MASK
+        self._count = count
+
+
+class MerkleAVL(AVL):
+    """
+    AVL tree whose nodes keep a set hash of their subtree, maintained
+    through rotations, appends and deletions.
+
+    digest() identifies the key set in O(1), so equal replicas are
+    recognised by comparing two digests. diff() and changed_ranges()
+    bisect the key space and only descend into ranges whose digests
+    differ; every range digest takes O(log n), so d differences cost
+    O(d log^2 n) instead of shipping n keys. sync_from() pulls just those
+    ranges from another replica.
+    """
+    _node_class = MerkleNode
+
+    def __len__(self):
+        return self._root._count if self._root else 0
+
+    def digest(self):
+        """
+        Returns (set hash, number of keys) of the whole tree.
+        """
+        if not self._root:
+            return 0, 0
+        return self._root._digest, self._root._count
+
+    def range_digest(self, low=None, high=None):
+        """
+        Returns (set hash, number of keys) of the keys k with
+        low <= k < high. Either bound may be None to leave that side open.
+        """
+        digest = count = 0
+        node = self._root
+        # keys of the range are found in the subtrees hanging off the two
+        # search paths for low and high, which share a prefix
+        while node:
+            if low is not None and node._key < low:
+                node = node._right
+            elif high is not None and node._key >= high:
+                node = node._left
+            else:
+                break
+        if node is None:
+            return 0, 0
+        digest, count = node._hashed[1], 1
+        left, right = node._left, node._right
+        while left:
+            if low is not None and left._key < low:
+                left = left._right
+                continue
+            digest += left._hashed[1]
+            count += 1
+            if left._right:
+                digest += left._right._digest
+                count += left._right._count
+            left = left._left
+        while right:
+            if high is not None and right._key >= high:
+                right = right._left
+                continue
+            digest += right._hashed[1]
+            count += 1
+            if right._left:
+                digest += right._left._digest
+                count += right._left._count
+            right = right._right
+        return digest & _MASK, count
+
+    def _rank(self, key):
+        """
+        Returns the number of keys smaller than key.
+        """
+        rank = 0
+        node = self._root
+        while node:
+            if node._key < key:
+                rank += 1 + (node._left._count if node._left else 0)
+                node = node._right
+            else:
+                node = node._left
+        return rank
+
+    def _select(self, rank):
+        """
+        Returns the key with rank keys smaller than it.
+        """
+        node = self._root
+        while node:
+            left_count = node._left._count if node._left else 0
+            if rank < left_count:
+                node = node._left
+            elif rank == left_count:
+                return node._key
+            else:
+                rank -= left_count + 1
+                node = node._right
+        raise IndexError("rank out of range")
+
+    def _keys_between(self, low, high):
+        keys = []
+        for node in range_nodes(self._root, low):
+            if high is not None and node._key >= high:
+                break
+            keys.append(node._key)
+        return keys
+
+    def changed_ranges(self, other, leaf_size=16):
+        """
+        Returns the list of ranges (low, high), meaning low <= k < high with
+        None for an open side, outside of which this tree and other hold
+        the same keys. Every range holds at most leaf_size keys in the
+        tree holding more of them.
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive")
+        ranges = []
+        pending = [(None, None)]
+        while pending:
+            low, high = pending.pop()
+            mine = self.range_digest(low, high)
+            theirs = other.range_digest(low, high)
+            if mine == theirs:
+                continue
+            larger, count = (self, mine[1]) if mine[1] >= theirs[1] \
+                else (other, theirs[1])
+            if count <= leaf_size:
+                ranges.append((low, high))
+                continue
+            # the median splits the larger side in two non-empty halves
+            first = larger._rank(low) if low is not None else 0
+            pivot = larger._select(first + count // 2)
+            pending.append((pivot, high))
+            pending.append((low, pivot))
+        return ranges
+
+    def diff(self, other, leaf_size=16):
+        """
+        Returns (keys only in this tree, keys only in other), both sorted.
+        """
+        only_mine, only_theirs = [], []
+        for low, high in self.changed_ranges(other, leaf_size):
+            mine = self._keys_between(low, high)
+            theirs = other._keys_between(low, high)
+            mine_set, theirs_set = set(mine), set(theirs)
+            only_mine.extend(key for key in mine if key not in theirs_set)
+            only_theirs.extend(key for key in theirs if key not in mine_set)
+        return only_mine, only_theirs
+
+    def sync_from(self, other, leaf_size=16):
+        """
+        Makes this tree hold the same keys as other, transferring only the
+        ranges which differ. Returns the number of inserted and deleted
+        keys.
+        """
+        missing, extra = other.diff(self, leaf_size)
+        for key in extra:
+            self.delete(key)
+        for key in missing:
+            self.insert_element(key)
+        return len(missing) + len(extra)
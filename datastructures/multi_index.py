@@ -0,0 +1,153 @@
+"""
+Implementation of record container with ordered secondary indexes
+"""
+from __future__ import annotations
+import itertools
+from datastructures.avl_tree import AVL
+
+
+class _Index():
+    def __init__(self, key, unique, tree):
+        self.key = key
+        self.unique = unique
+        self.tree = tree
+
+
+class MultiIndex():
+    """
+    Container which stores every record once, under a record id, and keeps
+    any number of ordered secondary indexes over the records. An index is
+    a tree (AVL by default, or RedBlackTree) of (key(record), record id)
+    pairs, so records sharing a key value are kept apart and ordered by id.
+
+    insert, update and delete compute every index key and check the unique
+    indexes before changing anything, so an extractor which raises or a
+    unique key conflict leaves the container and all indexes untouched.
+
+    The entries of every record are kept next to it, so update and delete
+    remove exactly what was indexed, even if the record was mutated in
+    place since.
+    """
+    def __init__(self):
+        self._records = {}
+        # record id -> {index name: (value, record id)}
+        self._indexed = {}
+        self._indexes = {}
+        self._ids = itertools.count()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, record_id) -> bool:
+        return record_id in self._records
+
+    def __iter__(self):
+        return iter(self._records.items())
+
+    def add_index(self, name, key, unique=False, tree_class=AVL):
+        """
+        Adds an index called name ordered by key(record) and fills it from
+        the records already stored.
+        """
+        if name in self._indexes:
+            raise ValueError(f"index {name!r} already exists")
+        entries = sorted((key(record), record_id)
+                         for record_id, record in self._records.items())
+        if unique:
+            for (value, _), (next_value, _) in zip(entries, entries[1:]):
+                if value == next_value:
+                    raise KeyError(f"duplicate value {value!r} for unique "
+                                   f"index {name!r}")
+        self._indexes[name] = _Index(key, unique,
+                                     tree_class.from_sorted(entries))
+        for entry in entries:
+            self._indexed[entry[1]][name] = entry
+
+    def drop_index(self, name):
+        del self._indexes[name]
+        for entries in self._indexed.values():
+            del entries[name]
+
+    def _entries(self, record, record_id):
+        """
+        Returns the index entry of record for every index, raising KeyError
+        if one of them clashes with another record in a unique index.
+        """
+        entries = {}
+        for name, index in self._indexes.items():
+            value = index.key(record)
+            if index.unique:
+                for other_id in self._ids_with(index, value):
+                    if other_id != record_id:
+                        raise KeyError(f"duplicate value {value!r} for "
+                                       f"unique index {name!r}")
+            entries[name] = (value, record_id)
+        return entries
+
+    @staticmethod
+    def _ids_with(index, value):
+        for found, record_id in index.tree.range((value,)):
+            if found != value:
+                return
+            yield record_id
+
+    def insert(self, record):
+        """
+        Stores record and returns its record id.
+        """
+        record_id = next(self._ids)
+        entries = self._entries(record, record_id)
+        for name, entry in entries.items():
+            self._indexes[name].tree.insert_element(entry)
+        self._records[record_id] = record
+        self._indexed[record_id] = entries
+        return record_id
+
+    def get(self, record_id):
+        return self._records.get(record_id)
+
+    def update(self, record_id, record):
+        """
+        Replaces the record stored under record_id. Only the indexes whose
+        key changed are touched.
+        """
+        if record_id not in self._records:
+            raise KeyError(record_id)
+        entries = self._entries(record, record_id)
+        old_entries = self._indexed[record_id]
+        for name, entry in entries.items():
+            if old_entries[name] != entry:
+                tree = self._indexes[name].tree
+                tree.delete(old_entries[name])
+                tree.insert_element(entry)
+        self._records[record_id] = record
+        self._indexed[record_id] = entries
+
+    def delete(self, record_id) -> bool:
+        if record_id not in self._records:
+            return False
+        del self._records[record_id]
+        for name, entry in self._indexed.pop(record_id).items():
+            self._indexes[name].tree.delete(entry)
+        return True
+
+    def find(self, name, value):
+        """
+        Returns the records whose key in index name equals value, ordered by
+        record id.
+        """
+        index = self._indexes[name]
+        return [self._records[record_id]
+                for record_id in self._ids_with(index, value)]
+
+    def range(self, name, low=None, high=None):
+        """
+        Yields (record id, record) for every record whose key in index name
+        lies in [low, high], ordered by that key. Either bound may be None
+        to leave that side open.
+        """
+        tree = self._indexes[name].tree
+        for value, record_id in tree.range(None if low is None else (low,)):
+            if high is not None and value > high:
+                return
+            yield record_id, self._records[record_id]
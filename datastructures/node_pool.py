@@ -0,0 +1,63 @@
+"""
+Free list of list nodes which are recycled instead of reallocated
+"""
+
+
+class NodePool():
+    """
+    Keeps nodes unlinked from LinkedList or DoublyLinkedList and hands them
+    out again for new elements, so push/pop heavy queues stop allocating a
+    node per element. A released node is reset with its __init__, which
+    drops the element and the links, and kept while the pool holds fewer
+    than capacity nodes. Lowering capacity, or calling shrink, frees the
+    excess nodes right away.
+
+    One pool can be shared by several lists of the same node class.
+    """
+    def __init__(self, node_class, capacity=1024):
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self._node_class = node_class
+        self._capacity = capacity
+        self._free = []
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._free)
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self._capacity = capacity
+        self.shrink(capacity)
+
+    def shrink(self, keep=0):
+        """
+        Frees spare nodes until at most keep are left.
+        """
+        del self._free[keep:]
+
+    def acquire(self, data):
+        if self._free:
+            self.reused += 1
+            node = self._free.pop()
+            node._data = data
+            return node
+        self.allocated += 1
+        return self._node_class(data)
+
+    def release(self, node):
+        self.released += 1
+        if len(self._free) >= self._capacity:
+            self.dropped += 1
+            return
+        node.__init__(None)
+        self._free.append(node)
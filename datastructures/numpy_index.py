@@ -0,0 +1,122 @@
+"""
+Implementation of NumPy backed sorted index answering batch queries
+"""
+from __future__ import annotations
+from datastructures.tree_traversal import inorder_nodes
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only this module needs it
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("SortedArrayIndex requires numpy")
+
+
+def keys_array(tree, dtype=None):
+    """
+    Exports the keys of AVL or RedBlackTree as a contiguous sorted array.
+    With a dtype the keys are streamed by np.fromiter straight into the
+    array, without building an intermediate list. Without one NumPy has to
+    see every key to choose the dtype, so the keys are collected in a list
+    first, which briefly needs memory for both.
+    """
+    _require_numpy()
+    keys = (node._key for node in inorder_nodes(tree._root))
+    if dtype is None:
+        return np.array(list(keys))
+    return np.fromiter(keys, dtype=dtype)
+
+
+class SortedArrayIndex():
+    """
+    Immutable ordered set stored in a sorted NumPy array. Queries take
+    whole arrays of keys and are answered with a single np.searchsorted
+    call, so batch lookups run at C speed instead of paying interpreter
+    overhead for every key.
+    """
+    def __init__(self, keys=(), dtype=None):
+        _require_numpy()
+        self._keys = np.unique(np.asarray(keys, dtype=dtype))
+        self._keys.flags.writeable = False
+
+    @classmethod
+    def from_sorted(cls, keys) -> SortedArrayIndex:
+        """
+        Wraps an array which is already sorted and unique without copying.
+        The index holds a read-only view, the caller's array stays
+        writable, so it must not be modified while the index is in use.
+        """
+        _require_numpy()
+        index = cls.__new__(cls)
+        index._keys = np.asarray(keys).view()
+        index._keys.flags.writeable = False
+        return index
+
+    @classmethod
+    def from_tree(cls, tree, dtype=None) -> SortedArrayIndex:
+        """
+        Builds the index from the keys of AVL or RedBlackTree.
+        """
+        return cls.from_sorted(keys_array(tree, dtype))
+
+    def to_tree(self, tree_class):
+        """
+        Returns a new tree_class (AVL or RedBlackTree) holding the keys.
+        """
+        tree = tree_class()
+        tree.insert(self._keys.tolist())
+        return tree
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return bool(self.contains(key))
+
+    def __iter__(self):
+        return iter(self._keys.tolist())
+
+    def empty(self):
+        return len(self._keys) == 0
+
+    @property
+    def keys(self):
+        """
+        Read-only view of the sorted keys.
+        """
+        return self._keys
+
+    def min(self):
+        return self._keys[0].item() if len(self._keys) else None
+
+    def max(self):
+        return self._keys[-1].item() if len(self._keys) else None
+
+    def contains(self, keys):
+        """
+        Returns a boolean array telling which of keys are in the index, or a
+        single boolean for a scalar key.
+        """
+        keys = np.asarray(keys)
+        batch = np.atleast_1d(keys)
+        positions = np.searchsorted(self._keys, batch)
+        found = positions < len(self._keys)
+        found[found] = self._keys[positions[found]] == batch[found]
+        return found if keys.ndim else found[0]
+
+    def rank(self, keys):
+        """
+        Returns for every key the number of stored keys smaller than it.
+        """
+        return np.searchsorted(self._keys, np.asarray(keys), side="left")
+
+    def count_range(self, low, high):
+        """
+        Counts stored keys k with low <= k <= high. low and high may be
+        scalars or arrays of the same shape.
+        """
+        return np.searchsorted(self._keys, high, side="right") - \
+            np.searchsorted(self._keys, low, side="left")
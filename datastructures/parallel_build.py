@@ -0,0 +1,74 @@
+"""
+Parallel bulk build of AVL and RedBlackTree from large inputs
+"""
+import bisect
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# sampled keys per worker to choose the range boundaries from
+_SAMPLES_PER_WORKER = 64
+
+
+def _sorted_run(chunk):
+    return sorted(set(chunk))
+
+
+def _split_run(chunk, pivots):
+    """
+    Sorts and deduplicates chunk and cuts it into one piece per key range,
+    piece i holding the keys k with pivots[i - 1] <= k < pivots[i].
+    """
+    run = _sorted_run(chunk)
+    cuts = [0] + [bisect.bisect_left(run, pivot) for pivot in pivots] + \
+        [len(run)]
+    return [run[low:high] for low, high in zip(cuts, cuts[1:])]
+
+
+def _merge_pieces(pieces):
+    return sorted(set(itertools.chain.from_iterable(pieces)))
+
+
+def _pivots(keys, workers):
+    sample = sorted(set(random.Random(0).sample(
+        keys, min(len(keys), _SAMPLES_PER_WORKER * workers))))
+    step = len(sample) / workers
+    return sorted(set(sample[int(step * i)] for i in range(1, workers)))
+
+
+def build_parallel(tree_class, keys, workers=None):
+    """
+    Builds tree_class (AVL or RedBlackTree) holding keys. The key space is
+    cut into one range per worker at pivots taken from a sample of the
+    keys. In a first round every worker sorts and deduplicates a slice of
+    the input and cuts it at the pivots; in a second round every worker
+    merges the pieces of one key range. The resulting runs are disjoint and
+    ordered, so the parent only concatenates them and builds the balanced
+    tree with tree_class.from_sorted.
+
+    from_sorted creates the nodes one by one in the parent and takes most
+    of the build time, about 90% of it with 1M integer keys. By Amdahl's
+    law the parallel part can therefore speed up the whole build by about
+    10% at most, and process start up and transferring the keys between
+    processes eat most of that; the parallel path mostly pays off for keys
+    which are expensive to compare.
+
+    workers defaults to the number of CPUs; with one worker everything runs
+    in the calling process.
+    """
+    keys = list(keys)
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if workers == 1 or len(keys) < 2 * workers:
+        return tree_class.from_sorted(_sorted_run(keys))
+    pivots = _pivots(keys, workers)
+    chunk_size = -(-len(keys) // workers)
+    chunks = [keys[i:i + chunk_size]
+              for i in range(0, len(keys), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pieces = list(executor.map(_split_run, chunks,
+                                   itertools.repeat(pivots)))
+        runs = executor.map(_merge_pieces, zip(*pieces))
+        return tree_class.from_sorted(itertools.chain.from_iterable(runs))
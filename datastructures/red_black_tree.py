@@ -1,6 +1,13 @@
 from __future__ import annotations
+import copy
 from enum import Enum
 from collections.abc import Iterable
+from datastructures import async_ingest
+from datastructures.frozen_index import FrozenIndex
+from datastructures.tree_traversal import (before, clone_subtree,
+                                           inorder_nodes, lower_bound,
+                                           nearest_nodes, range_nodes,
+                                           unlink_subtree, upper_bound)
 
 
 class NodeColor(Enum):
@@ -9,6 +16,9 @@ class NodeColor(Enum):
 
 
 class Node():
+    # augmented node classes set this and override _update_augmentation
+    _augmented = False
+
     def __init__(self, key):
         self._key = key
         self._left = None
@@ -23,32 +33,64 @@ class Node():
             color = "B"
         return f"{self._key}{color}"
 
+    def _update_augmentation(self):
+        """
+        Recomputes data kept about the subtree from the node's own key and
+        its children. Plain nodes keep no such data.
+        """
+        pass
+
+    def _update_path(self):
+        """
+        Recomputes the augmentation of the node and all of its ancestors.
+        """
+        if not self._augmented:
+            return
+        node = self
+        while node:
+            node._update_augmentation()
+            node = node._parent
+
     def _left_rotate(self, subtree_root: Node) -> Node:
-        print(f"Left rotate on {subtree_root}")
         new_root = subtree_root._right
         new_root._parent = subtree_root._parent
         subtree_root._right = new_root._left
         if new_root._left:
             new_root._left._parent = subtree_root
+        if new_root._parent:
+            if new_root._parent._left is subtree_root:
+                new_root._parent._left = new_root
+            else:
+                new_root._parent._right = new_root
         subtree_root._parent = new_root
         new_root._left = subtree_root
+        subtree_root._update_augmentation()
+        new_root._update_augmentation()
         return new_root
 
     def _right_rotate(self, subtree_root: Node):
-        print(f"Right rotate on {subtree_root}")
         new_root = subtree_root._left
         new_root._parent = subtree_root._parent
         subtree_root._left = new_root._right
         if new_root._right:
             new_root._right._parent = subtree_root
+        if new_root._parent:
+            if new_root._parent._left is subtree_root:
+                new_root._parent._left = new_root
+            else:
+                new_root._parent._right = new_root
         subtree_root._parent = new_root
         new_root._right = subtree_root
+        subtree_root._update_augmentation()
+        new_root._update_augmentation()
         return new_root
 
     def _rebalance_tree(self):
         if self._parent is None:
             self._color = NodeColor.BLACK
             return
+        if self._parent._color == NodeColor.BLACK:
+            return
         if self._parent._parent and self._parent._parent._left is self._parent:
             uncle_node = self._parent._parent._right
         elif (self._parent._parent and
@@ -66,7 +108,6 @@ class Node():
         else:  # uncle is BLACK
             if self._parent._parent._left is self._parent:
                 if self._parent._left is self:
-                    print(f"Left left case triggered by {self}")
                     grandparent = self._parent._parent
                     parent = self._parent
                     self._right_rotate(grandparent)
@@ -74,7 +115,6 @@ class Node():
                     grandparent._color, parent._color = \
                         parent._color, grandparent._color
                 else:  # self is right child of parent
-                    print(f"Left right case triggered by {self}")
                     self._left_rotate(self._parent)
                     self._parent._left = self
                     self._right_rotate(self._parent)
@@ -83,7 +123,6 @@ class Node():
                         self._color
             else:  # parent is right child of grandparent
                 if self._parent._right is self:
-                    print(f"Right right case triggered by {self}")
                     grandparent = self._parent._parent
                     parent = self._parent
                     self._left_rotate(grandparent)
@@ -91,7 +130,6 @@ class Node():
                     grandparent._color, parent._color = \
                         parent._color, grandparent._color
                 else:
-                    print(f"Right left case triggered by {self}")
                     self._right_rotate(self._parent)
                     self._parent._right = self
                     self._left_rotate(self._parent)
@@ -99,29 +137,36 @@ class Node():
                     self._color, self._left._color = self._left._color, \
                         self._color
 
+    def _add_child(self, value, right):
+        """
+        Attaches value as a new RED leaf on the given side and restores the
+        red black properties. Returns the new node.
+        """
+        new_node = self.__class__(value)
+        new_node._color = NodeColor.RED
+        new_node._parent = self
+        if right:
+            self._right = new_node
+        else:
+            self._left = new_node
+        new_node._update_path()
+        if self._color == NodeColor.RED:
+            new_node._rebalance_tree()
+        return new_node
+
     def insert(self, value):
         if self._key == value:
             return False
         elif self._key < value:
             if self._right:
                 return self._right.insert(value)
-            else:
-                self._right = Node(value)
-                self._right._color = NodeColor.RED
-                self._right._parent = self
-                if self._color == NodeColor.RED:
-                    self._right._rebalance_tree()
-                return True
+            self._add_child(value, right=True)
+            return True
         else:
             if self._left:
                 return self._left.insert(value)
-            else:
-                self._left = Node(value)
-                self._left._color = NodeColor.RED
-                self._left._parent = self
-                if self._color == NodeColor.RED:
-                    self._left._rebalance_tree()
-                return True
+            self._add_child(value, right=False)
+            return True
 
     def get_inorder(self):
         result = []
@@ -157,30 +202,6 @@ class Node():
         return len([1 for child in [self._right, self._left]
                     if child is not None])
 
-    def delete(self, key) -> Node:
-        node = self.find(key)
-        if node:
-            if node._get_child_no() == 2:  # node has 2 children
-                successors_key = node._right.min()._key
-                node._right.delete(successors_key)
-                node._key = successors_key
-                return
-            elif node._get_child_no() == 1:
-                if ((node._color == NodeColor.RED) or
-                    (node._left and node._left._color == NodeColor.RED) or
-                    (node._right and node._right._color == NodeColor.RED)):
-                    node._color = NodeColor.BLACK
-                    if node._left:
-                        successors_key = node._left._key
-                    else:  # node._right
-                        successors_key = node._right._key
-                    node.delete(successors_key)
-                    node._key = successors_key
-            else:  # node doesn't have any child
-                return
-        else:
-            return None
-
     def find(self, key) -> Node:
         if self._key == key:
             return self
@@ -201,9 +222,54 @@ class RedBlackTree():
        always have a BLACK parent node and BLACK child nodes
     4. every branch path from the root node in the tree to a null pointer
        passes through the exact same number of BLACK nodes.
+
+    The nodes holding the smallest and the largest key are cached, so min,
+    max, peek_min and peek_max take O(1) and the tree can serve as a
+    priority queue through pop_min and pop_max.
+
+    An optional membership_filter (CountingBloomFilter) is kept in sync with
+    the keys and lets find and `in` return early for keys which are
+    definitely not in the tree.
     """
-    def __init__(self):
+    _node_class = Node
+
+    def __init__(self, membership_filter=None):
         self._root = None
+        self._min_node = None
+        self._max_node = None
+        self._filter = membership_filter
+
+    @classmethod
+    def from_sorted(cls, keys) -> RedBlackTree:
+        """
+        Builds a balanced tree in O(n) from keys which are already sorted
+        and unique. Nodes on the deepest level are RED unless that level is
+        full, which keeps the black height equal on every path.
+        """
+        keys = list(keys)
+        red_depth = len(keys).bit_length() - 1
+        if len(keys) == 2 ** (red_depth + 1) - 1:  # perfect tree
+            red_depth = -1
+
+        def build(low, high, parent, depth):
+            if low > high:
+                return None
+            middle = (low + high) // 2
+            node = cls._node_class(keys[middle])
+            node._parent = parent
+            if depth == red_depth and depth > 0:
+                node._color = NodeColor.RED
+            node._left = build(low, middle - 1, node, depth + 1)
+            node._right = build(middle + 1, high, node, depth + 1)
+            node._update_augmentation()
+            return node
+
+        tree = cls()
+        tree._root = build(0, len(keys) - 1, None, 0)
+        if tree._root:
+            tree._min_node = tree._root.min()
+            tree._max_node = tree._root.max()
+        return tree
 
     def _find_new_root(self) -> Node:
         new_root = self._root
@@ -218,21 +284,118 @@ class RedBlackTree():
         if isinstance(values, Iterable):
             ret_val = True
             for value in values:
-                if self.empty():
-                    self._root = Node(value)
-                else:
-                    ret_val = ret_val and self._root.insert(value)
-                    if ret_val:
-                        self._root = self._find_new_root()
+                inserted = self.insert_element(value)
+                ret_val = ret_val and inserted
             return ret_val
         else:
-            if self.empty():
-                self._root = Node(values)
-                return True
-            else:
-                ret_val = self._root.insert(values)
-                self._root = self._find_new_root()
-                return ret_val
+            return self.insert_element(values)
+
+    def insert_element(self, value) -> bool:
+        """
+        Inserts value and returns whether it was new. Values larger than
+        the current maximum, such as timestamps arriving in order, are
+        attached to the cached rightmost node without descending from the
+        root; recoloring and rotations then take amortized O(1).
+        """
+        if self.empty():
+            self._root = self._node_class(value)
+            self._min_node = self._max_node = self._root
+        elif value > self._max_node._key:
+            self._max_node = self._max_node._add_child(value, right=True)
+            self._root = self._find_new_root()
+        elif not self._root.insert(value):
+            return False
+        else:
+            self._root = self._find_new_root()
+            # rotations never move keys between nodes, so the cached
+            # minimum changes only when the new key is a new minimum
+            if value < self._min_node._key:
+                self._min_node = self._root.min()
+        if self._filter is not None:
+            self._filter.add(value)
+        return True
+
+    async def insert_async(self, values, batch_size=1024, time_slice=0.005):
+        """
+        Inserts the keys of an iterable or async iterable, yielding to the
+        event loop between batches. See async_ingest.insert_async.
+        """
+        return await async_ingest.insert_async(
+            self, values, batch_size, time_slice)
+
+    async def load_async(self, keys, executor=None):
+        """
+        Bulk loads keys into the empty tree off the event loop. See
+        async_ingest.load_async.
+        """
+        await async_ingest.load_async(self, keys, executor)
+
+    def copy(self, deep=False) -> RedBlackTree:
+        """
+        Returns a structural copy of the tree built in a single iterative
+        pass. Keys are shared with this tree unless deep is set.
+        """
+        tree = self.__class__()
+        tree._root = clone_subtree(
+            self._root, copy.deepcopy if deep else None)
+        if tree._root:
+            tree._min_node = tree._root.min()
+            tree._max_node = tree._root.max()
+        if self._filter is not None:
+            tree._filter = self._filter.copy()
+        return tree
+
+    def keys(self, reverse=False):
+        """
+        Yields the keys in ascending (or descending) order using O(1)
+        auxiliary memory.
+        """
+        for node in inorder_nodes(self._root, reverse):
+            yield node._key
+
+    def range(self, low=None, high=None):
+        """
+        Yields keys k with low <= k <= high in ascending order. Either bound
+        may be None to leave that side open.
+        """
+        for node in range_nodes(self._root, low, high):
+            yield node._key
+
+    def floor(self, key):
+        """
+        Returns the largest key <= key or None.
+        """
+        node = before(self._root, upper_bound(self._root, key))
+        return node._key if node else None
+
+    def ceiling(self, key):
+        """
+        Returns the smallest key >= key or None.
+        """
+        node = lower_bound(self._root, key)
+        return node._key if node else None
+
+    def predecessor(self, key):
+        """
+        Returns the largest key < key or None.
+        """
+        node = before(self._root, lower_bound(self._root, key))
+        return node._key if node else None
+
+    def successor(self, key):
+        """
+        Returns the smallest key > key or None.
+        """
+        node = upper_bound(self._root, key)
+        return node._key if node else None
+
+    def nearest(self, key, count=1):
+        """
+        Returns the count keys closest to key, closest first, in
+        O(log n + count). Keys have to support subtraction.
+        """
+        return [node._key for node in
+                nearest_nodes(self._root, key, count)]
 
     def get_inorder(self):
         if self.empty():
@@ -249,30 +412,199 @@ class RedBlackTree():
     def max(self):
         if self.empty():
             return None
-        return self._root.max()._key
+        return self._max_node._key
 
     def min(self):
         if self.empty():
             return None
-        return self._root.min()._key
+        return self._min_node._key
+
+    def peek_min(self):
+        return self.min()
+
+    def peek_max(self):
+        return self.max()
+
+    def pop_min(self):
+        """
+        Removes and returns the smallest key, None if the tree is empty.
+        """
+        if self.empty():
+            return None
+        node = self._min_node
+        self._delete_node(node)
+        return node._key
 
-    def delete(self, key):
+    def pop_max(self):
+        """
+        Removes and returns the largest key, None if the tree is empty.
+        """
         if self.empty():
             return None
+        node = self._max_node
+        self._delete_node(node)
+        return node._key
+
+    def clear(self):
+        """
+        Removes all keys, freeing the nodes without the garbage collector.
+        See unlink_subtree.
+        """
+        unlink_subtree(self._root)
+        self._root = None
+        self._min_node = self._max_node = None
+        if self._filter is not None:
+            self._filter.clear()
+
+    def freeze(self) -> FrozenIndex:
+        return FrozenIndex.from_sorted(
+            node._key for node in inorder_nodes(self._root))
+
+    def _rotate_left(self, node):
+        new_root = node._left_rotate(node)
+        if new_root._parent is None:
+            self._root = new_root
+
+    def _rotate_right(self, node):
+        new_root = node._right_rotate(node)
+        if new_root._parent is None:
+            self._root = new_root
+
+    def _transplant(self, node, replacement):
+        """
+        Puts replacement (which may be None) in place of node.
+        """
+        if node._parent is None:
+            self._root = replacement
+        elif node._parent._left is node:
+            node._parent._left = replacement
         else:
-            return self._root.delete()
+            node._parent._right = replacement
+        if replacement:
+            replacement._parent = node._parent
+
+    def delete(self, key) -> bool:
+        if self.empty():
+            return False
+        node = self._root.find(key)
+        if node is None:
+            return False
+        self._delete_node(node)
+        return True
+
+    def _delete_node(self, node):
+        if self._filter is not None:
+            self._filter.remove(node._key)
+        if node is self._min_node:
+            self._min_node = node._right.min() if node._right \
+                else node._parent
+        if node is self._max_node:
+            self._max_node = node._left.max() if node._left \
+                else node._parent
+        removed_color = node._color
+        if node._left is None:
+            child, parent = node._right, node._parent
+            self._transplant(node, node._right)
+        elif node._right is None:
+            child, parent = node._left, node._parent
+            self._transplant(node, node._left)
+        else:  # node has 2 children, its successor takes its place
+            successor = node._right.min()
+            removed_color = successor._color
+            child = successor._right
+            if successor._parent is node:
+                parent = successor
+            else:
+                parent = successor._parent
+                self._transplant(successor, successor._right)
+                successor._right = node._right
+                successor._right._parent = successor
+            self._transplant(node, successor)
+            successor._left = node._left
+            successor._left._parent = successor
+            successor._color = node._color
+        node._left = node._right = node._parent = None
+        if parent:
+            parent._update_path()
+        if removed_color == NodeColor.BLACK:
+            self._delete_fixup(child, parent)
+
+    @staticmethod
+    def _is_black(node):
+        return node is None or node._color == NodeColor.BLACK
+
+    def _delete_fixup(self, node, parent):
+        """
+        Restores the black height after a BLACK node was removed above node,
+        which may be None, the child of parent.
+        """
+        while node is not self._root and self._is_black(node):
+            if node is parent._left:
+                sibling = parent._right
+                if sibling._color == NodeColor.RED:
+                    sibling._color = NodeColor.BLACK
+                    parent._color = NodeColor.RED
+                    self._rotate_left(parent)
+                    sibling = parent._right
+                if self._is_black(sibling._left) and \
+                        self._is_black(sibling._right):
+                    sibling._color = NodeColor.RED
+                    node, parent = parent, parent._parent
+                else:
+                    if self._is_black(sibling._right):
+                        sibling._left._color = NodeColor.BLACK
+                        sibling._color = NodeColor.RED
+                        self._rotate_right(sibling)
+                        sibling = parent._right
+                    sibling._color = parent._color
+                    parent._color = NodeColor.BLACK
+                    sibling._right._color = NodeColor.BLACK
+                    self._rotate_left(parent)
+                    node = self._root
+            else:  # mirror image of the case above
+                sibling = parent._left
+                if sibling._color == NodeColor.RED:
+                    sibling._color = NodeColor.BLACK
+                    parent._color = NodeColor.RED
+                    self._rotate_right(parent)
+                    sibling = parent._left
+                if self._is_black(sibling._left) and \
+                        self._is_black(sibling._right):
+                    sibling._color = NodeColor.RED
+                    node, parent = parent, parent._parent
+                else:
+                    if self._is_black(sibling._left):
+                        sibling._right._color = NodeColor.BLACK
+                        sibling._color = NodeColor.RED
+                        self._rotate_left(sibling)
+                        sibling = parent._left
+                    sibling._color = parent._color
+                    parent._color = NodeColor.BLACK
+                    sibling._left._color = NodeColor.BLACK
+                    self._rotate_right(parent)
+                    node = self._root
+        if node:
+            node._color = NodeColor.BLACK
+
+    def _find_node(self, key) -> Node:
+        if self._filter is not None and not self._filter.might_contain(key):
+            return None
+        node = self._root.find(key)
+        if node is None and self._filter is not None:
+            self._filter.false_positives += 1
+        return node
 
     def find(self, key) -> bool:
         if self.empty():
             return False
         else:
-            return self._root.find(key)
+            return self._find_node(key)
 
     def __contains__(self, key) -> bool:
         if self.empty():
             return False
         else:
-            return self._root.find(key) is not None
+            return self._find_node(key) is not None
 
 
 if __name__ == '__main__':
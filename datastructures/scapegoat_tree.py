@@ -0,0 +1,161 @@
+"""
+Implementation of scapegoat tree
+"""
+from __future__ import annotations
+import math
+from datastructures.binary_search_tree import BinarySearchTree, Node
+from datastructures.tree_traversal import inorder_nodes
+
+
+class ScapegoatTree(BinarySearchTree):
+    """
+    Balanced binary search tree built on BinarySearchTree's nodes, which
+    carry no height, colour or size field. The tree only keeps its number
+    of keys and the largest number it held since the last full rebuild.
+
+    An insertion deeper than log(n) / log(1 / alpha) climbs back up to the
+    first ancestor whose child holds more than alpha of its subtree, the
+    scapegoat, and rebuilds that subtree perfectly balanced in linear time.
+    Once deletions shrink the tree below alpha of its recorded maximum the
+    whole tree is rebuilt. Both keep the height at O(log n) and make every
+    operation O(log n) amortized; lookups are O(log n) in the worst case.
+    alpha between 0.5 and 1 trades lookup depth for rebuild frequency.
+    """
+    def __init__(self, alpha=2 / 3):
+        super().__init__()
+        if not 0.5 < alpha < 1:
+            raise ValueError("alpha must be between 0.5 and 1")
+        self._alpha = alpha
+        self._size = 0
+        self._max_size = 0
+        self.rebuilds = 0
+
+    def __len__(self):
+        return self._size
+
+    def _depth_limit(self):
+        return math.floor(math.log(self._size, 1 / self._alpha))
+
+    def insert(self, data) -> bool:
+        if self.empty():
+            self._root = Node(data)
+            self._size = self._max_size = 1
+            return True
+        node = self._root
+        depth = 1
+        while True:
+            if data == node._data:
+                return False
+            child = node._left if data < node._data else node._right
+            if child is None:
+                break
+            node = child
+            depth += 1
+        new_node = Node(data)
+        new_node._parent = node
+        if data < node._data:
+            node._left = new_node
+        else:
+            node._right = new_node
+        self._size += 1
+        self._max_size = max(self._max_size, self._size)
+        if depth > self._depth_limit():
+            self._rebuild(self._scapegoat(new_node))
+        return True
+
+    def _scapegoat(self, node):
+        """
+        Returns the lowest ancestor of the freshly inserted node which is
+        not alpha weight balanced. Only the sibling subtrees along the way
+        are counted, so the cost is linear in the size of the scapegoat.
+        """
+        size = 1
+        while node._parent:
+            parent = node._parent
+            sibling = parent._right if parent._left is node else parent._left
+            parent_size = size + 1 + _count(sibling)
+            if size > self._alpha * parent_size:
+                return parent
+            node, size = parent, parent_size
+        # a too deep node always has an unbalanced ancestor, the root is
+        # only reached here if the counters were corrupted
+        return node
+
+    def _rebuild(self, root):
+        """
+        Relinks the nodes of the subtree at root into a perfectly balanced
+        subtree in place, without allocating new nodes.
+        """
+        parent = root._parent
+        nodes = list(inorder_nodes(root))
+        subtree = _link_balanced(nodes)
+        subtree._parent = parent
+        if parent is None:
+            self._root = subtree
+        elif parent._left is root:
+            parent._left = subtree
+        else:
+            parent._right = subtree
+        self.rebuilds += 1
+
+    def delete(self, key) -> bool:
+        if not super().delete(key):
+            return False
+        self._size -= 1
+        if self._size < self._alpha * self._max_size:
+            if self._root:
+                self._rebuild(self._root)
+            self._max_size = self._size
+        return True
+
+    def clear(self):
+        super().clear()
+        self._size = self._max_size = 0
+
+    def copy(self, deep=False) -> ScapegoatTree:
+        tree = super().copy(deep)
+        tree._alpha = self._alpha
+        tree._size = tree._max_size = self._size
+        return tree
+
+    def height(self):
+        """
+        Returns the number of nodes on the longest root to leaf path.
+        """
+        height = 0
+        level = [self._root] if self._root else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node._left, node._right) if child]
+        return height
+
+
+def _count(root):
+    return sum(1 for _ in inorder_nodes(root))
+
+
+def _link_balanced(nodes):
+    """
+    Links the nodes, given in key order, into a perfectly balanced tree
+    and returns its root. The root's parent is left for the caller.
+    """
+    middle = len(nodes) // 2
+    root = nodes[middle]
+    # (parent, is left child, first, last) of the slices still to link
+    pending = [(root, True, 0, middle), (root, False, middle + 1, len(nodes))]
+    while pending:
+        parent, left, first, last = pending.pop()
+        if first == last:
+            child = None
+        else:
+            middle = (first + last) // 2
+            child = nodes[middle]
+            child._parent = parent
+            pending.append((child, True, first, middle))
+            pending.append((child, False, middle + 1, last))
+        if left:
+            parent._left = child
+        else:
+            parent._right = child
+    return root
@@ -0,0 +1,198 @@
+"""
+Implementation of range partitioned ordered map with one lock per shard
+"""
+from __future__ import annotations
+import bisect
+import threading
+from datastructures.red_black_tree import RedBlackTree
+
+
+class _Shard():
+    """
+    Keys k with low <= k < high (None for an open side), ordered in a tree,
+    with their values in a dict.
+    """
+    def __init__(self, low, high, tree, values):
+        self.low = low
+        self.high = high
+        self.tree = tree
+        self.values = values
+        self.lock = threading.Lock()
+        # set once the shard was replaced by a split or merge
+        self.retired = False
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ShardedOrderedMap():
+    """
+    Ordered map split by key range into shards, each an independent tree
+    (RedBlackTree by default, or AVL) with its own lock. Point operations
+    route to one shard through a binary search over the shard boundaries
+    and lock only that shard, so threads working on different key ranges
+    do not wait for each other.
+
+    A shard growing past max_shard_size is split at its median, and one
+    shrinking below a quarter of it is merged into a neighbour when both
+    fit into half of it, so splits and merges cannot alternate. The list
+    of shards is replaced as a whole under a layout lock; an operation
+    which locked a shard that got retired meanwhile simply retries.
+
+    range() collects the shards one after another in key order, each under
+    its own lock, so every shard's part is consistent but the scan is not
+    a snapshot of the whole map.
+    """
+    def __init__(self, max_shard_size=4096, tree_class=RedBlackTree):
+        if max_shard_size < 4:
+            raise ValueError("max_shard_size must be at least 4")
+        self._max_shard_size = max_shard_size
+        self._tree_class = tree_class
+        self._layout_lock = threading.Lock()
+        # (lower bounds of shards[1:], shards)
+        self._layout = ([], (_Shard(None, None, tree_class(), {}),))
+        self.splits = 0
+        self.merges = 0
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._layout[1])
+
+    def __contains__(self, key) -> bool:
+        shard = self._lock_shard(key)
+        try:
+            return key in shard.values
+        finally:
+            shard.lock.release()
+
+    def __iter__(self):
+        return (key for key, _ in self.range())
+
+    @property
+    def shard_count(self):
+        return len(self._layout[1])
+
+    def _lock_shard(self, key):
+        """
+        Returns the live shard covering key with its lock held.
+        """
+        while True:
+            bounds, shards = self._layout
+            shard = shards[bisect.bisect_right(bounds, key)]
+            shard.lock.acquire()
+            if not shard.retired:
+                return shard
+            shard.lock.release()
+
+    def get(self, key, default=None):
+        shard = self._lock_shard(key)
+        try:
+            return shard.values.get(key, default)
+        finally:
+            shard.lock.release()
+
+    def put(self, key, value) -> bool:
+        """
+        Maps key to value and returns whether key is new.
+        """
+        shard = self._lock_shard(key)
+        try:
+            new = key not in shard.values
+            if new:
+                shard.tree.insert_element(key)
+            shard.values[key] = value
+            size = len(shard)
+        finally:
+            shard.lock.release()
+        if size > self._max_shard_size:
+            self._split(shard)
+        return new
+
+    def delete(self, key) -> bool:
+        shard = self._lock_shard(key)
+        try:
+            if key not in shard.values:
+                return False
+            del shard.values[key]
+            shard.tree.delete(key)
+            size = len(shard)
+        finally:
+            shard.lock.release()
+        if size < self._max_shard_size // 4:
+            self._merge(shard)
+        return True
+
+    def range(self, low=None, high=None):
+        """
+        Returns the list of (key, value) pairs with low <= key <= high in
+        key order. Either bound may be None to leave that side open.
+        """
+        result = []
+        while True:
+            start = result[-1][0] if result else low
+            bounds, shards = self._layout
+            first = 0 if start is None else bisect.bisect_right(bounds, start)
+            for shard in shards[first:]:
+                if high is not None and shard.low is not None and \
+                        shard.low > high:
+                    return result
+                with shard.lock:
+                    if shard.retired:  # layout changed, resume after last
+                        break
+                    for key in shard.tree.range(start, high):
+                        if result and key <= result[-1][0]:
+                            continue
+                        result.append((key, shard.values[key]))
+            else:
+                return result
+
+    def _replace(self, old, new):
+        """
+        Publishes a layout in which the adjacent shards old are replaced by
+        new. Needs the layout lock and the locks of old.
+        """
+        shards = self._layout[1]
+        index = shards.index(old[0])
+        shards = shards[:index] + tuple(new) + shards[index + len(old):]
+        self._layout = ([shard.low for shard in shards[1:]], shards)
+        for shard in old:
+            shard.retired = True
+
+    def _split(self, shard):
+        with self._layout_lock, shard.lock:
+            if shard.retired or len(shard) <= self._max_shard_size:
+                return
+            keys = list(shard.tree.keys())
+            middle = len(keys) // 2
+            pivot = keys[middle]
+            halves = []
+            for low, high, part in ((shard.low, pivot, keys[:middle]),
+                                    (pivot, shard.high, keys[middle:])):
+                values = {key: shard.values[key] for key in part}
+                halves.append(_Shard(low, high,
+                                     self._tree_class.from_sorted(part),
+                                     values))
+            self._replace([shard], halves)
+            self.splits += 1
+
+    def _merge(self, shard):
+        with self._layout_lock:
+            shards = self._layout[1]
+            if shard.retired or len(shards) == 1:
+                return
+            index = shards.index(shard)
+            neighbours = [i for i in (index - 1, index + 1)
+                          if 0 <= i < len(shards)]
+            other = min(neighbours, key=lambda i: len(shards[i]))
+            left, right = sorted((shard, shards[other]),
+                                 key=lambda part: shards.index(part))
+            # locks are always taken from left to right
+            with left.lock, right.lock:
+                if len(left) + len(right) > self._max_shard_size // 2:
+                    return
+                keys = list(left.tree.keys()) + list(right.tree.keys())
+                values = dict(left.values)
+                values.update(right.values)
+                merged = _Shard(left.low, right.high,
+                                self._tree_class.from_sorted(keys), values)
+                self._replace([left, right], [merged])
+                self.merges += 1
@@ -0,0 +1,148 @@
+"""
+Implementation of skip list
+"""
+from __future__ import annotations
+import random
+from collections.abc import Iterable
+
+
+class Node():
+    def __init__(self, key, level):
+        self._key = key
+        self._next = [None] * level
+
+    def __str__(self):
+        return f"{self._key} [{len(self._next)}]"
+
+
+class SkipList():
+    """
+    Ordered set kept in a skip list. Each node is promoted to the next level
+    with the given probability, so operations take O(log n) expected time
+    without any rebalancing. Inserts touch only the predecessors of the new
+    node and keys larger than the current maximum are linked directly
+    behind the tail, which makes sequential appends cheap.
+
+    Passing a seed makes the levels, and therefore the shape of the list,
+    reproducible between runs.
+
+    Unlike AVL, which iterates over (key, height) pairs, iteration yields
+    bare keys since skip list nodes have no height. Code swapping one for
+    the other should iterate over range() of the skip list, which matches
+    the keys the trees produce.
+    """
+    def __init__(self, probability=0.5, max_level=32, seed=None):
+        if not 0 < probability < 1:
+            raise ValueError("probability must be between 0 and 1")
+        if max_level < 1:
+            raise ValueError("max_level must be positive")
+        self._probability = probability
+        self._max_level = max_level
+        self._random = random.Random(seed)
+        self._head = Node(None, max_level)
+        self._tail = [self._head] * max_level
+        self._level = 1
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def __iter__(self):
+        node = self._head._next[0]
+        while node:
+            yield node._key
+            node = node._next[0]
+
+    def __str__(self):
+        return ", ".join(str(key) for key in self)
+
+    def empty(self):
+        return self._size == 0
+
+    def _random_level(self):
+        level = 1
+        while (level < self._max_level and
+               self._random.random() < self._probability):
+            level += 1
+        return level
+
+    def _find_predecessors(self, key):
+        """
+        Returns for every level the last node with key smaller than key.
+        """
+        update = [self._head] * self._max_level
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node._next[level] and node._next[level]._key < key:
+                node = node._next[level]
+            update[level] = node
+        return update
+
+    def insert(self, items):
+        if isinstance(items, Iterable) and not isinstance(items, str):
+            for item in items:
+                self.insert_element(item)
+        else:
+            self.insert_element(items)
+
+    def insert_element(self, key) -> bool:
+        last = self._tail[0]
+        if last is self._head or last._key < key:  # append behind the tail
+            update = list(self._tail)
+        else:
+            update = self._find_predecessors(key)
+            candidate = update[0]._next[0]
+            if candidate and candidate._key == key:
+                return False
+        level = self._random_level()
+        self._level = max(self._level, level)
+        new_node = Node(key, level)
+        for i in range(level):
+            new_node._next[i] = update[i]._next[i]
+            update[i]._next[i] = new_node
+            if new_node._next[i] is None:
+                self._tail[i] = new_node
+        self._size += 1
+        return True
+
+    def find(self, key) -> bool:
+        candidate = self._find_predecessors(key)[0]._next[0]
+        return candidate is not None and candidate._key == key
+
+    def delete(self, key) -> bool:
+        update = self._find_predecessors(key)
+        node = update[0]._next[0]
+        if node is None or node._key != key:
+            return False
+        for i in range(len(node._next)):
+            update[i]._next[i] = node._next[i]
+            if self._tail[i] is node:
+                self._tail[i] = update[i]
+        while self._level > 1 and self._head._next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def min(self):
+        node = self._head._next[0]
+        return node._key if node else None
+
+    def max(self):
+        node = self._tail[0]
+        return None if node is self._head else node._key
+
+    def range(self, low=None, high=None):
+        """
+        Yields keys k with low <= k <= high in ascending order. Either bound
+        may be None to leave that side open.
+        """
+        if low is None:
+            node = self._head._next[0]
+        else:
+            node = self._find_predecessors(low)[0]._next[0]
+        while node and (high is None or node._key <= high):
+            yield node._key
+            node = node._next[0]
@@ -0,0 +1,202 @@
+"""
+Implementation of splay tree
+"""
+from __future__ import annotations
+from datastructures.binary_search_tree import BinarySearchTree, Node
+
+
+class SplayTree(BinarySearchTree):
+    """
+    Self-adjusting binary search tree built on BinarySearchTree's nodes.
+    Insert and delete move the last node they touched to the root with zig,
+    zig-zig and zig-zag rotations; find does so only for nodes deeper than
+    log2(n), as restructuring the tree around shallow nodes costs more than
+    it saves. Operations cost O(log n) amortized and frequently accessed
+    keys stay close to the root.
+
+    Each splay step still costs several Python level pointer updates. On
+    bench_skewed_access with 100000 keys, finds run at about 0.9 times the
+    AVL rate for Zipf skew 1.2 and about 1.1 times for skew 1.5, so the
+    tree only pays off for strongly skewed access.
+    """
+    def __init__(self):
+        super().__init__()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _rotate(self, node):
+        """
+        Rotates node above its parent.
+        """
+        parent = node._parent
+        grandparent = parent._parent
+        if parent._left is node:
+            parent._left = node._right
+            if node._right:
+                node._right._parent = parent
+            node._right = parent
+        else:
+            parent._right = node._left
+            if node._left:
+                node._left._parent = parent
+            node._left = parent
+        parent._parent = node
+        node._parent = grandparent
+        if grandparent is None:
+            self._root = node
+        elif grandparent._left is parent:
+            grandparent._left = node
+        else:
+            grandparent._right = node
+
+    def _splay(self, node):
+        # the zig-zig and zig-zag steps relink the three nodes directly
+        # instead of going through two calls of _rotate
+        while node._parent:
+            parent = node._parent
+            grandparent = parent._parent
+            if grandparent is None:  # zig
+                self._rotate(node)
+                return
+            great = grandparent._parent
+            if grandparent._left is parent:
+                if parent._left is node:  # zig-zig
+                    inner, outer = node._right, parent._right
+                    parent._left, parent._right = inner, grandparent
+                    grandparent._left = outer
+                    grandparent._parent = parent
+                    node._right = parent
+                    parent._parent = node
+                else:  # zig-zag
+                    inner, outer = node._left, node._right
+                    parent._right = inner
+                    grandparent._left = outer
+                    node._left, node._right = parent, grandparent
+                    parent._parent = grandparent._parent = node
+            else:
+                if parent._right is node:  # zig-zig
+                    inner, outer = node._left, parent._left
+                    parent._right, parent._left = inner, grandparent
+                    grandparent._right = outer
+                    grandparent._parent = parent
+                    node._left = parent
+                    parent._parent = node
+                else:  # zig-zag
+                    inner, outer = node._right, node._left
+                    parent._left = inner
+                    grandparent._right = outer
+                    node._right, node._left = parent, grandparent
+                    parent._parent = grandparent._parent = node
+            if inner:
+                inner._parent = parent
+            if outer:
+                outer._parent = grandparent
+            node._parent = great
+            if great is None:
+                self._root = node
+            elif great._left is grandparent:
+                great._left = node
+            else:
+                great._right = node
+
+    def _access(self, key, splay_shallow=True) -> Node:
+        """
+        Returns the node holding key, or the last node on the search path if
+        key is not in the tree, after splaying it to the root. Unless
+        splay_shallow is set, a node within log2(n) of the root stays where
+        it is.
+        """
+        node = self._root
+        depth = 0
+        while True:
+            if key == node._data:
+                break
+            child = node._left if key < node._data else node._right
+            if child is None:
+                break
+            node = child
+            depth += 1
+        if splay_shallow or depth > self._size.bit_length():
+            self._splay(node)
+        return node
+
+    def __contains__(self, key) -> bool:
+        return self.find(key)
+
+    def find(self, key) -> bool:
+        if self.empty():
+            return False
+        return self._access(key, splay_shallow=False)._data == key
+
+    def insert(self, data) -> bool:
+        if self.empty():
+            self._root = Node(data)
+            self._size = 1
+            return True
+        node = self._access(data)
+        if node._data == data:
+            return False
+        new_node = Node(data)
+        # the old root becomes a child of the new one after splitting off
+        # the subtree on the other side of data
+        if data < node._data:
+            new_node._left = node._left
+            new_node._right = node
+            node._left = None
+        else:
+            new_node._right = node._right
+            new_node._left = node
+            node._right = None
+        for child in (new_node._left, new_node._right):
+            if child:
+                child._parent = new_node
+        self._root = new_node
+        self._size += 1
+        return True
+
+    def delete(self, key) -> bool:
+        if self.empty():
+            return False
+        node = self._access(key)
+        if node._data != key:
+            return False
+        self._size -= 1
+        left, right = node._left, node._right
+        node._left = node._right = None
+        if left is None:
+            self._root = right
+            if right:
+                right._parent = None
+            return True
+        left._parent = None
+        self._root = left
+        self._splay(left.max())
+        self._root._right = right
+        if right:
+            right._parent = self._root
+        return True
+
+    def clear(self):
+        super().clear()
+        self._size = 0
+
+    def copy(self, deep=False) -> SplayTree:
+        tree = super().copy(deep)
+        tree._size = self._size
+        return tree
+
+    def min(self):
+        if self.empty():
+            return None
+        node = self._root.min()
+        self._splay(node)
+        return node
+
+    def max(self):
+        if self.empty():
+            return None
+        node = self._root.max()
+        self._splay(node)
+        return node
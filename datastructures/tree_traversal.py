@@ -0,0 +1,211 @@
+"""
+Traversal helpers shared by the binary tree implementations
+
+They work for every node class which keeps its children in _left and
+_right and its parent in _parent. Walks step from node to node through the
+parent pointers, so they need O(1) auxiliary memory and no recursion.
+The tree must not be modified while a walk is in progress.
+"""
+
+
+def leftmost(node):
+    while node._left:
+        node = node._left
+    return node
+
+
+def rightmost(node):
+    while node._right:
+        node = node._right
+    return node
+
+
+def successor(node):
+    """
+    Returns the node with the next larger key or None.
+    """
+    if node._right:
+        return leftmost(node._right)
+    while node._parent and node._parent._right is node:
+        node = node._parent
+    return node._parent
+
+
+def predecessor(node):
+    """
+    Returns the node with the next smaller key or None.
+    """
+    if node._left:
+        return rightmost(node._left)
+    while node._parent and node._parent._left is node:
+        node = node._parent
+    return node._parent
+
+
+def inorder_nodes(root, reverse=False):
+    """
+    Yields the nodes of the subtree rooted at root in ascending key order,
+    or descending if reverse is set.
+    """
+    if root is None:
+        return iter(())
+    return _descending(root) if reverse else _ascending(root)
+
+
+def _ascending(root):
+    node = leftmost(root)
+    while node:
+        yield node
+        if node._right:
+            node = leftmost(node._right)
+            continue
+        # climb until coming up from a left child, without leaving root
+        while node is not root and node._parent._right is node:
+            node = node._parent
+        node = None if node is root else node._parent
+
+
+def _descending(root):
+    node = rightmost(root)
+    while node:
+        yield node
+        if node._left:
+            node = rightmost(node._left)
+            continue
+        while node is not root and node._parent._left is node:
+            node = node._parent
+        node = None if node is root else node._parent
+
+
+def clone_subtree(root, copy_key=None):
+    """
+    Returns a copy of the subtree rooted at root. Every node is cloned with
+    all of its attributes (height, color, augmentation) and linked like the
+    original. The walk moves through both trees in lockstep, so it needs
+    O(1) auxiliary memory and no recursion.
+
+    Keys are shared between the trees unless copy_key is given, in which
+    case it is called on every key.
+    """
+    if root is None:
+        return None
+
+    def clone_node(node, parent):
+        clone = object.__new__(node.__class__)
+        clone.__dict__.update(node.__dict__)
+        clone._left = clone._right = None
+        clone._parent = parent
+        if copy_key is not None:
+            attribute = "_key" if "_key" in clone.__dict__ else "_data"
+            setattr(clone, attribute, copy_key(getattr(node, attribute)))
+        return clone
+
+    new_root = clone_node(root, None)
+    node, clone = root, new_root
+    while True:
+        # a clone without a child that the original has is not finished yet
+        if node._left and clone._left is None:
+            clone._left = clone_node(node._left, clone)
+            node, clone = node._left, clone._left
+        elif node._right and clone._right is None:
+            clone._right = clone_node(node._right, clone)
+            node, clone = node._right, clone._right
+        elif node is root:
+            return new_root
+        else:
+            node, clone = node._parent, clone._parent
+
+
+def unlink_subtree(root):
+    """
+    Clears the child and parent pointers of every node of the subtree
+    rooted at root, bottom up. Parent pointers make every tree one large
+    reference cycle; once it is broken, nodes no longer referenced from
+    elsewhere are freed by reference counting as soon as they are passed,
+    without waiting for the cyclic garbage collector.
+    """
+    node = root
+    while node:
+        if node._left:
+            node = node._left
+        elif node._right:
+            node = node._right
+        else:  # a leaf, cut it off and continue with its parent
+            parent = None if node is root else node._parent
+            node._parent = None
+            if parent and parent._left is node:
+                parent._left = None
+            elif parent:
+                parent._right = None
+            node = parent
+
+
+def lower_bound(root, key):
+    """
+    Returns the node with the smallest key >= key or None.
+    """
+    node, result = root, None
+    while node:
+        if node._key < key:
+            node = node._right
+        else:
+            result, node = node, node._left
+    return result
+
+
+def upper_bound(root, key):
+    """
+    Returns the node with the smallest key > key or None.
+    """
+    node, result = root, None
+    while node:
+        if node._key <= key:
+            node = node._right
+        else:
+            result, node = node, node._left
+    return result
+
+
+def before(root, node):
+    """
+    Returns the node preceding node, or the rightmost node of the tree if
+    node is None, so that before(root, lower_bound(root, key)) is the node
+    with the largest key < key.
+    """
+    if node is None:
+        return rightmost(root) if root else None
+    return predecessor(node)
+
+
+def nearest_nodes(root, key, count):
+    """
+    Returns up to count nodes whose keys are closest to key, closest first
+    and the smaller key first on ties. The walk starts at the descent
+    point and extends outwards in both directions through the parent
+    pointers, so it takes O(log n + count). Keys have to support
+    subtraction.
+    """
+    right = lower_bound(root, key)
+    left = before(root, right)
+    result = []
+    while len(result) < count and (left or right):
+        if right is None or left and key - left._key <= right._key - key:
+            result.append(left)
+            left = predecessor(left)
+        else:
+            result.append(right)
+            right = successor(right)
+    return result
+
+
+def range_nodes(root, low=None, high=None):
+    """
+    Yields the nodes with low <= key <= high in ascending order. Either bound
+    may be None to leave that side open.
+    """
+    if root is None:
+        return
+    node = leftmost(root) if low is None else lower_bound(root, low)
+    while node and (high is None or node._key <= high):
+        yield node
+        node = successor(node)
@@ -0,0 +1,204 @@
+"""
+Recording of operation traces and their replay against the data structures
+"""
+from __future__ import annotations
+import gzip
+import pickle
+import time
+import tracemalloc
+from collections.abc import Iterable
+
+INSERT, FIND, DELETE, SCAN = range(4)
+OPERATION_NAMES = ("insert", "find", "delete", "scan")
+
+# method name -> operation it is recorded as
+_RECORDED_METHODS = {
+    "insert": INSERT,
+    "insert_element": INSERT,
+    "push_back": INSERT,
+    "push_front": INSERT,
+    "find": FIND,
+    "__contains__": FIND,
+    "delete": DELETE,
+    "remove": DELETE,
+    "pop_front": DELETE,
+    "pop_back": DELETE,
+    "pop_min": DELETE,
+    "pop_max": DELETE,
+    "keys": SCAN,
+    "range": SCAN,
+}
+# methods whose result, not argument, is the affected key
+_POP_METHODS = ("pop_front", "pop_back", "pop_min", "pop_max")
+
+
+class TraceRecorder():
+    """
+    Wraps AVL, RedBlackTree, BinarySearchTree, LinkedList or
+    DoublyLinkedList and streams every insert, find, delete and scan made
+    through the wrapper to a gzip compressed trace file as (operation, key)
+    records. The key of a full scan is None and that of a range scan the
+    pair (low, high). Methods which are not traced are passed through
+    unchanged.
+    """
+    def __init__(self, structure, path):
+        self._structure = structure
+        self._file = gzip.open(path, "wb")
+        self._pickler = pickle.Pickler(self._file,
+                                       protocol=pickle.HIGHEST_PROTOCOL)
+        self.recorded = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def _record(self, operation, key=None):
+        self._pickler.dump((operation, key))
+        # records are independent, keeping the memo would only grow it
+        self._pickler.clear_memo()
+        self.recorded += 1
+
+    def __getattr__(self, name):
+        attribute = getattr(self._structure, name)
+        operation = _RECORDED_METHODS.get(name)
+        if operation is None or not callable(attribute):
+            return attribute
+
+        def traced(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            if name == "range":
+                bounds = dict(zip(("low", "high"), args), **kwargs)
+                self._record(operation,
+                             (bounds.get("low"), bounds.get("high")))
+            elif operation == SCAN:
+                self._record(operation)
+            elif name in _POP_METHODS:
+                if result is not None:
+                    self._record(operation, result)
+            elif (operation == INSERT and len(args) == 1 and
+                  isinstance(args[0], Iterable) and
+                  not isinstance(args[0], (str, tuple))):
+                for key in args[0]:
+                    self._record(operation, key)
+            else:
+                self._record(operation,
+                             args[-1] if args else
+                             next(iter(kwargs.values())))
+            return result
+        return traced
+
+    def __contains__(self, key):
+        self._record(FIND, key)
+        return key in self._structure
+
+    def __iter__(self):
+        self._record(SCAN)
+        return iter(self._structure)
+
+
+def read_trace(path):
+    """
+    Returns the list of (operation, key) records of a trace file.
+    """
+    records = []
+    with gzip.open(path, "rb") as trace_file:
+        while True:
+            try:
+                records.append(pickle.load(trace_file))
+            except EOFError:
+                return records
+
+
+def _list_nodes(structure):
+    node = structure._head
+    while node:
+        yield node
+        node = node.next
+
+
+def _in_range(keys, bounds):
+    low, high = bounds
+    return (key for key in keys
+            if (low is None or low <= key) and (high is None or key <= high))
+
+
+def _operations(structure):
+    """
+    Maps the traced operations onto the methods of structure. Range scans
+    use structure.range where it exists and filter a full scan otherwise.
+    """
+    if hasattr(structure, "push_back"):  # linked lists
+        def find(key):
+            return any(node.data == key for node in _list_nodes(structure))
+
+        def scan(bounds):
+            keys = (node.data for node in _list_nodes(structure))
+            for _ in keys if bounds is None else _in_range(keys, bounds):
+                pass
+        return (structure.push_back, find, structure.remove, scan)
+
+    def scan(bounds):
+        if bounds is None:
+            keys = structure.keys()
+        elif hasattr(structure, "range"):
+            keys = structure.range(*bounds)
+        else:
+            keys = _in_range(structure.keys(), bounds)
+        for _ in keys:
+            pass
+    insert = getattr(structure, "insert_element", structure.insert)
+    return (insert, structure.find, structure.delete, scan)
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def replay(records, factory):
+    """
+    Runs records against a fresh structure made by factory and returns a
+    report with throughput (operations per second), latency percentiles (in
+    seconds) and the peak memory allocated during the replay (in bytes).
+
+    The trace is replayed twice: once timed and once under tracemalloc,
+    whose bookkeeping would otherwise distort the timings.
+    """
+    structure = factory()
+    operations = _operations(structure)
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+    for operation, key in records:
+        before = clock()
+        operations[operation](key)
+        latencies.append(clock() - before)
+    elapsed = clock() - start
+
+    tracemalloc.start()
+    try:
+        structure = factory()
+        operations = _operations(structure)
+        for operation, key in records:
+            operations[operation](key)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    report = {
+        "operations": len(records),
+        "seconds": elapsed,
+        "throughput": len(records) / elapsed if elapsed else 0.0,
+        "peak_memory": peak_memory,
+    }
+    for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99),
+                           ("p999", 0.999)):
+        report[name] = _percentile(latencies, fraction) if latencies else 0.0
+    report["max"] = latencies[-1] if latencies else 0.0
+    return report
@@ -0,0 +1,68 @@
+import random
+import unittest
+from datastructures.adaptive_set import (READ_HEAVY, READ_ONLY, WRITE_HEAVY,
+                                         AdaptiveOrderedSet)
+
+
+class TestAdaptiveOrderedSet(unittest.TestCase):
+    def test_starts_write_heavy(self):
+        # GIVEN
+        ordered_set = AdaptiveOrderedSet([3, 1, 2, 3])
+        # THEN
+        self.assertEqual(ordered_set.mode, WRITE_HEAVY)
+        self.assertEqual(len(ordered_set), 3)
+        self.assertEqual(list(ordered_set), [1, 2, 3])
+
+    def test_migrates_with_workload(self):
+        # GIVEN
+        ordered_set = AdaptiveOrderedSet(range(100), sample_size=50)
+        # WHEN mostly reads
+        for key in range(200):
+            if key % 20 == 0:
+                ordered_set.insert(1000 + key)
+            ordered_set.find(key)
+        # THEN
+        self.assertEqual(ordered_set.mode, READ_HEAVY)
+        # WHEN only reads
+        for key in range(200):
+            self.assertEqual(ordered_set.find(key), key < 100)
+        # THEN
+        self.assertEqual(ordered_set.mode, READ_ONLY)
+        # WHEN a write arrives
+        self.assertTrue(ordered_set.insert(-1))
+        # THEN
+        self.assertEqual(ordered_set.mode, WRITE_HEAVY)
+        self.assertEqual(ordered_set.migrations,
+                         {WRITE_HEAVY: 1, READ_HEAVY: 1, READ_ONLY: 1})
+        self.assertEqual(ordered_set.min(), -1)
+        self.assertEqual(ordered_set.max(), 1180)
+
+    def test_matches_set_across_migrations(self):
+        # GIVEN
+        rng = random.Random(0)
+        ordered_set = AdaptiveOrderedSet(sample_size=16)
+        expected = set()
+        for step in range(5000):
+            key = rng.randrange(300)
+            # phases of writes, of reads and of reads only
+            phase = (step // 500) % 3
+            write = rng.random() < (0.7, 0.05, 0.0)[phase]
+            # WHEN
+            if write and rng.random() < 0.6:
+                self.assertEqual(ordered_set.insert(key), key not in expected)
+                expected.add(key)
+            elif write:
+                self.assertEqual(ordered_set.delete(key), key in expected)
+                expected.discard(key)
+            else:
+                self.assertEqual(key in ordered_set, key in expected)
+        # THEN
+        self.assertEqual(len(ordered_set), len(expected))
+        self.assertEqual(list(ordered_set.keys()), sorted(expected))
+        self.assertEqual(list(ordered_set.keys(reverse=True)),
+                         sorted(expected, reverse=True))
+        self.assertTrue(all(ordered_set.migrations.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import math
+import operator
+import random
+import unittest
+from datastructures.aggregate_tree import AggregateTree, Monoid
+
+SumTree = AggregateTree.with_monoid(Monoid(operator.add, 0))
+# (key, score) pairs, highest score
+MaxScoreTree = AggregateTree.with_monoid(
+    Monoid(max, -math.inf, measure=lambda key: key[1]))
+# not commutative: keys concatenated in order
+ConcatTree = AggregateTree.with_monoid(
+    Monoid(operator.add, "", measure=lambda key: key[0]))
+
+
+class TestAggregateTree(unittest.TestCase):
+    def check_aggregates(self, node, monoid):
+        if node is None:
+            return monoid.identity
+        expected = monoid.combine(
+            monoid.combine(self.check_aggregates(node._left, monoid),
+                           monoid.measure(node._key)),
+            self.check_aggregates(node._right, monoid))
+        self.assertEqual(node._aggregate, expected)
+        return expected
+
+    def test_requires_monoid(self):
+        with self.assertRaises(TypeError):
+            AggregateTree()
+        self.assertIs(AggregateTree.with_monoid(MaxScoreTree().monoid),
+                      MaxScoreTree)
+
+    def test_empty(self):
+        tree = SumTree()
+        self.assertEqual(tree.total(), 0)
+        self.assertEqual(tree.aggregate(1, 10), 0)
+
+    def test_sum(self):
+        # GIVEN
+        tree = SumTree()
+        # WHEN
+        tree.insert(range(1, 101))
+        # THEN
+        self.assertEqual(tree.total(), 5050)
+        self.assertEqual(tree.aggregate(10, 20), sum(range(10, 21)))
+        self.assertEqual(tree.aggregate(high=10), 55)
+        self.assertEqual(tree.aggregate(low=91), sum(range(91, 101)))
+        self.assertEqual(tree.aggregate(200, 300), 0)
+        self.assertEqual(tree.aggregate(20, 10), 0)
+
+    def test_max_score(self):
+        # GIVEN
+        tree = MaxScoreTree()
+        tree.insert([(1, 5), (2, 9), (3, 1), (4, 7), (5, 2)])
+        # THEN
+        self.assertEqual(tree.aggregate((2,), (4, math.inf)), 9)
+        self.assertEqual(tree.aggregate((3,), (5, math.inf)), 7)
+        # WHEN
+        tree.delete((2, 9))
+        tree.pop_max()
+        # THEN
+        self.assertEqual(tree.total(), 7)
+
+    def test_random_operations_keep_aggregates(self):
+        rng = random.Random(0)
+        for tree_class in (SumTree, ConcatTree):
+            tree = tree_class()
+            keys = set()
+            for _ in range(1500):
+                key = rng.randrange(300)
+                if tree_class is ConcatTree:
+                    key = (chr(ord("a") + key % 26) + str(key),)
+                if rng.random() < 0.6:
+                    tree.insert_element(key)
+                    keys.add(key)
+                else:
+                    tree.delete(key)
+                    keys.discard(key)
+            self.check_aggregates(tree._root, tree.monoid)
+            ordered = sorted(keys)
+            monoid = tree.monoid
+            for _ in range(100):
+                low, high = sorted(rng.sample(ordered, 2))
+                expected = monoid.identity
+                for key in ordered:
+                    if low <= key <= high:
+                        expected = monoid.combine(expected,
+                                                  monoid.measure(key))
+                self.assertEqual(tree.aggregate(low, high), expected)
+
+    def test_builders_keep_the_monoid(self):
+        # WHEN
+        built = SumTree.from_sorted(range(10))
+        copied = built.copy()
+        loaded = SumTree()
+        asyncio.run(loaded.load_async(range(10)))
+        # THEN
+        for tree in (built, copied, loaded):
+            self.assertIsInstance(tree, SumTree)
+            self.check_aggregates(tree._root, tree.monoid)
+            self.assertEqual(tree.aggregate(3, 6), 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from datastructures.avl_tree import AVL
+from datastructures.bloom_filter import CountingBloomFilter
+from datastructures.red_black_tree import RedBlackTree
+
+
+async def async_keys(keys):
+    for key in keys:
+        yield key
+
+
+class TestAsyncIngest(unittest.TestCase):
+    def setUp(self):
+        self.keys = list(range(2000))
+        random.Random(0).shuffle(self.keys)
+
+    def test_insert_async_yields_between_batches(self):
+        for tree_class in (AVL, RedBlackTree):
+            tree = tree_class()
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            async def main():
+                task = asyncio.get_running_loop().create_task(ticker())
+                inserted = await tree.insert_async(
+                    async_keys(self.keys + [0, 1]), batch_size=100)
+                task.cancel()
+                return inserted
+
+            # WHEN
+            inserted = asyncio.run(main())
+            # THEN
+            self.assertEqual(inserted, 2000)
+            self.assertGreaterEqual(len(ticks), 2000 // 100)
+            self.assertEqual(list(tree.keys()), sorted(self.keys))
+
+    def test_insert_async_from_plain_iterable(self):
+        # GIVEN
+        tree = RedBlackTree()
+        # WHEN
+        inserted = asyncio.run(tree.insert_async(self.keys))
+        # THEN
+        self.assertEqual(inserted, 2000)
+        self.assertEqual(tree.min(), 0)
+        self.assertEqual(tree.max(), 1999)
+
+    def test_load_async(self):
+        for tree_class in (AVL, RedBlackTree):
+            tree = tree_class(membership_filter=CountingBloomFilter(4000))
+
+            async def main():
+                load = asyncio.ensure_future(tree.load_async(self.keys * 2))
+                await asyncio.sleep(0)
+                tree.insert_element(5000)  # write while the build runs
+                await load
+
+            # WHEN
+            asyncio.run(main())
+            # THEN
+            self.assertEqual(list(tree.keys()),
+                             sorted(self.keys) + [5000])
+            self.assertTrue(tree.find(1234))
+            self.assertTrue(tree.find(5000))
+            self.assertFalse(tree.find(-1))
+            self.assertTrue(tree._filter.might_contain(1999))
+
+    def test_load_async_in_process_pool(self):
+        # GIVEN
+        tree = AVL()
+        # WHEN
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            asyncio.run(tree.load_async(self.keys, executor))
+        # THEN
+        self.assertEqual(list(tree.keys()), sorted(self.keys))
+        self.assertEqual(tree._root._height, 10)
+
+    def test_load_async_requires_empty_tree(self):
+        # GIVEN
+        tree = RedBlackTree()
+        tree.insert_element(1)
+        # THEN
+        with self.assertRaises(ValueError):
+            asyncio.run(tree.load_async([2, 3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import random
 import unittest
 from datastructures.avl_tree import AVL, Node
+from tests.tree_invariants import avl_height
 
 
 class TestNode(unittest.TestCase):
@@ -153,6 +155,20 @@ class TestAVL(unittest.TestCase):
             result.append(element)
         self.assertListEqual(result, [(1, 0), (2, 1), (4, 0), (6, 2), (8, 0)])
 
+    def test_range(self):
+        # GIVEN
+        avl = AVL()
+        # THEN
+        self.assertListEqual(list(avl.range(1, 5)), [])
+        # WHEN
+        avl.insert([4, 6, 8, 2, 1])
+        # THEN
+        self.assertListEqual(list(avl.range(2, 6)), [2, 4, 6])
+        self.assertListEqual(list(avl.range(3, 7)), [4, 6])
+        self.assertListEqual(list(avl.range(high=4)), [1, 2, 4])
+        self.assertListEqual(list(avl.range(5)), [6, 8])
+        self.assertListEqual(list(avl.range(9)), [])
+
     def test_delete(self):
         # GIVEN
         avl = AVL()
@@ -190,3 +206,45 @@ class TestAVL(unittest.TestCase):
         # THEN
         self.assertListEqual(avl.get_key_height_inorder(), [(0, 0), (2, 1),
                              (4, 2), (5, 0)])
+
+    def test_random_insert_and_delete_keep_tree_balanced(self):
+        # GIVEN
+        keys = list(range(300))
+        random.Random(0).shuffle(keys)
+        avl = AVL()
+        # WHEN
+        avl.insert(keys)
+        # THEN
+        avl_height(self, avl._root)
+        # WHEN
+        for key in keys[:150]:
+            avl.delete(key)
+        # THEN
+        avl_height(self, avl._root)
+        self.assertListEqual([key for key, _ in avl], sorted(keys[150:]))
+
+    def test_appending_increasing_keys_keeps_tree_balanced(self):
+        # GIVEN
+        avl = AVL()
+        # WHEN
+        avl.insert(range(1024))
+        # THEN
+        avl_height(self, avl._root)
+        self.assertEqual(avl._root._height, 10)
+        self.assertIs(avl._max_node, avl._root.max())
+        # WHEN appends are mixed with deletes and out of order keys
+        rng = random.Random(0)
+        keys = set(range(1024))
+        for key in range(1024, 3000):
+            if rng.random() < 0.2:
+                removed = rng.choice([max(keys), rng.randrange(key)])
+                self.assertEqual(avl.delete(removed), removed in keys)
+                keys.discard(removed)
+            if rng.random() < 0.1:
+                key = -key
+            self.assertTrue(avl.insert_element(key))
+            keys.add(key)
+        # THEN
+        avl_height(self, avl._root)
+        self.assertListEqual(list(avl.keys()), sorted(keys))
+        self.assertFalse(avl.insert_element(max(keys)))
@@ -0,0 +1,75 @@
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.bloom_filter import CountingBloomFilter
+from datastructures.red_black_tree import RedBlackTree
+
+
+class TestCountingBloomFilter(unittest.TestCase):
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            CountingBloomFilter(0)
+        with self.assertRaises(ValueError):
+            CountingBloomFilter(10, error_rate=1)
+        with self.assertRaises(ValueError):
+            CountingBloomFilter(10, memory_budget=0)
+
+    def test_no_false_negatives(self):
+        bloom = CountingBloomFilter(1000)
+        for key in range(1000):
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in range(1000)))
+        self.assertEqual(0, bloom.skipped)
+
+    def test_false_positive_rate(self):
+        bloom = CountingBloomFilter(1000, error_rate=0.01)
+        for key in range(1000):
+            bloom.add(key)
+        false_positives = sum(key in bloom for key in range(1000, 11000))
+        self.assertLess(false_positives, 300)
+        self.assertEqual(11000 - 1000 - false_positives, bloom.skipped)
+
+    def test_remove(self):
+        bloom = CountingBloomFilter(100)
+        bloom.add("a")
+        bloom.add("b")
+        bloom.remove("a")
+        self.assertTrue("b" in bloom)
+        self.assertFalse("a" in bloom)
+
+    def test_memory_budget(self):
+        bloom = CountingBloomFilter(10000, memory_budget=1024)
+        self.assertEqual(1024, bloom.memory)
+
+
+class TestFilteredTrees(unittest.TestCase):
+    def test_trees_skip_definite_misses(self):
+        for tree_class in (AVL, RedBlackTree):
+            # GIVEN
+            bloom = CountingBloomFilter(1000)
+            tree = tree_class(membership_filter=bloom)
+            tree.insert(list(range(0, 1000, 2)))
+            # THEN
+            self.assertTrue(all(key in tree for key in range(0, 1000, 2)))
+            self.assertFalse(any(key in tree for key in range(1, 1000, 2)))
+            self.assertEqual(1000, bloom.queries)
+            self.assertEqual(500, bloom.skipped + bloom.false_positives)
+            self.assertGreater(bloom.skipped, 400)
+            # WHEN keys are deleted the filter forgets them
+            self.assertTrue(tree.delete(10))
+            self.assertFalse(tree.delete(11))
+            self.assertFalse(tree.find(10))
+            self.assertTrue(tree.find(12))
+
+    def test_filter_survives_pop_and_copy(self):
+        tree = RedBlackTree(membership_filter=CountingBloomFilter(100))
+        tree.insert([3, 1, 2])
+        self.assertEqual(1, tree.pop_min())
+        clone = tree.copy()
+        clone.insert(7)
+        self.assertFalse(1 in tree)
+        self.assertTrue(7 in clone)
+        self.assertFalse(7 in tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import random
+import tempfile
+import unittest
+from datastructures.b_plus_tree import BPlusTree
+
+
+class TestBPlusTree(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "index.db")
+        # small pages force splits and merges with few keys
+        self.tree = BPlusTree(self.path, page_size=128, cache_size=32)
+
+    def tearDown(self):
+        self.tree.close()
+        self.directory.cleanup()
+
+    def test_empty(self):
+        self.assertTrue(self.tree.empty())
+        self.assertEqual(len(self.tree), 0)
+        self.assertIsNone(self.tree.min())
+        self.assertIsNone(self.tree.max())
+        self.assertFalse(self.tree.find(1))
+        self.assertFalse(self.tree.delete(1))
+        self.assertListEqual([], list(self.tree))
+
+    def test_insert(self):
+        # GIVEN
+        keys = list(range(1000))
+        random.Random(0).shuffle(keys)
+        # WHEN
+        self.tree.insert(keys)
+        # THEN
+        self.assertFalse(self.tree.insert_element(10))
+        self.assertEqual(len(self.tree), 1000)
+        self.assertListEqual(list(range(1000)), list(self.tree))
+        self.assertEqual(self.tree.min(), 0)
+        self.assertEqual(self.tree.max(), 999)
+
+    def test_find(self):
+        self.tree.insert(range(0, 500, 2))
+        self.assertTrue(self.tree.find(0))
+        self.assertTrue(498 in self.tree)
+        self.assertFalse(self.tree.find(1))
+        self.assertFalse(500 in self.tree)
+
+    def test_wrong_key_type(self):
+        with self.assertRaises(TypeError):
+            self.tree.insert("key")
+
+    def test_range(self):
+        self.tree.insert(range(0, 300, 3))
+        self.assertListEqual([12, 15, 18], list(self.tree.range(10, 20)))
+        self.assertListEqual([0, 3], list(self.tree.range(high=4)))
+        self.assertListEqual([294, 297], list(self.tree.range(low=293)))
+        self.assertListEqual([], list(self.tree.range(1000, 2000)))
+
+    def test_delete(self):
+        # GIVEN
+        keys = list(range(2000))
+        random.Random(1).shuffle(keys)
+        self.tree.insert(keys)
+        # WHEN
+        for key in keys[:1500]:
+            self.assertTrue(self.tree.delete(key))
+        # THEN
+        self.assertFalse(self.tree.delete(keys[0]))
+        self.assertListEqual(sorted(keys[1500:]), list(self.tree))
+        # WHEN all keys are gone
+        for key in keys[1500:]:
+            self.assertTrue(self.tree.delete(key))
+        # THEN
+        self.assertTrue(self.tree.empty())
+        self.tree.insert([2, 1])
+        self.assertListEqual([1, 2], list(self.tree))
+
+    def test_bulk_load(self):
+        # WHEN
+        self.tree.bulk_load([5, 3, 3] + list(range(10, 1000)))
+        # THEN
+        self.assertEqual(len(self.tree), 992)
+        self.assertListEqual([3, 5] + list(range(10, 1000)), list(self.tree))
+        self.tree.insert(4)
+        self.assertTrue(self.tree.delete(10))
+        self.assertListEqual([3, 4, 5, 11], list(self.tree.range(0, 11)))
+        with self.assertRaises(ValueError):
+            self.tree.bulk_load([1])
+
+    def test_bulk_load_after_deleting_all_keys(self):
+        # GIVEN
+        self.tree.insert(range(100))
+        for key in range(100):
+            self.tree.delete(key)
+        # WHEN
+        self.tree.bulk_load(range(50, 60))
+        # THEN
+        self.assertListEqual(list(range(50, 60)), list(self.tree))
+        self.assertEqual(len(self.tree), 10)
+
+    def test_page_size_too_small(self):
+        path = os.path.join(self.directory.name, "small.db")
+        with self.assertRaises(ValueError):
+            BPlusTree(path, page_size=32)
+        # the file was closed, so it can be reused with proper settings
+        os.remove(path)
+        with BPlusTree(path) as tree:
+            tree.insert(1)
+            self.assertTrue(1 in tree)
+
+    def test_reopen(self):
+        # GIVEN
+        self.tree.insert(range(700))
+        self.tree.delete(5)
+        self.tree.close()
+        # WHEN
+        self.tree = BPlusTree(self.path)
+        # THEN
+        self.assertEqual(len(self.tree), 699)
+        self.assertFalse(5 in self.tree)
+        self.assertListEqual([4, 6], list(self.tree.range(4, 6)))
+        with self.assertRaises(ValueError):
+            BPlusTree(self.path, key_format="d")
+
+    def test_page_cache(self):
+        self.tree.insert(range(5000))
+        misses = self.tree.cache_misses
+        self.assertTrue(self.tree.find(4999))
+        self.assertTrue(self.tree.find(4999))
+        self.assertLessEqual(self.tree.cache_misses - misses, 4)
+        self.assertGreater(self.tree.cache_hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import time
+import unittest
+from datastructures.buffered_avl import BufferedAVL
+
+
+class TestBufferedAVL(unittest.TestCase):
+    def test_reads_see_buffered_writes(self):
+        # GIVEN
+        tree = BufferedAVL(max_buffer=100)
+        # WHEN
+        tree.insert(5)
+        tree.insert(3)
+        tree.delete(5)
+        # THEN
+        self.assertEqual(tree.buffered, 2)
+        self.assertTrue(tree.find(3))
+        self.assertFalse(5 in tree)
+        self.assertTrue(tree._tree.empty())
+        # WHEN
+        self.assertEqual(list(tree), [3])
+        # THEN
+        self.assertEqual(tree.buffered, 0)
+        self.assertEqual(tree.merges, 1)
+
+    def test_merges_when_buffer_is_full(self):
+        # GIVEN
+        tree = BufferedAVL(max_buffer=10)
+        # WHEN
+        for key in range(25):
+            tree.insert(key)
+        # THEN
+        self.assertEqual(tree.merges, 2)
+        self.assertEqual(tree.buffered, 5)
+        self.assertEqual(len(tree), 25)
+        self.assertEqual(tree.min(), 0)
+        self.assertEqual(tree.max(), 24)
+        self.assertEqual(list(tree.range(3, 6)), [3, 4, 5, 6])
+
+    def test_merges_when_buffer_is_old(self):
+        # GIVEN
+        tree = BufferedAVL(max_age=0.01)
+        tree.insert(1)
+        # WHEN
+        time.sleep(0.02)
+        tree.insert(2)
+        # THEN
+        self.assertEqual(tree.buffered, 0)
+        self.assertEqual(list(tree._tree.keys()), [1, 2])
+
+    def test_matches_set(self):
+        for max_buffer in (1, 7, 64, 1000):
+            # GIVEN
+            rng = random.Random(max_buffer)
+            tree = BufferedAVL(max_buffer=max_buffer)
+            expected = set()
+            for _ in range(3000):
+                key = rng.randrange(500)
+                # WHEN
+                operation = rng.random()
+                if operation < 0.5:
+                    tree.insert(key)
+                    expected.add(key)
+                elif operation < 0.8:
+                    tree.delete(key)
+                    expected.discard(key)
+                else:
+                    self.assertEqual(tree.find(key), key in expected)
+            # THEN
+            self.assertEqual(list(tree.keys()), sorted(expected))
+            self.assertEqual(len(tree), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.interval_tree import IntervalTree
+from datastructures.linked_list import LinkedList
+from datastructures.red_black_tree import RedBlackTree
+
+
+class TestTreeCopy(unittest.TestCase):
+    def setUp(self):
+        self.keys = list(range(300))
+        random.Random(0).shuffle(self.keys)
+
+    def assert_same_shape(self, node, clone, parent):
+        if node is None:
+            self.assertIsNone(clone)
+            return
+        self.assertIsNot(node, clone)
+        self.assertIs(clone._parent, parent)
+        self.assertEqual(node.__class__, clone.__class__)
+        for attribute in ("_key", "_data", "_height", "_color", "_max_high"):
+            self.assertEqual(getattr(node, attribute, None),
+                             getattr(clone, attribute, None))
+        self.assert_same_shape(node._left, clone._left, clone)
+        self.assert_same_shape(node._right, clone._right, clone)
+
+    def test_copy_trees(self):
+        for tree_class in (AVL, RedBlackTree, BinarySearchTree):
+            # GIVEN
+            tree = tree_class()
+            for key in self.keys:
+                tree.insert(key)
+            # WHEN
+            clone = tree.copy()
+            # THEN
+            self.assert_same_shape(tree._root, clone._root, None)
+            clone.insert(1000)
+            self.assertFalse(tree.find(1000))
+            self.assertTrue(clone.find(1000))
+            self.assertIsNone(tree_class().copy()._root)
+
+    def test_copy_keeps_cached_extremes_and_augmentation(self):
+        tree = IntervalTree()
+        tree.insert([(1, 5), (2, 50), (10, 12)])
+        clone = tree.copy()
+        self.assertIsInstance(clone, IntervalTree)
+        self.assertEqual((1, 5), clone.pop_min())
+        self.assertEqual((10, 12), clone.peek_max())
+        self.assertListEqual([(2, 50)], clone.overlaps(30))
+
+    def test_shared_and_deep_keys(self):
+        tree = AVL()
+        tree.insert_element((1, ["a"]))
+        tree.insert_element((2, ["b"]))
+        key = tree._root._key
+        self.assertIs(key, tree.copy()._root._key)
+        deep = tree.copy(deep=True)._root._key
+        self.assertIsNot(key, deep)
+        self.assertEqual(key, deep)
+
+
+class TestListCopy(unittest.TestCase):
+    def test_copy_lists(self):
+        for list_class in (LinkedList, DoublyLinkedList):
+            original = list_class()
+            for value in [1, [2], 3]:
+                original.push_back(value)
+            clone = original.copy()
+            self.assertEqual(str(original), str(clone))
+            clone.push_front(0)
+            self.assertEqual("0", str(clone)[0])
+            self.assertNotEqual(str(original), str(clone))
+            self.assertIs(original._head.next.data, clone._head.next.next.data)
+            deep = original.copy(deep=True)
+            self.assertIsNot(original._head.next.data, deep._head.next.data)
+
+    def test_doubly_linked_list_back_links(self):
+        original = DoublyLinkedList()
+        for value in range(5):
+            original.push_back(value)
+        clone = original.copy()
+        self.assertEqual(4, clone.pop_back())
+        self.assertEqual(4, len(clone))
+        self.assertEqual(5, len(original))
+
+
+if __name__ == "__main__":
+    unittest.main()
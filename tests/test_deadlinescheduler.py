@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from datastructures.deadline_scheduler import DeadlineScheduler
+from datastructures.red_black_tree import RedBlackTree
+
+
+class TestPriorityQueueOperations(unittest.TestCase):
+    def setUp(self):
+        self.tree = RedBlackTree()
+
+    def test_empty(self):
+        self.assertIsNone(self.tree.peek_min())
+        self.assertIsNone(self.tree.peek_max())
+        self.assertIsNone(self.tree.pop_min())
+        self.assertIsNone(self.tree.pop_max())
+
+    def test_cached_extremes(self):
+        # WHEN
+        self.tree.insert([50, 30, 70, 20, 80])
+        # THEN
+        self.assertEqual(self.tree.peek_min(), 20)
+        self.assertEqual(self.tree.peek_max(), 80)
+        self.assertIs(self.tree._min_node, self.tree._root.min())
+        self.assertIs(self.tree._max_node, self.tree._root.max())
+        # WHEN extremes are deleted
+        self.tree.delete(20)
+        self.tree.delete(80)
+        # THEN
+        self.assertEqual(self.tree.min(), 30)
+        self.assertEqual(self.tree.max(), 70)
+
+    def test_pop(self):
+        self.tree.insert([5, 3, 8, 1, 9, 7])
+        self.assertListEqual([1, 3, 5],
+                             [self.tree.pop_min() for _ in range(3)])
+        self.assertListEqual([9, 8, 7],
+                             [self.tree.pop_max() for _ in range(3)])
+        self.assertTrue(self.tree.empty())
+        self.assertIsNone(self.tree.min())
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    def test_next_returns_items_in_deadline_order(self):
+        async def scenario():
+            scheduler = DeadlineScheduler()
+            scheduler.schedule_in(0.03, "late")
+            scheduler.schedule_in(0.01, "early")
+            return [await scheduler.next(), await scheduler.next()]
+
+        self.assertListEqual(["early", "late"], asyncio.run(scenario()))
+
+    def test_earlier_entry_wakes_up_waiter(self):
+        async def scenario():
+            scheduler = DeadlineScheduler()
+            scheduler.schedule_in(10, "much later")
+            waiter = asyncio.ensure_future(scheduler.next())
+            await asyncio.sleep(0)
+            scheduler.schedule_in(0.01, "soon")
+            return await asyncio.wait_for(waiter, 1), len(scheduler)
+
+        self.assertEqual(("soon", 1), asyncio.run(scenario()))
+
+    def test_cancel_and_pop_due(self):
+        async def scenario():
+            scheduler = DeadlineScheduler()
+            now = asyncio.get_running_loop().time()
+            first = scheduler.schedule(now - 1, "first")
+            scheduler.schedule(now - 2, "second")
+            scheduler.schedule(now + 10, "future")
+            self.assertEqual((now - 2, "second"), scheduler.peek())
+            self.assertTrue(scheduler.cancel(first))
+            self.assertFalse(scheduler.cancel(first))
+            return scheduler.pop_due(), len(scheduler)
+
+        self.assertEqual((["second"], 1), asyncio.run(scenario()))
+
+
+if __name__ == "__main__":
+    unittest.main()
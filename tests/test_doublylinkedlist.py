@@ -0,0 +1,133 @@
+import random
+import unittest
+from datastructures.doubly_linked_list import DoublyLinkedList
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def build(self, elements):
+        double_list = DoublyLinkedList()
+        handles = [double_list.push_back(element) for element in elements]
+        return double_list, handles
+
+    def assert_elements(self, double_list, expected):
+        # walks both directions, so head, tail and every link are checked
+        forward = [node.data for node in double_list]
+        backward = []
+        node = double_list.tail
+        while node:
+            backward.append(node.data)
+            node = node.prev
+        self.assertEqual(forward, expected)
+        self.assertEqual(backward, expected[::-1])
+        self.assertEqual(len(double_list), len(expected))
+        self.assertEqual(double_list.empty(), not expected)
+
+    def test_both_ends(self):
+        # GIVEN
+        double_list, _ = self.build([1, 2])
+        # WHEN
+        double_list.push_front(0)
+        # THEN
+        self.assert_elements(double_list, [0, 1, 2])
+        self.assertEqual(double_list.pop_back(), 2)
+        self.assertEqual(double_list.pop_front(), 0)
+        self.assertEqual(double_list.pop_back(), 1)
+        self.assertIsNone(double_list.pop_front())
+        self.assert_elements(double_list, [])
+
+    def test_insert_and_remove(self):
+        # GIVEN
+        double_list, _ = self.build([1, 2, 3])
+        # WHEN
+        self.assertTrue(double_list.insert(3, 4))
+        self.assertTrue(double_list.insert(1, 5))
+        self.assertFalse(double_list.insert(9, 9))
+        # THEN
+        self.assert_elements(double_list, [1, 5, 2, 3, 4])
+        # WHEN
+        self.assertTrue(double_list.remove(4))
+        self.assertTrue(double_list.remove(1))
+        self.assertFalse(double_list.remove(9))
+        double_list.remove_if(lambda element: element > 2)
+        # THEN
+        self.assert_elements(double_list, [2])
+        double_list.remove_if(lambda element: True)
+        self.assert_elements(double_list, [])
+
+    def test_splice(self):
+        # GIVEN
+        target, target_handles = self.build([1, 2, 3])
+        source, source_handles = self.build([10, 11, 12, 13])
+        # WHEN
+        target.splice(target_handles[0], source, source_handles[1],
+                      source_handles[2], count=2)
+        # THEN
+        self.assertEqual(target._size, 5)
+        self.assert_elements(target, [1, 11, 12, 2, 3])
+        self.assert_elements(source, [10, 13])
+        # WHEN moved to the front without count
+        target.splice(None, source, source_handles[0], source_handles[3])
+        # THEN
+        self.assertIsNone(target._size)
+        self.assert_elements(target, [10, 13, 1, 11, 12, 2, 3])
+        self.assert_elements(source, [])
+        # WHEN moved within the list
+        target.splice(target_handles[2], target, target_handles[0],
+                      source_handles[2])
+        # THEN
+        self.assert_elements(target, [10, 13, 2, 3, 1, 11, 12])
+
+    def test_split_after_and_concat(self):
+        # GIVEN
+        double_list, handles = self.build(range(6))
+        # WHEN
+        rest = double_list.split_after(handles[2])
+        # THEN
+        self.assert_elements(double_list, [0, 1, 2])
+        self.assert_elements(rest, [3, 4, 5])
+        self.assert_elements(double_list.split_after(handles[2]), [])
+        # WHEN
+        rest.concat(double_list)
+        # THEN
+        self.assert_elements(rest, [3, 4, 5, 0, 1, 2])
+        self.assert_elements(double_list, [])
+        # WHEN
+        double_list.concat(rest)
+        double_list.concat(DoublyLinkedList())
+        # THEN
+        self.assert_elements(double_list, [3, 4, 5, 0, 1, 2])
+
+    def test_random_segment_moves(self):
+        # GIVEN
+        rng = random.Random(0)
+        queues = [self.build(range(start, start + 20)) for start in (0, 100)]
+        expected = [list(range(0, 20)), list(range(100, 120))]
+        handles = {}
+        for double_list, nodes in queues:
+            for node in nodes:
+                handles[node.data] = node
+        for _ in range(200):
+            # WHEN a segment moves to a random place of the other queue
+            source, target = rng.sample([0, 1], 2)
+            if len(expected[source]) < 2:
+                continue
+            i = rng.randrange(len(expected[source]))
+            j = rng.randrange(i, len(expected[source]))
+            segment = expected[source][i:j + 1]
+            position = rng.randrange(len(expected[target]) + 1)
+            pos_handle = (handles[expected[target][position - 1]]
+                          if position else None)
+            queues[target][0].splice(pos_handle, queues[source][0],
+                                     handles[segment[0]],
+                                     handles[segment[-1]],
+                                     count=len(segment))
+            del expected[source][i:j + 1]
+            expected[target][position:position] = segment
+        # THEN
+        for (double_list, _), elements in zip(queues, expected):
+            self.assertEqual(double_list._size, len(elements))
+            self.assert_elements(double_list, elements)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.frozen_index import FrozenIndex
+from datastructures.red_black_tree import RedBlackTree
+
+
+class TestFrozenIndex(unittest.TestCase):
+    def test_empty(self):
+        index = FrozenIndex()
+        self.assertTrue(index.empty())
+        self.assertFalse(1 in index)
+        self.assertIsNone(index.min())
+        self.assertIsNone(index.max())
+        self.assertIsNone(index.floor(1))
+        self.assertIsNone(index.ceiling(1))
+        self.assertListEqual([], list(index))
+
+    def test_find(self):
+        # every size up to a few full levels of the implicit tree
+        for size in range(20):
+            index = FrozenIndex(range(0, 2 * size, 2))
+            self.assertEqual(len(index), size)
+            self.assertListEqual(list(range(0, 2 * size, 2)), list(index))
+            for key in range(-1, 2 * size + 1):
+                self.assertEqual(key in index,
+                                 key % 2 == 0 and 0 <= key < 2 * size)
+
+    def test_floor_ceiling(self):
+        index = FrozenIndex([10, 20, 30, 40, 50])
+        self.assertEqual(index.floor(35), 30)
+        self.assertEqual(index.floor(30), 30)
+        self.assertIsNone(index.floor(5))
+        self.assertEqual(index.floor(100), 50)
+        self.assertEqual(index.ceiling(35), 40)
+        self.assertEqual(index.ceiling(40), 40)
+        self.assertEqual(index.ceiling(5), 10)
+        self.assertIsNone(index.ceiling(51))
+        self.assertEqual(index.min(), 10)
+        self.assertEqual(index.max(), 50)
+
+    def test_range(self):
+        index = FrozenIndex([5, 1, 3, 9, 7, 3])
+        self.assertListEqual([3, 5, 7], list(index.range(2, 7)))
+        self.assertListEqual([1, 3], list(index.range(high=4)))
+        self.assertListEqual([9], list(index.range(low=8)))
+        self.assertListEqual([], list(index.range(10, 20)))
+
+
+class TestFreeze(unittest.TestCase):
+    def test_freeze_trees(self):
+        keys = list(range(100))
+        random.Random(0).shuffle(keys)
+        for tree in (AVL(), RedBlackTree(), BinarySearchTree()):
+            for key in keys:
+                tree.insert(key)
+            index = tree.freeze()
+            self.assertListEqual(list(range(100)), list(index))
+            self.assertTrue(99 in index)
+            # the snapshot does not follow later changes of the tree
+            tree.insert(100)
+            self.assertFalse(100 in index)
+
+
+if __name__ == "__main__":
+    unittest.main()
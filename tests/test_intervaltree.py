@@ -0,0 +1,72 @@
+import random
+import unittest
+from datastructures.interval_tree import IntervalTree
+
+
+class TestIntervalTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = IntervalTree()
+
+    def check_max_high(self, node):
+        if node is None:
+            return float("-inf")
+        expected = max(node._key[1], self.check_max_high(node._left),
+                       self.check_max_high(node._right))
+        self.assertEqual(node._max_high, expected)
+        return expected
+
+    def test_empty(self):
+        self.assertListEqual([], self.tree.overlaps(1))
+        self.assertListEqual([], self.tree.overlapping(0, 10))
+        self.assertEqual(0, self.tree.stabbing_count(1))
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            self.tree.add(5, 1)
+
+    def test_overlaps(self):
+        # GIVEN
+        self.tree.insert([(15, 20), (10, 30), (17, 19), (5, 20), (12, 15),
+                          (30, 40)])
+        # THEN
+        self.assertListEqual([(5, 20), (10, 30), (15, 20), (17, 19)],
+                             self.tree.overlaps(18))
+        self.assertListEqual([(10, 30), (30, 40)], self.tree.overlaps(30))
+        self.assertListEqual([], self.tree.overlaps(41))
+        self.assertEqual(3, self.tree.stabbing_count(12))
+        self.assertListEqual([(10, 30), (30, 40)],
+                             self.tree.overlapping(25, 35))
+        self.assertFalse(self.tree.add(15, 20))
+
+    def test_remove(self):
+        self.tree.insert([(1, 10), (2, 3), (4, 5)])
+        self.assertTrue(self.tree.remove(1, 10))
+        self.assertFalse(self.tree.remove(1, 10))
+        self.assertListEqual([], self.tree.overlaps(7))
+        self.assertListEqual([(4, 5)], self.tree.overlaps(5))
+
+    def test_random_operations_keep_max_high(self):
+        rng = random.Random(0)
+        intervals = set()
+        for _ in range(1000):
+            low = rng.randrange(100)
+            interval = (low, low + rng.randrange(20))
+            if rng.random() < 0.6:
+                self.tree.add(*interval)
+                intervals.add(interval)
+            else:
+                self.tree.remove(*interval)
+                intervals.discard(interval)
+        self.check_max_high(self.tree._root)
+        for point in range(0, 130, 7):
+            expected = sorted(i for i in intervals if i[0] <= point <= i[1])
+            self.assertListEqual(expected, self.tree.overlaps(point))
+
+    def test_from_sorted(self):
+        tree = IntervalTree.from_sorted([(1, 100), (2, 3), (50, 60)])
+        self.check_max_high(tree._root)
+        self.assertListEqual([(1, 100), (50, 60)], tree.overlaps(55))
+
+
+if __name__ == "__main__":
+    unittest.main()
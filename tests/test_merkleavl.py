@@ -0,0 +1,91 @@
+import random
+import unittest
+from datastructures.merkle_avl import MerkleAVL, key_hash
+
+
+class TestMerkleAVL(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.keys = list(range(0, 2000, 2))
+
+    def build(self, keys):
+        tree = MerkleAVL()
+        for key in keys:
+            tree.insert_element(key)
+        return tree
+
+    def check_node(self, node):
+        if node is None:
+            return 0, 0
+        left = self.check_node(node._left)
+        right = self.check_node(node._right)
+        digest = (left[0] + right[0] + key_hash(node._key)) % 2 ** 128
+        count = left[1] + right[1] + 1
+        self.assertEqual((node._digest, node._count), (digest, count))
+        return digest, count
+
+    def test_digest_ignores_shape(self):
+        # GIVEN
+        shuffled = self.keys[:]
+        self.rng.shuffle(shuffled)
+        # WHEN
+        first = self.build(self.keys)
+        second = self.build(shuffled)
+        third = MerkleAVL.from_sorted(self.keys)
+        # THEN
+        self.assertEqual(first.digest(), second.digest())
+        self.assertEqual(first.digest(), third.digest())
+        self.assertEqual(len(first), 1000)
+        second.delete(10)
+        self.assertNotEqual(first.digest(), second.digest())
+        self.assertEqual(MerkleAVL().digest(), (0, 0))
+
+    def test_random_operations_keep_digests(self):
+        # GIVEN
+        tree = MerkleAVL()
+        for _ in range(3000):
+            key = self.rng.randrange(500)
+            # WHEN
+            if self.rng.random() < 0.6:
+                tree.insert_element(key)
+            else:
+                tree.delete(key)
+        # THEN
+        self.check_node(tree._root)
+        keys = list(tree.keys())
+        low, high = keys[10], keys[-10]
+        expected = self.build(key for key in keys if low <= key < high)
+        self.assertEqual(tree.range_digest(low, high), expected.digest())
+
+    def test_diff(self):
+        # GIVEN
+        primary = self.build(self.keys)
+        replica = primary.copy()
+        for key in (0, 500, 502, 1998):
+            replica.delete(key)
+        for key in (1, 777, 5000):
+            replica.insert_element(key)
+        # WHEN
+        only_primary, only_replica = primary.diff(replica)
+        # THEN
+        self.assertListEqual(only_primary, [0, 500, 502, 1998])
+        self.assertListEqual(only_replica, [1, 777, 5000])
+        self.assertLessEqual(len(primary.changed_ranges(replica)), 7)
+        self.assertListEqual(primary.changed_ranges(primary.copy()), [])
+
+    def test_sync_from(self):
+        # GIVEN
+        primary = self.build(self.keys)
+        replica = self.build(key for key in self.keys if key % 100)
+        replica.insert_element(-1)
+        # WHEN
+        changes = replica.sync_from(primary, leaf_size=4)
+        # THEN
+        self.assertEqual(changes, 21)
+        self.assertEqual(replica.digest(), primary.digest())
+        self.assertListEqual(list(replica.keys()), self.keys)
+        self.assertEqual(replica.sync_from(primary), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
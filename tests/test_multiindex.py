@@ -0,0 +1,130 @@
+import random
+import unittest
+from datastructures.multi_index import MultiIndex
+from datastructures.red_black_tree import RedBlackTree
+
+
+class TestMultiIndex(unittest.TestCase):
+    def setUp(self):
+        self.people = MultiIndex()
+        self.people.add_index("name", lambda person: person["name"],
+                              unique=True)
+        self.people.add_index("age", lambda person: person["age"],
+                              tree_class=RedBlackTree)
+        self.ids = [self.people.insert({"name": name, "age": age})
+                    for name, age in (("carol", 35), ("alice", 30),
+                                      ("bob", 30), ("dave", 50))]
+
+    def names(self, records):
+        return [record["name"] for _, record in records]
+
+    def test_find_and_range(self):
+        self.assertEqual(len(self.people), 4)
+        self.assertEqual(self.people.find("name", "bob"),
+                         [{"name": "bob", "age": 30}])
+        self.assertEqual([person["name"]
+                          for person in self.people.find("age", 30)],
+                         ["alice", "bob"])
+        self.assertEqual(self.names(self.people.range("age", 30, 35)),
+                         ["alice", "bob", "carol"])
+        self.assertEqual(self.names(self.people.range("name", "b")),
+                         ["bob", "carol", "dave"])
+        self.assertEqual(self.names(self.people.range("age", high=31)),
+                         ["alice", "bob"])
+        self.assertEqual(self.people.find("age", 31), [])
+
+    def test_records_are_stored_once(self):
+        record = self.people.get(self.ids[0])
+        self.assertIs(self.people.find("name", "carol")[0], record)
+        self.assertIs(next(self.people.range("age", 35, 35))[1], record)
+
+    def test_update(self):
+        # WHEN
+        self.people.update(self.ids[1], {"name": "alice", "age": 60})
+        # THEN
+        self.assertEqual(self.names(self.people.range("age", 40)),
+                         ["dave", "alice"])
+        self.assertEqual(self.people.find("name", "alice")[0]["age"], 60)
+
+    def test_record_mutated_in_place(self):
+        # GIVEN
+        record = self.people.get(self.ids[1])
+        record["age"] = 40
+        # WHEN
+        self.people.update(self.ids[1], record)
+        # THEN
+        self.assertEqual(self.people.find("age", 40), [record])
+        self.assertNotIn(record, self.people.find("age", 30))
+        # WHEN
+        record["age"] = 50
+        self.people.drop_index("name")
+        self.assertTrue(self.people.delete(self.ids[1]))
+        # THEN
+        self.assertEqual(self.people.find("age", 40), [])
+        self.assertNotIn(record, [r for _, r in self.people.range("age")])
+
+    def test_delete(self):
+        # WHEN
+        self.assertTrue(self.people.delete(self.ids[0]))
+        # THEN
+        self.assertFalse(self.people.delete(self.ids[0]))
+        self.assertNotIn(self.ids[0], self.people)
+        self.assertEqual(self.people.find("name", "carol"), [])
+        self.assertEqual(self.names(self.people.range("age")),
+                         ["alice", "bob", "dave"])
+
+    def test_failed_changes_leave_indexes_untouched(self):
+        # WHEN a unique key clashes
+        with self.assertRaises(KeyError):
+            self.people.insert({"name": "bob", "age": 99})
+        with self.assertRaises(KeyError):
+            self.people.update(self.ids[0], {"name": "bob", "age": 99})
+        # WHEN an extractor fails
+        with self.assertRaises(KeyError):
+            self.people.insert({"name": "erin"})
+        # THEN
+        self.assertEqual(len(self.people), 4)
+        self.assertEqual(self.names(self.people.range("age")),
+                         ["alice", "bob", "carol", "dave"])
+        self.assertEqual(self.people.find("name", "erin"), [])
+
+    def test_add_index_over_existing_records(self):
+        # WHEN
+        self.people.add_index("initial", lambda person: person["name"][0])
+        # THEN
+        self.assertEqual(self.names(self.people.range("initial", "b", "c")),
+                         ["bob", "carol"])
+        with self.assertRaises(KeyError):
+            self.people.add_index("age_unique", lambda person: person["age"],
+                                  unique=True)
+
+    def test_matches_sorted_list(self):
+        # GIVEN
+        rng = random.Random(0)
+        container = MultiIndex()
+        container.add_index("value", lambda record: record[0])
+        records = {}
+        for _ in range(1000):
+            # WHEN
+            if records and rng.random() < 0.3:
+                record_id = rng.choice(list(records))
+                if rng.random() < 0.5:
+                    container.delete(record_id)
+                    del records[record_id]
+                else:
+                    records[record_id] = (rng.randrange(50),)
+                    container.update(record_id, records[record_id])
+            else:
+                record = (rng.randrange(50),)
+                records[container.insert(record)] = record
+        # THEN
+        expected = sorted((record[0], record_id)
+                          for record_id, record in records.items()
+                          if 10 <= record[0] <= 20)
+        self.assertEqual(list(container.range("value", 10, 20)),
+                         [(record_id, (value,))
+                          for value, record_id in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
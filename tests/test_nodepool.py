@@ -0,0 +1,87 @@
+import unittest
+from datastructures import doubly_linked_list, linked_list
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.linked_list import LinkedList
+from datastructures.node_pool import NodePool
+
+
+def elements(linked):
+    result = []
+    node = linked._head
+    while node:
+        result.append(node.data)
+        node = node.next
+    return result
+
+
+class TestNodePool(unittest.TestCase):
+    def setUp(self):
+        self.cases = ((LinkedList, linked_list.Node),
+                      (DoublyLinkedList, doubly_linked_list.Node))
+
+    def test_queue_reuses_nodes(self):
+        for list_class, node_class in self.cases:
+            # GIVEN
+            pool = NodePool(node_class)
+            queue = list_class(node_pool=pool)
+            # WHEN
+            for message in range(1000):
+                queue.push_back(message)
+                queue.push_back(message)
+                self.assertEqual(queue.pop_front(), message)
+                self.assertEqual(queue.pop_back(), message)
+            # THEN
+            self.assertTrue(queue.empty())
+            self.assertEqual(pool.allocated, 2)
+            self.assertEqual(pool.reused, 1998)
+            self.assertEqual(pool.released, 2000)
+            self.assertEqual(len(pool), 2)
+
+    def test_released_nodes_are_reset(self):
+        for list_class, node_class in self.cases:
+            # GIVEN
+            pool = NodePool(node_class)
+            linked = list_class(node_pool=pool)
+            for element in [1, 2, 3, 4, 5, 6]:
+                linked.push_back(element)
+            # WHEN
+            linked.remove(3)
+            linked.remove(6)
+            linked.remove_if(lambda element: element % 2 == 0)
+            # THEN
+            self.assertEqual(elements(linked), [1, 5])
+            self.assertEqual(len(pool), 4)
+            for node in pool._free:
+                self.assertIsNone(node.data)
+                self.assertIsNone(node.next)
+            # WHEN
+            linked.push_front(0)
+            linked.insert(1, 7)
+            # THEN
+            self.assertEqual(elements(linked), [0, 1, 7, 5])
+            self.assertEqual(pool.reused, 2)
+
+    def test_capacity(self):
+        # GIVEN
+        pool = NodePool(linked_list.Node, capacity=3)
+        linked = LinkedList(node_pool=pool)
+        for element in range(10):
+            linked.push_front(element)
+        # WHEN
+        while not linked.empty():
+            linked.pop_front()
+        # THEN
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.dropped, 7)
+        # WHEN
+        pool.capacity = 1
+        # THEN
+        self.assertEqual(len(pool), 1)
+        pool.shrink()
+        self.assertEqual(len(pool), 0)
+        with self.assertRaises(ValueError):
+            NodePool(linked_list.Node, capacity=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
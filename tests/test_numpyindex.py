@@ -0,0 +1,73 @@
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.numpy_index import SortedArrayIndex, keys_array, np
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSortedArrayIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SortedArrayIndex([30, 10, 20, 50, 40, 10])
+
+    def test_construction(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertListEqual([10, 20, 30, 40, 50], list(self.index))
+        self.assertEqual(self.index.min(), 10)
+        self.assertEqual(self.index.max(), 50)
+        self.assertTrue(SortedArrayIndex().empty())
+        self.assertIsNone(SortedArrayIndex().min())
+
+    def test_contains(self):
+        result = self.index.contains(np.array([5, 10, 25, 50, 60]))
+        self.assertListEqual([False, True, False, True, False],
+                             result.tolist())
+        self.assertTrue(20 in self.index)
+        self.assertFalse(21 in self.index)
+        self.assertTrue(self.index.contains(50))
+        self.assertFalse(self.index.contains(60))
+        self.assertFalse(SortedArrayIndex().contains(1))
+
+    def test_rank(self):
+        result = self.index.rank(np.array([0, 10, 11, 50, 51]))
+        self.assertListEqual([0, 0, 1, 4, 5], result.tolist())
+
+    def test_count_range(self):
+        self.assertEqual(self.index.count_range(15, 40), 3)
+        result = self.index.count_range(np.array([0, 25]),
+                                        np.array([100, 29]))
+        self.assertListEqual([5, 0], result.tolist())
+
+    def test_keys_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.index.keys[0] = 1
+
+    def test_from_sorted_leaves_callers_array_writable(self):
+        # GIVEN
+        keys = np.array([1, 2, 3])
+        # WHEN
+        index = SortedArrayIndex.from_sorted(keys)
+        # THEN
+        keys[0] = 0
+        self.assertEqual(index.min(), 0)
+        with self.assertRaises(ValueError):
+            index.keys[0] = 1
+
+    def test_tree_round_trip(self):
+        for tree_class in (AVL, RedBlackTree):
+            # GIVEN
+            tree = tree_class()
+            tree.insert([5, 1, 4, 2, 3])
+            # WHEN
+            array = keys_array(tree, dtype=np.int64)
+            index = SortedArrayIndex.from_tree(tree, dtype=np.int64)
+            # THEN
+            self.assertEqual(array.dtype, np.int64)
+            self.assertListEqual([1, 2, 3, 4, 5], array.tolist())
+            self.assertListEqual([1, 2, 3, 4, 5], list(index))
+            rebuilt = index.to_tree(tree_class)
+            self.assertTrue(rebuilt.find(4))
+            self.assertEqual(rebuilt.max(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
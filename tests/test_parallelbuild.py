@@ -0,0 +1,49 @@
+import random
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.parallel_build import build_parallel
+from datastructures.red_black_tree import NodeColor, RedBlackTree
+from tests.tree_invariants import avl_height, black_height
+
+
+class TestFromSorted(unittest.TestCase):
+    def test_avl_from_sorted(self):
+        for size in range(40):
+            tree = AVL.from_sorted(range(size))
+            avl_height(self, tree._root)
+            self.assertListEqual(list(range(size)),
+                                 [key for key, _ in tree])
+        tree.insert(100)
+        self.assertTrue(tree.delete(0))
+        avl_height(self, tree._root)
+
+    def test_red_black_tree_from_sorted(self):
+        for size in range(40):
+            tree = RedBlackTree.from_sorted(range(size))
+            if size:
+                self.assertEqual(tree._root._color, NodeColor.BLACK)
+            black_height(self, tree._root)
+            self.assertListEqual(list(range(size)),
+                                 [key for key, _ in tree.get_inorder()])
+        tree.insert(100)
+        self.assertTrue(tree.delete(0))
+        black_height(self, tree._root)
+
+
+class TestBuildParallel(unittest.TestCase):
+    def test_build_parallel(self):
+        rng = random.Random(0)
+        keys = [rng.randrange(5000) for _ in range(10000)]
+        for tree_class in (AVL, RedBlackTree):
+            for workers in (1, 3):
+                tree = build_parallel(tree_class, keys, workers=workers)
+                self.assertListEqual(sorted(set(keys)),
+                                     list(tree.freeze()))
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            build_parallel(AVL, [1, 2], workers=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
+import random
 import unittest
 from datastructures.red_black_tree import Node, RedBlackTree, NodeColor
+from tests.tree_invariants import black_height
 
 
 class TestNode(unittest.TestCase):
@@ -174,6 +176,61 @@ class TestRedBlackTree(unittest.TestCase):
         self.assertFalse(10 in self.tree)
         self.assertTrue(0 in self.tree)
 
+    def test_range(self):
+        self.assertListEqual(list(self.tree.range()), [])
+        self.tree.insert([4, 6, 8, 2, 1])
+        self.assertListEqual(list(self.tree.range(2, 6)), [2, 4, 6])
+        self.assertListEqual(list(self.tree.range(3, 7)), [4, 6])
+        self.assertListEqual(list(self.tree.range(high=4)), [1, 2, 4])
+        self.assertListEqual(list(self.tree.range(9)), [])
+
+    def test_insert_keeps_red_black_properties(self):
+        keys = list(range(300))
+        random.Random(0).shuffle(keys)
+        self.tree.insert(keys)
+        self.assertEqual(self.tree._root._color, NodeColor.BLACK)
+        black_height(self, self.tree._root)
+        self.assertListEqual(sorted(keys),
+                             [key for key, _ in self.tree.get_inorder()])
+
+    def test_delete(self):
+        self.assertFalse(self.tree.delete(1))
+        self.tree.insert([10, 20, 30, 15])
+        self.assertTrue(self.tree.delete(20))
+        self.assertFalse(self.tree.delete(20))
+        self.assertEqual("10B, 15B, 30B", self.tree.print_inorder())
+        for key in [10, 15, 30]:
+            self.assertTrue(self.tree.delete(key))
+        self.assertTrue(self.tree.empty())
+
+    def test_random_insert_and_delete_keep_red_black_properties(self):
+        rng = random.Random(0)
+        keys = set()
+        for _ in range(2000):
+            key = rng.randrange(200)
+            if rng.random() < 0.5:
+                self.tree.insert(key)
+                keys.add(key)
+            else:
+                self.assertEqual(key in keys, self.tree.delete(key))
+                keys.discard(key)
+        black_height(self, self.tree._root)
+        self.assertListEqual(sorted(keys),
+                             [key for key, _ in self.tree.get_inorder()])
+
+    def test_appending_increasing_keys_keeps_red_black_properties(self):
+        rng = random.Random(0)
+        keys = set()
+        for key in range(2000):
+            if keys and rng.random() < 0.2:
+                removed = self.tree.pop_max()
+                keys.discard(removed)
+            self.assertTrue(self.tree.insert_element(key))
+            keys.add(key)
+        black_height(self, self.tree._root)
+        self.assertIs(self.tree._max_node, self.tree._root.max())
+        self.assertListEqual(sorted(keys), list(self.tree.keys()))
+
 
 if __name__ == "__main__":
     unittest.main()
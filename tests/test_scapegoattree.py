@@ -0,0 +1,85 @@
+import math
+import random
+import unittest
+from datastructures.scapegoat_tree import ScapegoatTree
+
+
+class TestScapegoatTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = ScapegoatTree()
+
+    def check_links(self, node, parent):
+        if node:
+            self.assertIs(node.parent, parent)
+            self.check_links(node.left, node)
+            self.check_links(node.right, node)
+
+    def check_height(self, tree):
+        size = max(len(tree), 1)
+        limit = math.floor(math.log(size, 1 / tree._alpha)) + 2
+        self.assertLessEqual(tree.height(), limit)
+
+    def test_empty(self):
+        self.assertTrue(self.tree.empty())
+        self.assertEqual(len(self.tree), 0)
+        self.assertFalse(1 in self.tree)
+        self.assertFalse(self.tree.delete(1))
+        self.assertIsNone(self.tree.min())
+        self.assertEqual(self.tree.height(), 0)
+        with self.assertRaises(ValueError):
+            ScapegoatTree(alpha=0.5)
+
+    def test_sorted_inserts_stay_balanced(self):
+        # WHEN
+        for key in range(1000):
+            self.assertTrue(self.tree.insert(key))
+        # THEN
+        self.assertFalse(self.tree.insert(500))
+        self.assertEqual(len(self.tree), 1000)
+        self.assertGreater(self.tree.rebuilds, 0)
+        self.check_height(self.tree)
+        self.check_links(self.tree._root, None)
+        self.assertListEqual(list(self.tree.keys()), list(range(1000)))
+        self.assertNotIn("_height", self.tree._root.__dict__)
+
+    def test_deletes_rebuild_whole_tree(self):
+        # GIVEN
+        for key in range(100):
+            self.tree.insert(key)
+        rebuilds = self.tree.rebuilds
+        # WHEN
+        for key in range(0, 100, 2):
+            self.assertTrue(self.tree.delete(key))
+        # THEN
+        self.assertFalse(self.tree.delete(0))
+        self.assertGreater(self.tree.rebuilds, rebuilds)
+        self.check_height(self.tree)
+        self.check_links(self.tree._root, None)
+        self.assertListEqual(list(self.tree.keys()), list(range(1, 100, 2)))
+
+    def test_random_operations(self):
+        # GIVEN
+        rng = random.Random(0)
+        expected = set()
+        for _ in range(5000):
+            key = rng.randrange(700)
+            # WHEN
+            if rng.random() < 0.6:
+                self.assertEqual(self.tree.insert(key), key not in expected)
+                expected.add(key)
+            else:
+                self.assertEqual(self.tree.delete(key), key in expected)
+                expected.discard(key)
+            # THEN
+            self.check_height(self.tree)
+        self.assertEqual(len(self.tree), len(expected))
+        self.check_links(self.tree._root, None)
+        self.assertListEqual(list(self.tree.keys()), sorted(expected))
+        copy = self.tree.copy()
+        copy.insert(-1)
+        self.assertEqual(len(copy), len(expected) + 1)
+        self.assertFalse(-1 in self.tree)
+
+
+if __name__ == '__main__':
+    unittest.main()
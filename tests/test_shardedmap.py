@@ -0,0 +1,108 @@
+import random
+import threading
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.sharded_map import ShardedOrderedMap
+
+
+class TestShardedOrderedMap(unittest.TestCase):
+    def check_layout(self, sharded):
+        bounds, shards = sharded._layout
+        self.assertIsNone(shards[0].low)
+        self.assertIsNone(shards[-1].high)
+        for left, right in zip(shards, shards[1:]):
+            self.assertEqual(left.high, right.low)
+        for shard in shards:
+            self.assertFalse(shard.retired)
+            keys = list(shard.tree.keys())
+            self.assertListEqual(keys, sorted(shard.values))
+            for key in keys:
+                self.assertTrue(shard.low is None or shard.low <= key)
+                self.assertTrue(shard.high is None or key < shard.high)
+
+    def test_point_operations(self):
+        # GIVEN
+        sharded = ShardedOrderedMap()
+        # WHEN
+        self.assertTrue(sharded.put(2, "b"))
+        self.assertTrue(sharded.put(1, "a"))
+        self.assertFalse(sharded.put(2, "B"))
+        # THEN
+        self.assertEqual(sharded.get(2), "B")
+        self.assertIsNone(sharded.get(3))
+        self.assertTrue(1 in sharded)
+        self.assertEqual(len(sharded), 2)
+        self.assertTrue(sharded.delete(1))
+        self.assertFalse(sharded.delete(1))
+        self.assertListEqual(sharded.range(), [(2, "B")])
+
+    def test_split_and_merge(self):
+        for tree_class in (AVL, RedBlackTree):
+            # GIVEN
+            sharded = ShardedOrderedMap(16, tree_class)
+            keys = list(range(500))
+            random.Random(0).shuffle(keys)
+            # WHEN
+            for key in keys:
+                sharded.put(key, -key)
+            # THEN
+            self.assertGreater(sharded.shard_count, 30)
+            self.check_layout(sharded)
+            self.assertListEqual(sharded.range(100, 104),
+                                 [(key, -key) for key in range(100, 105)])
+            self.assertListEqual(list(sharded), list(range(500)))
+            # WHEN
+            for key in keys[:490]:
+                sharded.delete(key)
+            # THEN
+            self.assertLess(sharded.shard_count, 5)
+            self.assertGreater(sharded.merges, 0)
+            self.check_layout(sharded)
+            self.assertListEqual(list(sharded), sorted(keys[490:]))
+
+    def test_concurrent_writers_and_scans(self):
+        # GIVEN
+        sharded = ShardedOrderedMap(max_shard_size=32)
+        errors = []
+
+        def writer(offset):
+            rng = random.Random(offset)
+            for _ in range(3000):
+                key = rng.randrange(2000) * 4 + offset
+                if rng.random() < 0.7:
+                    sharded.put(key, offset)
+                else:
+                    sharded.delete(key)
+
+        def scanner():
+            for _ in range(30):
+                keys = [key for key, _ in sharded.range(1000, 5000)]
+                if keys != sorted(set(keys)):
+                    errors.append(keys)
+
+        threads = [threading.Thread(target=writer, args=(offset,))
+                   for offset in range(4)]
+        threads.append(threading.Thread(target=scanner))
+        # WHEN
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # THEN
+        self.assertListEqual(errors, [])
+        self.check_layout(sharded)
+        expected = {}
+        for offset in range(4):  # replay every writer on its own keys
+            rng = random.Random(offset)
+            for _ in range(3000):
+                key = rng.randrange(2000) * 4 + offset
+                if rng.random() < 0.7:
+                    expected[key] = offset
+                else:
+                    expected.pop(key, None)
+        self.assertListEqual(sharded.range(), sorted(expected.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+from datastructures.skip_list import SkipList
+
+
+class TestSkipList(unittest.TestCase):
+    def setUp(self):
+        self.skip_list = SkipList(seed=42)
+
+    def test_empty(self):
+        self.assertTrue(self.skip_list.empty())
+        self.assertIsNone(self.skip_list.min())
+        self.assertIsNone(self.skip_list.max())
+        self.assertFalse(self.skip_list.delete(1))
+        self.assertListEqual([], list(self.skip_list))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            SkipList(probability=1)
+        with self.assertRaises(ValueError):
+            SkipList(max_level=0)
+
+    def test_insert(self):
+        # WHEN
+        self.skip_list.insert([5, 1, 3, 9, 7])
+        # THEN
+        self.assertFalse(self.skip_list.insert_element(3))
+        self.assertListEqual([1, 3, 5, 7, 9], list(self.skip_list))
+        self.assertEqual(len(self.skip_list), 5)
+        self.assertEqual(self.skip_list.min(), 1)
+        self.assertEqual(self.skip_list.max(), 9)
+
+    def test_append(self):
+        # WHEN keys are increasing
+        self.skip_list.insert(range(100))
+        # THEN
+        self.assertListEqual(list(range(100)), list(self.skip_list))
+        self.assertEqual(self.skip_list.max(), 99)
+        # WHEN key smaller than maximum is inserted
+        self.skip_list.insert(-1)
+        self.skip_list.insert(100)
+        # THEN
+        self.assertListEqual(list(range(-1, 101)), list(self.skip_list))
+
+    def test_find(self):
+        self.skip_list.insert([4, 5, 0, 2])
+        self.assertTrue(self.skip_list.find(0))
+        self.assertTrue(5 in self.skip_list)
+        self.assertFalse(3 in self.skip_list)
+        self.assertFalse(self.skip_list.find(10))
+
+    def test_delete(self):
+        # GIVEN
+        keys = list(range(500))
+        random.Random(0).shuffle(keys)
+        self.skip_list.insert(keys)
+        # WHEN
+        for key in keys[:250]:
+            self.assertTrue(self.skip_list.delete(key))
+        # THEN
+        self.assertFalse(self.skip_list.delete(keys[0]))
+        self.assertListEqual(sorted(keys[250:]), list(self.skip_list))
+        self.assertEqual(self.skip_list.max(), max(keys[250:]))
+        # WHEN maximum is deleted the tail moves back
+        self.skip_list.delete(self.skip_list.max())
+        self.skip_list.insert(1000)
+        # THEN
+        self.assertEqual(self.skip_list.max(), 1000)
+        self.assertListEqual(sorted(keys[250:])[:-1] + [1000],
+                             list(self.skip_list))
+
+    def test_range(self):
+        self.skip_list.insert(range(0, 50, 5))
+        self.assertListEqual([10, 15, 20], list(self.skip_list.range(7, 20)))
+        self.assertListEqual([0, 5], list(self.skip_list.range(high=5)))
+        self.assertListEqual([45], list(self.skip_list.range(low=41)))
+
+    def test_seed_reproducibility(self):
+        first, second = SkipList(seed=7), SkipList(seed=7)
+        first.insert(range(100))
+        second.insert(range(100))
+        self.assertEqual(first._level, second._level)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from datastructures.splay_tree import SplayTree
+
+
+def inorder(tree):
+    return [int(key) for key in
+            tree._root.inorder_traversal_non_recursive(tree._root)] \
+        if tree._root else []
+
+
+class TestSplayTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = SplayTree()
+
+    def test_empty(self):
+        self.assertTrue(self.tree.empty())
+        self.assertFalse(self.tree.find(1))
+        self.assertFalse(self.tree.delete(1))
+        self.assertIsNone(self.tree.min())
+        self.assertIsNone(self.tree.max())
+
+    def test_insert_moves_key_to_root(self):
+        for key in [5, 3, 8, 1]:
+            self.assertTrue(self.tree.insert(key))
+            self.assertEqual(self.tree._root.data, key)
+        self.assertFalse(self.tree.insert(3))
+        self.assertEqual(self.tree._root.data, 3)
+        self.assertListEqual([1, 3, 5, 8], inorder(self.tree))
+
+    def test_find_moves_deep_key_to_root(self):
+        # GIVEN a path, as every inserted key becomes the root
+        for key in range(64):
+            self.tree.insert(key)
+        # WHEN
+        self.assertTrue(self.tree.find(0))
+        # THEN
+        self.assertEqual(self.tree._root.data, 0)
+        self.assertIsNone(self.tree._root.parent)
+        # WHEN a key close to the root is found
+        self.assertTrue(self.tree.find(63))
+        # THEN it stays where it is
+        self.assertEqual(self.tree._root.data, 0)
+        # WHEN key is missing the last visited node is splayed
+        self.assertFalse(31.5 in self.tree)
+        # THEN
+        self.assertIn(self.tree._root.data, (31, 32))
+        self.assertListEqual(list(range(64)), inorder(self.tree))
+        self.assertEqual(len(self.tree), 64)
+
+    def test_min_max(self):
+        for key in [4, 2, 9, 7]:
+            self.tree.insert(key)
+        self.assertEqual(self.tree.min().data, 2)
+        self.assertEqual(self.tree._root.data, 2)
+        self.assertEqual(self.tree.max().data, 9)
+        self.assertEqual(self.tree._root.data, 9)
+
+    def test_delete(self):
+        # GIVEN
+        keys = list(range(200))
+        random.Random(0).shuffle(keys)
+        for key in keys:
+            self.tree.insert(key)
+        # WHEN
+        for key in keys[:100]:
+            self.assertTrue(self.tree.delete(key))
+        # THEN
+        self.assertFalse(self.tree.delete(keys[0]))
+        self.assertListEqual(sorted(keys[100:]), inorder(self.tree))
+        for key in keys[100:]:
+            self.assertTrue(self.tree.delete(key))
+        self.assertTrue(self.tree.empty())
+
+    def test_sequential_access_keeps_parent_links(self):
+        def check(node, parent):
+            if node:
+                self.assertIs(node.parent, parent)
+                check(node.left, node)
+                check(node.right, node)
+
+        for key in range(100):
+            self.tree.insert(key)
+        for key in range(100):
+            self.assertTrue(self.tree.find(key))
+        check(self.tree._root, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
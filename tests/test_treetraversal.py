@@ -0,0 +1,145 @@
+import bisect
+import gc
+import random
+import unittest
+import weakref
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.bloom_filter import CountingBloomFilter
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.scapegoat_tree import ScapegoatTree
+from datastructures.tree_traversal import (inorder_nodes, predecessor,
+                                           successor)
+
+
+class TestTreeTraversal(unittest.TestCase):
+    def setUp(self):
+        self.keys = list(range(200))
+        random.Random(0).shuffle(self.keys)
+
+    def build(self, tree_class):
+        tree = tree_class()
+        for key in self.keys:
+            tree.insert(key)
+        return tree
+
+    def test_keys(self):
+        for tree_class in (AVL, RedBlackTree, BinarySearchTree):
+            tree = self.build(tree_class)
+            self.assertListEqual(list(range(200)), list(tree.keys()))
+            self.assertListEqual(list(range(199, -1, -1)),
+                                 list(tree.keys(reverse=True)))
+            self.assertListEqual([], list(tree_class().keys()))
+
+    def test_avl_iteration(self):
+        avl = self.build(AVL)
+        self.assertListEqual(avl.get_key_height_inorder(), list(avl))
+        self.assertListEqual(avl.get_key_height_inorder()[::-1],
+                             list(reversed(avl)))
+
+    def test_subtree_walk_stays_in_subtree(self):
+        tree = self.build(RedBlackTree)
+        subtree = tree._root._left
+        keys = [node._key for node in inorder_nodes(subtree)]
+        self.assertListEqual(list(range(keys[0], keys[-1] + 1)), keys)
+        self.assertLess(keys[-1], tree._root._key)
+        self.assertListEqual(keys[::-1], [node._key for node in
+                                          inorder_nodes(subtree, True)])
+
+    def test_successor_predecessor(self):
+        tree = self.build(AVL)
+        node = tree._root.min()
+        self.assertIsNone(predecessor(node))
+        for key in range(1, 200):
+            node = successor(node)
+            self.assertEqual(key, node._key)
+        self.assertIsNone(successor(node))
+        self.assertEqual(198, predecessor(node)._key)
+
+    def test_bst_non_recursive_traversal(self):
+        bst = self.build(BinarySearchTree)
+        self.assertListEqual([str(key) for key in range(200)],
+                             bst._root.inorder_traversal_non_recursive(
+                                 bst._root))
+
+
+class TestOrderQueries(unittest.TestCase):
+    def setUp(self):
+        self.keys = list(range(0, 400, 2))
+        random.Random(0).shuffle(self.keys)
+        self.sorted_keys = sorted(self.keys)
+
+    def expected(self, index):
+        if 0 <= index < len(self.sorted_keys):
+            return self.sorted_keys[index]
+        return None
+
+    def test_floor_ceiling_predecessor_successor(self):
+        for tree_class in (AVL, RedBlackTree):
+            tree = tree_class()
+            self.assertIsNone(tree.floor(1))
+            self.assertIsNone(tree.successor(1))
+            for key in self.keys:
+                tree.insert_element(key)
+            for query in range(-2, 403):
+                right = bisect.bisect_right(self.sorted_keys, query)
+                left = bisect.bisect_left(self.sorted_keys, query)
+                self.assertEqual(tree.floor(query), self.expected(right - 1))
+                self.assertEqual(tree.ceiling(query), self.expected(left))
+                self.assertEqual(tree.predecessor(query),
+                                 self.expected(left - 1))
+                self.assertEqual(tree.successor(query), self.expected(right))
+
+    def test_nearest(self):
+        for tree_class in (AVL, RedBlackTree):
+            tree = tree_class()
+            self.assertListEqual(tree.nearest(5, 3), [])
+            for key in self.keys:
+                tree.insert_element(key)
+            for query in (-50, 0, 7, 100, 101, 398, 500):
+                for count in (1, 4, 250):
+                    expected = sorted(self.keys,
+                                      key=lambda key: (abs(key - query),
+                                                       key))[:count]
+                    self.assertListEqual(tree.nearest(query, count),
+                                         expected)
+
+
+class TestClear(unittest.TestCase):
+    def test_clear_frees_nodes_without_collector(self):
+        for tree_class in (AVL, RedBlackTree, BinarySearchTree,
+                           ScapegoatTree):
+            # GIVEN
+            tree = tree_class()
+            for key in random.Random(0).sample(range(1000), 300):
+                tree.insert(key)
+            nodes = [weakref.ref(node) for node in inorder_nodes(tree._root)]
+            gc.disable()
+            try:
+                # WHEN
+                tree.clear()
+                # THEN
+                self.assertEqual([ref for ref in nodes if ref()], [])
+            finally:
+                gc.enable()
+            self.assertTrue(tree.empty())
+            self.assertListEqual(list(tree.keys()), [])
+            tree.insert(5)
+            self.assertListEqual(list(tree.keys()), [5])
+
+    def test_clear_resets_filter_and_cached_nodes(self):
+        for tree_class in (AVL, RedBlackTree):
+            # GIVEN
+            tree = tree_class(CountingBloomFilter(100))
+            tree.insert(list(range(50)))
+            # WHEN
+            tree.clear()
+            # THEN
+            self.assertFalse(tree._filter.might_contain(10))
+            self.assertIsNone(tree.max())
+            tree.insert_element(7)
+            self.assertEqual((tree.min(), tree.max()), (7, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import random
+import tempfile
+import unittest
+from datastructures.avl_tree import AVL
+from datastructures.binary_search_tree import BinarySearchTree
+from datastructures.doubly_linked_list import DoublyLinkedList
+from datastructures.linked_list import LinkedList
+from datastructures.red_black_tree import RedBlackTree
+from datastructures.workload_trace import (DELETE, FIND, INSERT, SCAN,
+                                           TraceRecorder, read_trace, replay)
+
+
+class TestWorkloadTrace(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".trace")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_record_tree_operations(self):
+        # GIVEN
+        with TraceRecorder(AVL(), self.path) as tree:
+            # WHEN
+            tree.insert([3, 1, 2])
+            tree.find(2)
+            self.assertTrue(1 in tree)
+            tree.delete(3)
+            list(tree.keys(reverse=True))
+            list(tree.range(1, high=2))
+        # THEN
+        self.assertEqual(read_trace(self.path),
+                         [(INSERT, 3), (INSERT, 1), (INSERT, 2), (FIND, 2),
+                          (FIND, 1), (DELETE, 3), (SCAN, None),
+                          (SCAN, (1, 2))])
+
+    def test_record_list_operations(self):
+        # GIVEN
+        with TraceRecorder(DoublyLinkedList(), self.path) as double_list:
+            # WHEN
+            double_list.push_back(1)
+            double_list.push_front(0)
+            self.assertEqual(double_list.pop_back(), 1)
+            double_list.remove(0)
+            double_list.pop_front()
+            self.assertTrue(double_list.empty())
+        # THEN
+        self.assertEqual(read_trace(self.path),
+                         [(INSERT, 1), (INSERT, 0), (DELETE, 1),
+                          (DELETE, 0)])
+
+    def test_replay_every_structure(self):
+        # GIVEN
+        rng = random.Random(0)
+        with TraceRecorder(RedBlackTree(), self.path) as tree:
+            for _ in range(500):
+                key = rng.randrange(100)
+                operation = rng.random()
+                if operation < 0.5:
+                    tree.insert_element(key)
+                elif operation < 0.8:
+                    tree.find(key)
+                elif operation < 0.97:
+                    tree.delete(key)
+                elif operation < 0.99:
+                    list(tree.range(key, key + 10))
+                else:
+                    list(tree.keys())
+        records = read_trace(self.path)
+        for factory in (AVL, RedBlackTree, BinarySearchTree, LinkedList,
+                        DoublyLinkedList):
+            # WHEN
+            report = replay(records, factory)
+            # THEN
+            self.assertEqual(report["operations"], 500)
+            self.assertGreater(report["throughput"], 0)
+            self.assertLessEqual(report["p50"], report["p99"])
+            self.assertLessEqual(report["p99"], report["max"])
+            self.assertGreater(report["peak_memory"], 0)
+
+    def test_replay_deletes_root(self):
+        # GIVEN
+        records = [(INSERT, 5), (INSERT, 3), (DELETE, 5), (INSERT, 8),
+                   (DELETE, 3), (DELETE, 8), (FIND, 8)]
+        for factory in (AVL, RedBlackTree, BinarySearchTree):
+            # WHEN
+            report = replay(records, factory)
+            # THEN
+            self.assertEqual(report["operations"], len(records))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Structural invariant checks shared by the tree tests
+"""
+from datastructures.red_black_tree import NodeColor
+
+
+def avl_height(test, node, parent=None):
+    """
+    Asserts parent links, stored heights and the AVL balance of the subtree
+    at node and returns its height.
+    """
+    if node is None:
+        return -1
+    test.assertIs(node._parent, parent)
+    left = avl_height(test, node._left, node)
+    right = avl_height(test, node._right, node)
+    test.assertEqual(node._height, max(left, right) + 1)
+    test.assertLessEqual(abs(left - right), 1)
+    return node._height
+
+
+def black_height(test, node, parent=None):
+    """
+    Asserts parent links, that no red node has a red child and that every
+    path has the same number of black nodes in the subtree at node, and
+    returns that number.
+    """
+    if node is None:
+        return 1
+    test.assertIs(node._parent, parent)
+    if node._color == NodeColor.RED:
+        for child in (node._left, node._right):
+            test.assertFalse(child and child._color == NodeColor.RED)
+    left = black_height(test, node._left, node)
+    test.assertEqual(left, black_height(test, node._right, node))
+    return left + (node._color == NodeColor.BLACK)